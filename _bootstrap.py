@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+스크립트 공통 부트스트랩
+프로젝트 루트 경로를 한 번만 계산하고 작업 디렉토리/import 경로를 설정
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 (모듈 로드 시 한 번만 계산)
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# 자주 누락되는 패키지 (requirements.txt와 같은 버전)
+QUICK_FIX_PACKAGES = ("greenlet==3.0.3", "pydantic-settings==2.7.0")
+
+
+def bootstrap(chdir: bool = True) -> Path:
+    """
+    프로젝트 루트 기준으로 스크립트 실행 환경 설정
+    
+    Args:
+        chdir: 작업 디렉토리를 프로젝트 루트로 이동할지 여부
+    
+    Returns:
+        Path: 프로젝트 루트 디렉토리
+    """
+    if chdir:
+        os.chdir(PROJECT_ROOT)
+    
+    # Python 경로에 프로젝트 루트 추가 (중복 추가 방지)
+    root = str(PROJECT_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    
+    return PROJECT_ROOT
+
+
+def pip_install(*packages: str) -> bool:
+    """
+    패키지를 하나의 pip 프로세스로 설치 (pip 시작/의존성 해석 비용을 한 번만 부담)
+    
+    Args:
+        packages: 설치할 패키지 지정자 목록
+    
+    Returns:
+        bool: 설치 성공 여부
+    """
+    try:
+        # 빌드된 wheel을 우선 사용 (소스 빌드 없이 pip 캐시의 wheel 재사용)
+        subprocess.run([
+            sys.executable, "-m", "pip", "install", "--prefer-binary", *packages
+        ], check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ 패키지 설치 실패: {e}")
+        return False
@@ -0,0 +1,62 @@
+# alembic/env.py
+"""
+실시간 투표 플랫폼 Alembic 마이그레이션 실행 환경
+애플리케이션 설정의 DATABASE_URL과 모델 메타데이터 사용
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.core.config import settings
+from app.database.base import Base
+from app import models  # noqa: F401  모든 모델을 메타데이터에 등록
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """DB 연결 없이 SQL 스크립트 출력 (alembic upgrade --sql)"""
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch="sqlite" in settings.database_url,
+    )
+    
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """DB에 연결하여 마이그레이션 실행"""
+    # 애플리케이션 엔진과 달리 PRAGMA foreign_keys=ON 리스너가 없는 전용 엔진 사용
+    connectable = create_engine(settings.database_url, poolclass=pool.NullPool)
+    
+    with connectable.connect() as connection:
+        is_sqlite = connection.dialect.name == "sqlite"
+        if is_sqlite:
+            # SQLite는 테이블 재생성(DROP TABLE) 시 ON DELETE CASCADE가 자식 행을 지우지 않도록 외래 키 검사 해제
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+        
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=is_sqlite,
+        )
+        
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
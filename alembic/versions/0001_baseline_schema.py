@@ -0,0 +1,107 @@
+"""baseline schema
+
+최초 배포 버전의 스키마 (Alembic 도입 이전에 create_all로 생성된 DB와 동일)
+이미 테이블이 있는 기존 DB에서는 아무것도 하지 않으므로
+`alembic upgrade head` 한 번으로 기존 DB와 빈 DB 모두 최신 스키마로 올라감
+
+Revision ID: 0001_baseline_schema
+Revises:
+Create Date: 2025-01-16 15:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+    
+    if "users" not in existing_tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("nickname", sa.String(20), nullable=False),
+            sa.Column("is_online", sa.Boolean(), nullable=False),
+            sa.Column("joined_at", sa.DateTime(), nullable=False),
+            sa.Column("last_seen", sa.DateTime(), nullable=False),
+            sa.Column("avatar_url", sa.String(255), nullable=True),
+            sa.Column("bio", sa.Text(), nullable=True),
+            sa.PrimaryKeyConstraint("id", name="pk_users"),
+        )
+        op.create_index("ix_users_nickname", "users", ["nickname"])
+    
+    if "polls" not in existing_tables:
+        op.create_table(
+            "polls",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("title", sa.String(100), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("ends_at", sa.DateTime(), nullable=True),
+            sa.Column("created_by", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_polls"),
+            sa.ForeignKeyConstraint(["created_by"], ["users.id"], name="fk_polls_created_by_users"),
+        )
+    
+    if "chat_messages" not in existing_tables:
+        op.create_table(
+            "chat_messages",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("message", sa.Text(), nullable=False),
+            sa.Column("message_type", sa.String(12), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=True),
+            sa.Column("message_metadata", sa.Text(), nullable=True),
+            sa.PrimaryKeyConstraint("id", name="pk_chat_messages"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_chat_messages_user_id_users"),
+        )
+    
+    if "poll_options" not in existing_tables:
+        op.create_table(
+            "poll_options",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("poll_id", sa.String(), nullable=False),
+            sa.Column("text", sa.String(100), nullable=False),
+            sa.Column("vote_count", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_poll_options"),
+            sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], name="fk_poll_options_poll_id_polls"),
+        )
+    
+    if "user_memos" not in existing_tables:
+        op.create_table(
+            "user_memos",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.Column("poll_id", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_user_memos"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_user_memos_user_id_users"),
+            sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], name="fk_user_memos_poll_id_polls"),
+        )
+    
+    if "votes" not in existing_tables:
+        op.create_table(
+            "votes",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("poll_id", sa.String(), nullable=False),
+            sa.Column("option_id", sa.String(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name="pk_votes"),
+            sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], name="fk_votes_poll_id_polls"),
+            sa.ForeignKeyConstraint(["option_id"], ["poll_options.id"], name="fk_votes_option_id_poll_options"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_votes_user_id_users"),
+        )
+
+
+def downgrade():
+    for table_name in ("votes", "user_memos", "poll_options", "chat_messages", "polls", "users"):
+        op.drop_table(table_name)
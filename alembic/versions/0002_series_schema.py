@@ -0,0 +1,177 @@
+"""db-side timestamps, integer vote ids, computed vote counts, memo stats, indexes
+
+- 생성/수정 시각을 DB 기본값으로 기록 (INSERT에서 컬럼 생략)
+- votes: 정수 기본 키 + 외부 노출용 public_id (기존 문자열 ID를 public_id로 보존),
+  (poll_id, user_id) UNIQUE, 중복 투표는 가장 먼저 기록된 것만 유지
+- poll_options.vote_count 제거 (votes에서 조회 시점에 집계)
+- user_memos 파생 컬럼(content_preview, word_count, character_count) 추가
+  (기존 메모 값은 `python manage.py backfill`로 채움)
+- users.nickname UNIQUE, 자식 테이블 외래 키 ON DELETE CASCADE, 조회용 복합 인덱스
+
+Revision ID: 0002_series_schema
+Revises: 0001_baseline_schema
+Create Date: 2025-01-16 15:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.base import utcnow
+
+revision = "0002_series_schema"
+down_revision = "0001_baseline_schema"
+branch_labels = None
+depends_on = None
+
+
+def _timestamp_default(batch_op, column_name: str, server_default):
+    """NOT NULL 시각 컬럼의 DB 기본값 변경"""
+    batch_op.alter_column(
+        column_name,
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=server_default
+    )
+
+
+def _replace_foreign_key(batch_op, name: str, referent: str, column: str, ondelete=None):
+    """외래 키를 같은 이름으로 다시 생성 (ON DELETE 동작 변경)"""
+    batch_op.drop_constraint(name, type_="foreignkey")
+    batch_op.create_foreign_key(name, referent, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade():
+    # create_all로 이미 현재 스키마가 만들어진 DB는 건너뜀
+    vote_columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("votes")}
+    if "public_id" in vote_columns:
+        return
+    
+    with op.batch_alter_table("users", recreate="always") as batch_op:
+        _timestamp_default(batch_op, "joined_at", utcnow())
+        _timestamp_default(batch_op, "last_seen", utcnow())
+        batch_op.drop_index("ix_users_nickname")
+        batch_op.create_index("ix_users_nickname", ["nickname"], unique=True)
+    
+    with op.batch_alter_table("polls", recreate="always") as batch_op:
+        _timestamp_default(batch_op, "created_at", utcnow())
+        batch_op.create_index("ix_polls_created_at_id", ["created_at", "id"])
+        batch_op.create_index("ix_polls_created_by_created_at_id", ["created_by", "created_at", "id"])
+    
+    with op.batch_alter_table("poll_options", recreate="always") as batch_op:
+        batch_op.drop_column("vote_count")
+        _replace_foreign_key(batch_op, "fk_poll_options_poll_id_polls", "polls", "poll_id", "CASCADE")
+    
+    with op.batch_alter_table("chat_messages", recreate="always") as batch_op:
+        _timestamp_default(batch_op, "created_at", utcnow())
+        _replace_foreign_key(batch_op, "fk_chat_messages_user_id_users", "users", "user_id", "CASCADE")
+        batch_op.create_index("ix_chat_messages_created_at_id", ["created_at", "id"])
+        batch_op.create_index("ix_chat_messages_message_type_created_at_id", ["message_type", "created_at", "id"])
+        batch_op.create_index("ix_chat_messages_user_id_created_at", ["user_id", "created_at"])
+    
+    with op.batch_alter_table("user_memos", recreate="always") as batch_op:
+        batch_op.add_column(sa.Column("content_preview", sa.String(50), nullable=False, server_default=""))
+        batch_op.add_column(sa.Column("word_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("character_count", sa.Integer(), nullable=False, server_default="0"))
+        _timestamp_default(batch_op, "created_at", utcnow())
+        _timestamp_default(batch_op, "updated_at", utcnow())
+        _replace_foreign_key(batch_op, "fk_user_memos_user_id_users", "users", "user_id", "CASCADE")
+        _replace_foreign_key(batch_op, "fk_user_memos_poll_id_polls", "polls", "poll_id", "CASCADE")
+        batch_op.create_index("ix_user_memos_user_id_updated_at_id", ["user_id", "updated_at", "id"])
+        batch_op.create_index("ix_user_memos_user_id_created_at", ["user_id", "created_at"])
+        batch_op.create_index("ix_user_memos_user_id_poll_id_updated_at_id", ["user_id", "poll_id", "updated_at", "id"])
+    
+    # votes는 기본 키 타입이 바뀌므로 새 테이블로 복사 (기존 문자열 ID는 public_id로 보존)
+    op.create_table(
+        "votes_new",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("public_id", sa.String(36), nullable=False),
+        sa.Column("poll_id", sa.String(36), nullable=False),
+        sa.Column("option_id", sa.String(36), nullable=False),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=utcnow(), nullable=False),
+        sa.UniqueConstraint("poll_id", "user_id", name="uq_votes_poll_id"),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], name="fk_votes_poll_id_polls", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["option_id"], ["poll_options.id"], name="fk_votes_option_id_poll_options", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_votes_user_id_users", ondelete="CASCADE"),
+        sqlite_autoincrement=True,
+    )
+    # 같은 사용자의 중복 투표는 가장 먼저 기록된 것만 유지, 정수 ID는 기록 순서대로 부여
+    op.execute("""
+        INSERT INTO votes_new (public_id, poll_id, option_id, user_id, created_at)
+        SELECT v.id, v.poll_id, v.option_id, v.user_id, v.created_at
+        FROM votes v
+        WHERE NOT EXISTS (
+            SELECT 1 FROM votes w
+            WHERE w.poll_id = v.poll_id AND w.user_id = v.user_id
+              AND (w.created_at < v.created_at OR (w.created_at = v.created_at AND w.id < v.id))
+        )
+        ORDER BY v.created_at, v.id
+    """)
+    op.drop_table("votes")
+    op.rename_table("votes_new", "votes")
+    op.create_index("ix_votes_public_id", "votes", ["public_id"], unique=True)
+    op.create_index("ix_votes_created_at_poll_id", "votes", ["created_at", "poll_id"])
+    op.create_index("ix_votes_user_id_created_at_id", "votes", ["user_id", "created_at", "id"])
+    op.create_index("ix_votes_poll_id_option_id", "votes", ["poll_id", "option_id"])
+
+
+def downgrade():
+    # votes: public_id를 다시 문자열 기본 키로 사용
+    op.create_table(
+        "votes_old",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("poll_id", sa.String(), nullable=False),
+        sa.Column("option_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], name="fk_votes_poll_id_polls"),
+        sa.ForeignKeyConstraint(["option_id"], ["poll_options.id"], name="fk_votes_option_id_poll_options"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_votes_user_id_users"),
+    )
+    op.execute("""
+        INSERT INTO votes_old (id, poll_id, option_id, user_id, created_at)
+        SELECT public_id, poll_id, option_id, user_id, created_at FROM votes
+    """)
+    op.drop_table("votes")
+    op.rename_table("votes_old", "votes")
+    
+    with op.batch_alter_table("user_memos", recreate="always") as batch_op:
+        batch_op.drop_index("ix_user_memos_user_id_poll_id_updated_at_id")
+        batch_op.drop_index("ix_user_memos_user_id_created_at")
+        batch_op.drop_index("ix_user_memos_user_id_updated_at_id")
+        _replace_foreign_key(batch_op, "fk_user_memos_poll_id_polls", "polls", "poll_id")
+        _replace_foreign_key(batch_op, "fk_user_memos_user_id_users", "users", "user_id")
+        _timestamp_default(batch_op, "updated_at", None)
+        _timestamp_default(batch_op, "created_at", None)
+        batch_op.drop_column("character_count")
+        batch_op.drop_column("word_count")
+        batch_op.drop_column("content_preview")
+    
+    with op.batch_alter_table("chat_messages", recreate="always") as batch_op:
+        batch_op.drop_index("ix_chat_messages_user_id_created_at")
+        batch_op.drop_index("ix_chat_messages_message_type_created_at_id")
+        batch_op.drop_index("ix_chat_messages_created_at_id")
+        _replace_foreign_key(batch_op, "fk_chat_messages_user_id_users", "users", "user_id")
+        _timestamp_default(batch_op, "created_at", None)
+    
+    # poll_options: 저장형 득표수 복원 후 votes에서 다시 집계
+    with op.batch_alter_table("poll_options", recreate="always") as batch_op:
+        batch_op.add_column(sa.Column("vote_count", sa.Integer(), nullable=False, server_default="0"))
+        _replace_foreign_key(batch_op, "fk_poll_options_poll_id_polls", "polls", "poll_id")
+    op.execute("""
+        UPDATE poll_options SET vote_count = (
+            SELECT COUNT(*) FROM votes WHERE votes.option_id = poll_options.id
+        )
+    """)
+    
+    with op.batch_alter_table("polls", recreate="always") as batch_op:
+        batch_op.drop_index("ix_polls_created_by_created_at_id")
+        batch_op.drop_index("ix_polls_created_at_id")
+        _timestamp_default(batch_op, "created_at", None)
+    
+    with op.batch_alter_table("users", recreate="always") as batch_op:
+        batch_op.drop_index("ix_users_nickname")
+        batch_op.create_index("ix_users_nickname", ["nickname"])
+        _timestamp_default(batch_op, "last_seen", None)
+        _timestamp_default(batch_op, "joined_at", None)
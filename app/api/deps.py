@@ -46,7 +46,7 @@ async def get_current_user(
     user_data = validate_token_or_raise(credentials.credentials)
     
     # 데이터베이스에서 사용자 조회
-    user = db.query(User).filter(User.id == user_data["user_id"]).first()
+    user = db.get(User, user_data["user_id"])
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,7 +93,7 @@ def get_poll_or_404(poll_id: str, db: Session = Depends(get_db)) -> Poll:
     Raises:
         HTTPException: 투표를 찾을 수 없는 경우
     """
-    poll = db.query(Poll).filter(Poll.id == poll_id).first()
+    poll = db.get(Poll, poll_id)
     if not poll:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
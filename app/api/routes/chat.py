@@ -6,6 +6,7 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func, and_
 
@@ -24,6 +25,7 @@ from ...schemas.chat import (
     ChatStatsResponse
 )
 from ...schemas.user import SuccessResponse
+from ...services.chat_service import ChatService
 from ...websocket.manager import websocket_manager
 
 router = APIRouter()
@@ -99,52 +101,54 @@ async def send_chat_message(
 @router.get("/messages", response_model=ChatMessageListResponse)
 async def get_chat_messages(
     pagination: PaginationParams = Depends(get_pagination_params),
+    cursor: Optional[str] = None,
     message_type: Optional[str] = None,
     current_user: User = Depends(get_optional_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    채팅 메시지 목록 조회
+    채팅 메시지 목록 조회 (최신순, 커서 페이지네이션)
     
     Args:
-        pagination: 페이지네이션 파라미터
+        pagination: 페이지네이션 파라미터 (per_page만 사용)
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
         message_type: 메시지 유형 필터 (선택적)
         current_user: 현재 사용자 (선택적)
         db: 데이터베이스 세션
     
     Returns:
-        ChatMessageListResponse: 채팅 메시지 목록
+        ChatMessageListResponse: 채팅 메시지 목록 및 다음 페이지 커서
     """
     try:
-        # 기본 쿼리 (최신순)
-        query = db.query(ChatMessage).order_by(desc(ChatMessage.created_at))
-        
-        # 메시지 유형 필터
+        # 메시지 유형 필터 (잘못된 메시지 유형은 무시)
+        msg_type = None
         if message_type:
             try:
                 msg_type = MessageType(message_type)
-                query = query.filter(ChatMessage.message_type == msg_type)
             except ValueError:
-                pass  # 잘못된 메시지 유형은 무시
-        
-        # 전체 개수
-        total = query.count()
+                pass
         
-        # 페이지네이션 적용
-        messages = query.offset(pagination.offset).limit(pagination.limit).all()
+        # (created_at, id) 키셋으로 읽기 전용 행 조회 (작성자 닉네임 포함, 전체 개수 조회 없음)
+        result = ChatService(db).get_messages_list(
+            per_page=pagination.limit,
+            message_type=msg_type,
+            cursor=cursor
+        )
         
-        # 응답 생성 (사용자 정보 포함)
-        message_responses = []
-        for message in messages:
-            message_responses.append(ChatMessageResponse.from_orm(message))
+        # 응답 생성 (응답 모델 재검증 없이 직렬화)
+        return ORJSONResponse(content={
+            "messages": [ChatMessage.mapping_to_dict(message) for message in result["messages"]],
+            "total": result["total"],
+            "per_page": result["per_page"],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"]
+        })
         
-        return ChatMessageListResponse(
-            messages=message_responses,
-            total=total,
-            page=pagination.page,
-            per_page=pagination.per_page
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -173,16 +177,13 @@ async def get_recent_chat_messages(
         # 제한 설정 (최대 100개)
         limit = min(max(1, limit), 100)
         
-        # 최근 메시지 조회
-        messages = db.query(ChatMessage)\
-                    .order_by(desc(ChatMessage.created_at))\
-                    .limit(limit)\
-                    .all()
+        # 최근 메시지 조회 (읽기 전용 행 매핑, 작성자 닉네임 포함)
+        messages = ChatService(db).get_recent_messages(limit)
         
         # 시간순으로 다시 정렬 (오래된 것부터)
-        messages.reverse()
-        
-        return [ChatMessageResponse.from_orm(message) for message in messages]
+        return ORJSONResponse(content=[
+            ChatMessage.mapping_to_dict(message) for message in reversed(messages)
+        ])
         
     except Exception as e:
         raise HTTPException(
@@ -255,7 +256,7 @@ async def get_chat_message_detail(
         ChatMessageResponse: 메시지 상세 정보
     """
     try:
-        message = db.query(ChatMessage).filter(ChatMessage.id == message_id).first()
+        message = db.get(ChatMessage, message_id)
         
         if not message:
             raise HTTPException(
@@ -292,7 +293,7 @@ async def delete_chat_message(
         SuccessResponse: 삭제 성공 응답
     """
     try:
-        message = db.query(ChatMessage).filter(ChatMessage.id == message_id).first()
+        message = db.get(ChatMessage, message_id)
         
         if not message:
             raise HTTPException(
@@ -307,8 +308,7 @@ async def delete_chat_message(
                 detail="본인이 작성한 메시지만 삭제할 수 있습니다"
             )
         
-        db.delete(message)
-        db.commit()
+        ChatService(db).delete_message_by_id(message_id)
         
         return SuccessResponse(
             success=True,
@@ -341,58 +341,8 @@ async def get_chat_stats(
         ChatStatsResponse: 채팅 통계 정보
     """
     try:
-        from datetime import datetime, timedelta
-        
-        # 전체 메시지 수
-        total_messages = db.query(ChatMessage).count()
-        
-        # 활성 사용자 수 (최근 24시간 내 메시지 작성자)
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        active_users = db.query(ChatMessage.user_id)\
-                        .filter(ChatMessage.created_at >= yesterday)\
-                        .filter(ChatMessage.user_id.isnot(None))\
-                        .distinct().count()
-        
-        # 오늘 메시지 수
-        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        messages_today = db.query(ChatMessage)\
-                          .filter(ChatMessage.created_at >= today)\
-                          .count()
-        
-        # 가장 활발한 사용자 찾기
-        most_active_user = None
-        user_message_count = db.query(
-            ChatMessage.user_id,
-            func.count(ChatMessage.id).label('message_count')
-        ).filter(ChatMessage.user_id.isnot(None))\
-         .group_by(ChatMessage.user_id)\
-         .order_by(desc('message_count'))\
-         .first()
-        
-        if user_message_count:
-            user = db.query(User).filter(User.id == user_message_count.user_id).first()
-            if user:
-                most_active_user = {
-                    "user_id": user.id,
-                    "nickname": user.nickname,
-                    "message_count": user_message_count.message_count
-                }
-        
-        # 메시지 유형별 개수
-        message_types_count = {}
-        for message_type in MessageType:
-            count = db.query(ChatMessage)\
-                     .filter(ChatMessage.message_type == message_type)\
-                     .count()
-            message_types_count[message_type.value] = count
-        
-        return ChatStatsResponse(
-            total_messages=total_messages,
-            active_users=active_users,
-            messages_today=messages_today,
-            most_active_user=most_active_user,
-            message_types_count=message_types_count
-        )
+        # 집계 기준 시각 계산과 유형별 개수는 서비스의 단일 집계 쿼리에서 처리
+        return ChatStatsResponse(**ChatService(db).get_chat_stats())
         
     except Exception as e:
         raise HTTPException(
@@ -419,44 +369,35 @@ async def get_chat_history(
         ChatMessageListResponse: 필터링된 채팅 기록
     """
     try:
-        query = db.query(ChatMessage)
-        
-        # before_id 필터 (특정 메시지 이전)
-        if history_request.before_id:
-            before_message = db.query(ChatMessage)\
-                              .filter(ChatMessage.id == history_request.before_id)\
-                              .first()
-            if before_message:
-                query = query.filter(ChatMessage.created_at < before_message.created_at)
-        
-        # 메시지 유형 필터
-        if history_request.message_types:
-            valid_types = []
-            for msg_type in history_request.message_types:
-                try:
-                    valid_types.append(MessageType(msg_type))
-                except ValueError:
-                    pass
-            
-            if valid_types:
-                query = query.filter(ChatMessage.message_type.in_(valid_types))
-        
-        # 최신순 정렬
-        query = query.order_by(desc(ChatMessage.created_at))
-        
-        # 전체 개수
-        total = query.count()
+        # 메시지 유형 필터 (잘못된 유형은 무시)
+        valid_types = []
+        for msg_type in history_request.message_types or []:
+            try:
+                valid_types.append(MessageType(msg_type))
+            except ValueError:
+                pass
+        
+        # (created_at, id) 키셋으로 읽기 전용 행 조회 (전체 개수는 요청한 경우에만 계산)
+        history = ChatService(db).get_message_history(
+            cursor=history_request.cursor,
+            message_types=valid_types,
+            limit=history_request.limit,
+            include_total=history_request.include_total
+        )
         
-        # 제한 적용
-        messages = query.limit(history_request.limit).all()
+        return ORJSONResponse(content={
+            "messages": [ChatMessage.mapping_to_dict(message) for message in history["messages"]],
+            "total": history["total"],
+            "per_page": history_request.limit,
+            "next_cursor": history["next_cursor"],
+            "has_more": history["next_cursor"] is not None
+        })
         
-        return ChatMessageListResponse(
-            messages=[ChatMessageResponse.from_orm(msg) for msg in messages],
-            total=total,
-            page=1,
-            per_page=history_request.limit
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
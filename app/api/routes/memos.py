@@ -4,11 +4,15 @@
 사용자 메모 생성, 조회, 수정, 삭제 엔드포인트
 """
 
-from typing import List, Optional
+from typing import List, Optional, Iterator
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func, and_, or_
 
+from ...database.base import SessionLocal
 from ...database.session import get_db
 from ...api.deps import (
     get_current_user, get_optional_current_user, get_pagination_params, 
@@ -31,6 +35,8 @@ from ...schemas.memo import (
     MemoUpdateResponse,
     MemoDeleteResponse
 )
+from ...services.memo_service import MemoService
+from ...utils.constants import MediaType
 
 router = APIRouter()
 
@@ -55,24 +61,20 @@ async def create_memo(
     try:
         # 투표 ID가 제공된 경우 투표 존재 확인
         if memo_data.poll_id:
-            poll = db.query(Poll).filter(Poll.id == memo_data.poll_id).first()
+            poll = db.get(Poll, memo_data.poll_id)
             if not poll:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="해당 투표를 찾을 수 없습니다"
                 )
         
-        # 새 메모 생성
-        new_memo = UserMemo.create_memo(
+        # 새 메모 생성 (커밋 후 메모 통계 캐시 삭제는 서비스에서 처리)
+        new_memo = MemoService(db).create_memo(
             user_id=current_user.id,
             content=memo_data.content,
             poll_id=memo_data.poll_id
         )
         
-        db.add(new_memo)
-        db.commit()
-        db.refresh(new_memo)
-        
         # 응답 생성
         memo_response = MemoResponse(
             id=new_memo.id,
@@ -103,78 +105,66 @@ async def create_memo(
 async def get_user_memos(
     pagination: PaginationParams = Depends(get_pagination_params),
     sort: SortParams = Depends(get_sort_params),
+    cursor: Optional[str] = None,
     poll_id: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    사용자 메모 목록 조회
+    사용자 메모 목록 조회 (시각 기준 정렬은 커서 페이지네이션)
     
     Args:
-        pagination: 페이지네이션 파라미터
+        pagination: 페이지네이션 파라미터 (page는 시각 외 정렬 기준일 때만 사용)
         sort: 정렬 파라미터
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
         poll_id: 특정 투표의 메모만 조회 (선택적)
         current_user: 현재 인증된 사용자
         db: 데이터베이스 세션
     
     Returns:
-        MemoListResponse: 메모 목록
+        MemoListResponse: 메모 목록 (개수는 첫 페이지에서만 포함)
     """
     try:
-        # 기본 쿼리 (현재 사용자의 메모만)
-        query = db.query(UserMemo).filter(UserMemo.user_id == current_user.id)
-        
-        # 투표별 필터
-        if poll_id:
-            query = query.filter(UserMemo.poll_id == poll_id)
-        
-        # 전체 개수
-        total = query.count()
-        
-        # 투표 관련 메모 개수
-        poll_related_count = db.query(UserMemo)\
-                              .filter(UserMemo.user_id == current_user.id)\
-                              .filter(UserMemo.poll_id.isnot(None))\
-                              .count()
-        
-        # 일반 메모 개수
-        general_count = total - poll_related_count
-        
-        # 정렬 적용
-        order_by = sort.get_order_by(UserMemo)
-        if order_by is not None:
-            query = query.order_by(order_by)
-        else:
-            query = query.order_by(desc(UserMemo.updated_at))
-        
-        # 페이지네이션 적용
-        memos = query.offset(pagination.offset).limit(pagination.limit).all()
-        
-        # 응답 생성
-        memo_responses = []
-        for memo in memos:
-            memo_responses.append(MemoResponse(
-                id=memo.id,
-                content=memo.content,
-                user_id=memo.user_id,
-                poll_id=memo.poll_id,
-                created_at=memo.created_at,
-                updated_at=memo.updated_at,
-                content_preview=memo.content_preview,
-                word_count=memo.word_count,
-                character_count=memo.character_count,
-                is_recent=memo.is_recent
-            ))
-        
-        return MemoListResponse(
-            memos=memo_responses,
-            total=total,
+        # 키셋 페이지 조회, 개수는 첫 페이지에서 조건부 집계 한 번으로 계산
+        result = MemoService(db).get_user_memos(
+            current_user.id,
             page=pagination.page,
-            per_page=pagination.per_page,
-            poll_related_count=poll_related_count,
-            general_count=general_count
+            per_page=pagination.limit,
+            poll_id=poll_id,
+            sort_by=sort.sort_by,
+            sort_order=sort.sort_order,
+            cursor=cursor,
+            include_total=cursor is None
         )
         
+        # 응답 생성 (응답 모델 재검증 없이 직렬화)
+        memo_responses = []
+        for memo in result["memos"]:
+            memo_data = memo.to_dict()
+            memo_data.update({
+                "content_preview": memo.content_preview,
+                "word_count": memo.word_count,
+                "character_count": memo.character_count,
+                "is_recent": memo.is_recent
+            })
+            memo_responses.append(memo_data)
+        
+        return ORJSONResponse(content={
+            "memos": memo_responses,
+            "total": result["total"],
+            "page": pagination.page,
+            "per_page": pagination.per_page,
+            "poll_related_count": result["poll_related_count"],
+            "general_count": result["general_count"],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"]
+        })
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -200,10 +190,7 @@ async def get_memo_detail(
         MemoDetailResponse: 메모 상세 정보
     """
     try:
-        memo = db.query(UserMemo).filter(
-            UserMemo.id == memo_id,
-            UserMemo.user_id == current_user.id
-        ).first()
+        memo = MemoService(db).get_memo_by_id(memo_id, current_user.id)
         
         if not memo:
             raise HTTPException(
@@ -268,10 +255,8 @@ async def update_memo(
         MemoUpdateResponse: 수정된 메모 정보
     """
     try:
-        memo = db.query(UserMemo).filter(
-            UserMemo.id == memo_id,
-            UserMemo.user_id == current_user.id
-        ).first()
+        memo_service = MemoService(db)
+        memo = memo_service.get_memo_by_id(memo_id, current_user.id)
         
         if not memo:
             raise HTTPException(
@@ -279,11 +264,8 @@ async def update_memo(
                 detail="메모를 찾을 수 없습니다"
             )
         
-        # 메모 내용 업데이트
-        memo.update_content(update_data.content)
-        
-        db.commit()
-        db.refresh(memo)
+        # 메모 내용 업데이트 (커밋 후 메모 통계 캐시 삭제는 서비스에서 처리)
+        memo = memo_service.update_memo(memo, update_data.content)
         
         # 응답 생성
         memo_response = MemoResponse(
@@ -329,21 +311,13 @@ async def delete_memo(
         MemoDeleteResponse: 삭제 성공 응답
     """
     try:
-        memo = db.query(UserMemo).filter(
-            UserMemo.id == memo_id,
-            UserMemo.user_id == current_user.id
-        ).first()
-        
-        if not memo:
+        # 메모 삭제 (소유권 조건 포함, 사전 조회 없음)
+        if not MemoService(db).delete_memo_by_id(memo_id, current_user.id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="메모를 찾을 수 없습니다"
             )
         
-        # 메모 삭제
-        db.delete(memo)
-        db.commit()
-        
         return MemoDeleteResponse(deleted_memo_id=memo_id)
         
     except HTTPException:
@@ -374,30 +348,19 @@ async def search_memos(
         MemoSearchResponse: 검색 결과
     """
     try:
-        # 기본 쿼리 (현재 사용자의 메모만)
-        query = db.query(UserMemo).filter(UserMemo.user_id == current_user.id)
-        
-        # 검색어 필터 (내용에서 검색)
-        if search_request.query:
-            query = query.filter(UserMemo.content.contains(search_request.query))
-        
-        # 투표별 필터
-        if search_request.poll_id:
-            query = query.filter(UserMemo.poll_id == search_request.poll_id)
-        
-        # 전체 개수
-        total = query.count()
-        
-        # 최신순 정렬
-        query = query.order_by(desc(UserMemo.updated_at))
-        
-        # 페이지네이션 적용
-        offset = (search_request.page - 1) * search_request.per_page
-        memos = query.offset(offset).limit(search_request.per_page).all()
+        # 최근 수정순 키셋 조회 (전체 결과 수는 첫 페이지에서만 계산)
+        result = MemoService(db).search_memos(
+            current_user.id,
+            search_request.query,
+            per_page=search_request.per_page,
+            poll_id=search_request.poll_id,
+            cursor=search_request.cursor,
+            include_total=search_request.cursor is None
+        )
         
         # 응답 생성
         memo_responses = []
-        for memo in memos:
+        for memo in result["results"]:
             memo_responses.append(MemoResponse(
                 id=memo.id,
                 content=memo.content,
@@ -413,12 +376,19 @@ async def search_memos(
         
         return MemoSearchResponse(
             results=memo_responses,
-            total=total,
+            total=result["total"],
             query=search_request.query,
             page=search_request.page,
-            per_page=search_request.per_page
+            per_page=search_request.per_page,
+            next_cursor=result["next_cursor"],
+            has_more=result["has_more"]
         )
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -442,60 +412,8 @@ async def get_memo_stats(
         MemoStatsResponse: 메모 통계 정보
     """
     try:
-        from datetime import datetime, timedelta
-        
-        # 전체 메모 수
-        total_memos = db.query(UserMemo)\
-                       .filter(UserMemo.user_id == current_user.id)\
-                       .count()
-        
-        # 투표 관련 메모 수
-        poll_related_memos = db.query(UserMemo)\
-                              .filter(UserMemo.user_id == current_user.id)\
-                              .filter(UserMemo.poll_id.isnot(None))\
-                              .count()
-        
-        # 일반 메모 수
-        general_memos = total_memos - poll_related_memos
-        
-        # 총 단어 수 (대략적 계산)
-        memos = db.query(UserMemo)\
-                  .filter(UserMemo.user_id == current_user.id)\
-                  .all()
-        
-        total_words = sum(memo.word_count for memo in memos)
-        total_characters = sum(memo.character_count for memo in memos)
-        
-        # 가장 활발한 날 찾기 (최근 30일 내)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        daily_counts = db.query(
-            func.date(UserMemo.created_at).label('date'),
-            func.count(UserMemo.id).label('count')
-        ).filter(
-            UserMemo.user_id == current_user.id,
-            UserMemo.created_at >= thirty_days_ago
-        ).group_by(func.date(UserMemo.created_at))\
-         .order_by(desc('count'))\
-         .first()
-        
-        most_active_day = daily_counts.date.strftime('%Y-%m-%d') if daily_counts else None
-        
-        # 최근 24시간 내 메모 수
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_memos_count = db.query(UserMemo)\
-                              .filter(UserMemo.user_id == current_user.id)\
-                              .filter(UserMemo.created_at >= yesterday)\
-                              .count()
-        
-        return MemoStatsResponse(
-            total_memos=total_memos,
-            poll_related_memos=poll_related_memos,
-            general_memos=general_memos,
-            total_words=total_words,
-            total_characters=total_characters,
-            most_active_day=most_active_day,
-            recent_memos_count=recent_memos_count
-        )
+        # 기준 시각은 한 번만 계산해 단일 집계 쿼리에 바인딩 (서비스에서 처리)
+        return MemoStatsResponse(**MemoService(db).get_memo_stats(current_user.id))
         
     except Exception as e:
         raise HTTPException(
@@ -523,37 +441,21 @@ async def get_poll_memos(
     """
     try:
         # 투표 존재 확인
-        poll = db.query(Poll).filter(Poll.id == poll_id).first()
+        poll = db.get(Poll, poll_id)
         if not poll:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="투표를 찾을 수 없습니다"
             )
         
-        # 해당 투표의 사용자 메모 조회
-        memos = db.query(UserMemo)\
-                  .filter(UserMemo.user_id == current_user.id)\
-                  .filter(UserMemo.poll_id == poll_id)\
-                  .order_by(desc(UserMemo.updated_at))\
-                  .all()
+        # 해당 투표의 사용자 메모 조회 (읽기 전용 행 매핑)
+        memos = MemoService(db).get_poll_memos(current_user.id, poll_id)
         
         # 응답 생성
-        memo_responses = []
-        for memo in memos:
-            memo_responses.append(MemoResponse(
-                id=memo.id,
-                content=memo.content,
-                user_id=memo.user_id,
-                poll_id=memo.poll_id,
-                created_at=memo.created_at,
-                updated_at=memo.updated_at,
-                content_preview=memo.content_preview,
-                word_count=memo.word_count,
-                character_count=memo.character_count,
-                is_recent=memo.is_recent
-            ))
-        
-        return memo_responses
+        return [
+            MemoResponse(**memo, is_recent=UserMemo.is_recent_timestamp(memo["updated_at"]))
+            for memo in memos
+        ]
         
     except HTTPException:
         raise
@@ -585,33 +487,47 @@ async def get_recent_memos(
         # 제한 설정 (최대 50개)
         limit = min(max(1, limit), 50)
         
-        # 최근 메모 조회
-        memos = db.query(UserMemo)\
-                  .filter(UserMemo.user_id == current_user.id)\
-                  .order_by(desc(UserMemo.updated_at))\
-                  .limit(limit)\
-                  .all()
+        # 최근 메모 조회 (읽기 전용 행 매핑)
+        memos = MemoService(db).get_recent_memos(current_user.id, limit)
         
         # 응답 생성
-        memo_responses = []
-        for memo in memos:
-            memo_responses.append(MemoResponse(
-                id=memo.id,
-                content=memo.content,
-                user_id=memo.user_id,
-                poll_id=memo.poll_id,
-                created_at=memo.created_at,
-                updated_at=memo.updated_at,
-                content_preview=memo.content_preview,
-                word_count=memo.word_count,
-                character_count=memo.character_count,
-                is_recent=memo.is_recent
-            ))
-        
-        return memo_responses
+        return [
+            MemoResponse(**memo, is_recent=UserMemo.is_recent_timestamp(memo["updated_at"]))
+            for memo in memos
+        ]
         
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="최근 메모 조회 중 오류가 발생했습니다"
         )
+
+
+def _stream_memo_export(user_id: str) -> Iterator[bytes]:
+    """메모 내보내기 NDJSON 스트림 (한 줄에 메모 하나)"""
+    # 요청 의존성 세션은 응답 전송 전에 닫히므로 스트림 전용 세션 사용
+    db = SessionLocal()
+    try:
+        for memo_data in MemoService(db).export_user_memos(user_id):
+            yield orjson.dumps(memo_data) + b"\n"
+    finally:
+        db.close()
+
+
+@router.get("/export/ndjson")
+async def export_memos(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    현재 사용자의 전체 메모 내보내기 (NDJSON 스트리밍)
+    
+    Args:
+        current_user: 현재 인증된 사용자
+    
+    Returns:
+        StreamingResponse: 메모 데이터 NDJSON 스트림
+    """
+    return StreamingResponse(
+        _stream_memo_export(current_user.id),
+        media_type=MediaType.NDJSON
+    )
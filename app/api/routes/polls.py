@@ -4,9 +4,11 @@
 투표 생성, 조회, 참여, 결과 확인 엔드포인트
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy import desc, func
 
 from ...database.session import get_db
@@ -15,7 +17,7 @@ from ...api.deps import (
     verify_poll_owner, verify_active_poll, get_pagination_params, PaginationParams
 )
 from ...models.user import User
-from ...models.poll import Poll, PollOption
+from ...models.poll import Poll
 from ...models.vote import Vote
 from ...models.message import ChatMessage
 from ...schemas.poll import (
@@ -23,46 +25,35 @@ from ...schemas.poll import (
     PollResponse,
     PollBasicInfo,
     PollListResponse,
+    UserPollListResponse,
     VoteRequest,
     VoteResponse,
     PollUpdateRequest,
     PollResultsResponse,
+    PollBulkResultsResponse,
     PollStatsResponse
 )
 from ...schemas.user import SuccessResponse
-from ...websocket.manager import websocket_manager
+from ...services.poll_service import PollService
+from ...services.stats_service import StatsService
+from ...utils.constants import MAX_BULK_RESULTS_POLLS, WSMessageType
+from ...websocket.manager import encode_message, websocket_manager
 
 router = APIRouter()
 
 
-async def broadcast_poll_created(poll: Poll, creator_nickname: str):
-    """새 투표 생성 브로드캐스트"""
+async def broadcast_poll_created(payload: str):
+    """새 투표 생성 브로드캐스트 (요청 처리 중 한 번 직렬화한 메시지 전송)"""
     try:
-        message = {
-            "type": "poll_created",
-            "data": {
-                "poll": poll.to_dict(),
-                "creator_nickname": creator_nickname
-            }
-        }
-        await websocket_manager.broadcast_message(message)
+        await websocket_manager.broadcast_text(payload)
     except Exception as e:
         print(f"투표 생성 브로드캐스트 실패: {e}")
 
 
-async def broadcast_vote_result(poll: Poll, voter_nickname: str):
-    """투표 결과 브로드캐스트"""
+async def broadcast_vote_result(payload: str):
+    """투표 결과 브로드캐스트 (요청 처리 중 한 번 직렬화한 메시지 전송)"""
     try:
-        message = {
-            "type": "vote_result",
-            "data": {
-                "poll_id": poll.id,
-                "results": poll.get_results(),
-                "total_votes": poll.total_votes,
-                "voter_nickname": voter_nickname
-            }
-        }
-        await websocket_manager.broadcast_message(message)
+        await websocket_manager.broadcast_text(payload)
     except Exception as e:
         print(f"투표 결과 브로드캐스트 실패: {e}")
 
@@ -87,31 +78,24 @@ async def create_poll(
         PollResponse: 생성된 투표 정보
     """
     try:
-        # 새 투표 생성
-        new_poll = Poll(
+        # 새 투표 및 옵션 생성 (옵션은 다중 행 INSERT 한 번, 커밋 한 번)
+        new_poll = PollService(db).create_poll(
             title=poll_data.title,
             description=poll_data.description,
-            created_by=current_user.id,
-            ends_at=poll_data.ends_at,
-            is_active=True
+            options=poll_data.options,
+            creator_id=current_user.id,
+            ends_at=poll_data.ends_at
         )
         
-        db.add(new_poll)
-        db.commit()
-        db.refresh(new_poll)
-        
-        # 투표 옵션 생성
-        for option_text in poll_data.options:
-            option = PollOption(
-                poll_id=new_poll.id,
-                text=option_text
-            )
-            db.add(option)
-        
-        db.commit()
-        
-        # 옵션들 다시 로드
-        db.refresh(new_poll)
+        # 응답과 브로드캐스트 메시지는 세션이 열려 있을 때 한 번에 구성
+        poll_response = PollResponse.from_orm(new_poll)
+        poll_created_payload = encode_message({
+            "type": WSMessageType.POLL_CREATED,
+            "data": {
+                "poll": new_poll.to_dict(),
+                "creator_nickname": current_user.nickname
+            }
+        })
         
         # 채팅 시스템 메시지 생성
         system_message = ChatMessage.create_poll_created_message(
@@ -122,13 +106,9 @@ async def create_poll(
         db.commit()
         
         # 백그라운드에서 WebSocket 브로드캐스트
-        background_tasks.add_task(
-            broadcast_poll_created,
-            new_poll,
-            current_user.nickname
-        )
+        background_tasks.add_task(broadcast_poll_created, poll_created_payload)
         
-        return PollResponse.from_orm(new_poll)
+        return poll_response
         
     except Exception as e:
         db.rollback()
@@ -141,72 +121,52 @@ async def create_poll(
 @router.get("/", response_model=PollListResponse)
 async def get_polls_list(
     pagination: PaginationParams = Depends(get_pagination_params),
+    cursor: Optional[str] = None,
     active_only: bool = False,
     current_user: User = Depends(get_optional_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    투표 목록 조회
+    투표 목록 조회 (최신순, 커서 페이지네이션)
     
     Args:
-        pagination: 페이지네이션 파라미터
+        pagination: 페이지네이션 파라미터 (per_page만 사용)
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
         active_only: 활성 투표만 조회할지 여부
         current_user: 현재 사용자 (선택적)
         db: 데이터베이스 세션
     
     Returns:
-        PollListResponse: 투표 목록
+        PollListResponse: 투표 목록 (전체/활성 개수는 첫 페이지에서만 포함)
     """
     try:
-        print(f"Getting polls list - pagination: offset={pagination.offset}, limit={pagination.limit}")
-        
-        # 기본 쿼리
-        query = db.query(Poll)
-        
-        # 활성 투표만 필터링
-        if active_only:
-            query = query.filter(Poll.is_active == True)
-        
-        # 전체 개수
-        total = query.count()
-        print(f"Total polls: {total}")
-        
-        # 활성 투표 개수
-        active_count = db.query(Poll).filter(Poll.is_active == True).count()
-        print(f"Active polls: {active_count}")
-        
-        # 최신순으로 정렬하여 조회
-        polls = query.order_by(desc(Poll.created_at))\
-                    .offset(pagination.offset)\
-                    .limit(pagination.limit)\
-                    .all()
+        print(f"Getting polls list - per_page={pagination.limit}, cursor={cursor}")
+        
+        # OFFSET 없이 (created_at, id) 키셋으로 조회, 개수는 첫 페이지의 윈도 함수로 함께 계산
+        result = PollService(db).get_polls_list(
+            per_page=pagination.limit,
+            active_only=active_only,
+            cursor=cursor,
+            include_total=cursor is None
+        )
+        polls = result["polls"]
         
         print(f"Retrieved {len(polls)} polls")
         
-        # 응답 생성 - 안전한 방식으로 처리
-        poll_responses = []
-        for i, poll in enumerate(polls):
-            try:
-                print(f"Processing poll {i+1}/{len(polls)}: {poll.id} - {poll.title}")
-                poll_response = PollResponse.from_orm(poll)
-                poll_responses.append(poll_response)
-                print(f"Successfully processed poll {poll.id}")
-            except Exception as poll_error:
-                print(f"Error processing poll {poll.id}: {poll_error}")
-                # 개별 투표 처리 실패 시 건너뛰기
-                continue
-        
-        print(f"Successfully created {len(poll_responses)} poll responses")
-        
-        response = PollListResponse(
-            polls=poll_responses,
-            total=total,
-            active_count=active_count
-        )
-        
-        print(f"Returning poll list response with {len(response.polls)} polls")
-        return response
+        # 응답 생성 (서버에서 만든 데이터이므로 응답 모델 재검증 없이 직렬화)
+        return ORJSONResponse(content={
+            "polls": [poll.to_dict() for poll in polls],
+            "total": result["total"],
+            "active_count": result["active_count"],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"]
+        })
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         print(f"Error in get_polls_list: {e}")
         import traceback
@@ -221,6 +181,43 @@ async def get_polls_list(
         )
 
 
+@router.get("/results/bulk", response_model=PollBulkResultsResponse)
+async def get_bulk_poll_results(
+    poll_ids: List[str] = Query(..., description="결과를 조회할 투표 ID 목록"),
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 투표의 옵션별 결과 일괄 조회 (목록 화면에서 투표마다 결과를 요청하지 않도록)
+    
+    Args:
+        poll_ids: 투표 ID 목록 (최대 MAX_BULK_RESULTS_POLLS개, 중복 제거)
+        current_user: 현재 사용자 (선택적)
+        db: 데이터베이스 세션
+    
+    Returns:
+        PollBulkResultsResponse: 투표 ID별 옵션 결과 (없는 투표 ID는 제외)
+    """
+    poll_ids = list(dict.fromkeys(poll_ids))
+    if len(poll_ids) > MAX_BULK_RESULTS_POLLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MAX_BULK_RESULTS_POLLS}개 투표의 결과를 조회할 수 있습니다"
+        )
+    
+    try:
+        # 득표수 집계와 투표별 백분율을 한 번의 쿼리로 계산
+        return ORJSONResponse(content={
+            "results": StatsService(db).get_bulk_poll_results(poll_ids)
+        })
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="투표 결과 일괄 조회 중 오류가 발생했습니다"
+        )
+
+
 @router.get("/{poll_id}", response_model=PollResponse)
 async def get_poll_detail(
     poll: Poll = Depends(get_poll_or_404),
@@ -274,11 +271,9 @@ async def vote_on_poll(
         poll = get_poll_or_404(poll_id, db)
         verify_active_poll(poll)
         
-        # 투표 옵션 검증
-        option = db.query(PollOption).filter(
-            PollOption.id == vote_data.option_id,
-            PollOption.poll_id == poll_id
-        ).first()
+        # 투표 옵션 검증 (이미 로드된 poll.options에서 확인, 별도 조회 없음)
+        options_by_id = {option.id: option for option in poll.options}
+        option = options_by_id.get(vote_data.option_id)
         
         if not option:
             raise HTTPException(
@@ -292,56 +287,50 @@ async def vote_on_poll(
             Vote.user_id == current_user.id
         ).first()
         
+        poll_service = PollService(db)
+        
         if existing_vote:
             # 기존 투표가 있으면 변경
-            old_option = db.query(PollOption).filter(
-                PollOption.id == existing_vote.option_id
-            ).first()
-            
-            if old_option:
-                old_option.decrement_vote()
-            
-            # 새 옵션으로 변경
-            existing_vote.option_id = vote_data.option_id
-            option.increment_vote()
-            
+            vote = poll_service.change_vote(existing_vote, vote_data.option_id)
             message = "투표가 변경되었습니다"
-            vote_id = existing_vote.id
         else:
             # 새 투표 생성
-            new_vote = Vote.create_vote(
-                poll_id=poll_id,
-                option_id=vote_data.option_id,
-                user_id=current_user.id
-            )
-            
-            db.add(new_vote)
-            option.increment_vote()
-            
+            vote = poll_service.record_vote(poll_id, vote_data.option_id, current_user.id)
             message = "투표가 완료되었습니다"
-            vote_id = new_vote.id
+        
+        # 커밋 후 만료되는 속성은 미리 읽어 두어 재조회(refresh)를 피함
+        vote_id = vote.public_id
+        poll_title = poll.title
+        option_text = option.text
+        voter_nickname = current_user.nickname
         
         db.commit()
         
-        # 투표 결과 갱신
-        db.refresh(poll)
-        poll_results = poll.get_results()
+        # 투표 결과 갱신 (옵션/득표수만 조회)
+        poll_results = poll_service.refresh_cached_results(poll_id)
+        
+        # 브로드캐스트 메시지는 결과 계산 직후 한 번만 직렬화
+        vote_result_payload = encode_message({
+            "type": WSMessageType.VOTE_RESULT,
+            "data": {
+                "poll_id": poll_id,
+                "results": poll_results,
+                "total_votes": sum(result["votes"] for result in poll_results),
+                "voter_nickname": voter_nickname
+            }
+        })
         
         # 채팅 시스템 메시지 생성
         vote_message = ChatMessage.create_vote_update_message(
-            poll_title=poll.title,
-            user_nickname=current_user.nickname,
-            option_text=option.text
+            poll_title=poll_title,
+            user_nickname=voter_nickname,
+            option_text=option_text
         )
         db.add(vote_message)
         db.commit()
         
         # 백그라운드에서 WebSocket 브로드캐스트
-        background_tasks.add_task(
-            broadcast_vote_result,
-            poll,
-            current_user.nickname
-        )
+        background_tasks.add_task(broadcast_vote_result, vote_result_payload)
         
         return VoteResponse(
             success=True,
@@ -352,6 +341,13 @@ async def vote_on_poll(
         
     except HTTPException:
         raise
+    except IntegrityError:
+        # 동시 요청으로 같은 사용자의 투표가 먼저 기록된 경우
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 참여한 투표입니다"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -378,17 +374,8 @@ async def get_poll_results(
         PollResultsResponse: 투표 결과
     """
     try:
-        results = poll.get_results()
-        
-        return PollResultsResponse(
-            poll_id=poll.id,
-            poll_title=poll.title,
-            total_votes=poll.total_votes,
-            results=results,
-            is_active=poll.is_active,
-            created_at=poll.created_at,
-            ends_at=poll.ends_at
-        )
+        # 옵션별 결과는 투표 시 갱신되는 캐시에서 조회
+        return PollResultsResponse(**PollService(db).get_poll_results(poll))
         
     except Exception as e:
         raise HTTPException(
@@ -470,8 +457,7 @@ async def delete_poll(
         verify_poll_owner(poll, current_user)
         
         # 투표 삭제 (cascade로 관련 데이터도 함께 삭제됨)
-        db.delete(poll)
-        db.commit()
+        PollService(db).delete_poll(poll)
         
         return SuccessResponse(
             success=True,
@@ -544,24 +530,17 @@ async def get_poll_stats(
         PollStatsResponse: 투표 통계 정보
     """
     try:
-        # 고유 투표자 수 계산
-        unique_voters = db.query(Vote.user_id).filter(Vote.poll_id == poll.id).distinct().count()
-        
-        # 가장 인기 있는 옵션 찾기
-        most_popular_option = None
-        if poll.options:
-            most_popular = max(poll.options, key=lambda opt: opt.vote_count)
-            if most_popular.vote_count > 0:
-                most_popular_option = most_popular.to_dict()
+        # 합계/고유 투표자/최다 득표 옵션을 단일 집계 쿼리로 조회
+        stats = PollService(db).get_poll_stats(poll)
         
         # 시간대별 투표 현황 (간단한 버전)
         voting_timeline = []
         
         return PollStatsResponse(
-            poll_id=poll.id,
-            total_votes=poll.total_votes,
-            unique_voters=unique_voters,
-            most_popular_option=most_popular_option,
+            poll_id=stats["poll_id"],
+            total_votes=stats["total_votes"],
+            unique_voters=stats["unique_voters"],
+            most_popular_option=stats["most_popular_option"],
             voting_timeline=voting_timeline
         )
         
@@ -572,46 +551,52 @@ async def get_poll_stats(
         )
 
 
-@router.get("/user/{user_id}", response_model=List[PollBasicInfo])
+@router.get("/user/{user_id}", response_model=UserPollListResponse)
 async def get_user_polls(
     user_id: str,
     pagination: PaginationParams = Depends(get_pagination_params),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_optional_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    특정 사용자가 생성한 투표 목록 조회
+    특정 사용자가 생성한 투표 목록 조회 (최신순, 커서 페이지네이션)
     
     Args:
         user_id: 사용자 ID
-        pagination: 페이지네이션 파라미터
+        pagination: 페이지네이션 파라미터 (per_page만 사용)
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
         current_user: 현재 사용자 (선택적)
         db: 데이터베이스 세션
     
     Returns:
-        List[PollBasicInfo]: 사용자 투표 목록
+        UserPollListResponse: 사용자 투표 목록 및 다음 페이지 커서
     """
     try:
         # 사용자 존재 확인
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="사용자를 찾을 수 없습니다"
             )
         
-        # 사용자가 생성한 투표 조회
-        polls = db.query(Poll)\
-                  .filter(Poll.created_by == user_id)\
-                  .order_by(desc(Poll.created_at))\
-                  .offset(pagination.offset)\
-                  .limit(pagination.limit)\
-                  .all()
+        # 사용자가 생성한 투표 조회 ((created_by, created_at, id) 인덱스 키셋)
+        result = PollService(db).get_user_polls(user_id, per_page=pagination.limit, cursor=cursor)
         
-        return [PollBasicInfo.from_orm(poll) for poll in polls]
+        return UserPollListResponse(
+            polls=[PollBasicInfo.from_orm(poll) for poll in result["polls"]],
+            next_cursor=result["next_cursor"],
+            has_more=result["has_more"]
+        )
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
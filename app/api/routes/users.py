@@ -4,19 +4,17 @@
 사용자 인증, 등록, 프로필 관리 엔드포인트
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 
 from ...database.session import get_db
 from ...api.deps import get_current_user, get_optional_current_user, get_pagination_params, PaginationParams
 from ...core.security import create_user_token, sanitize_nickname, validate_nickname
+from ...core.presence import online_users
 from ...models.user import User
-from ...models.poll import Poll
-from ...models.vote import Vote
-from ...models.message import ChatMessage
-from ...models.memo import UserMemo
 from ...schemas.user import (
     UserCreateRequest,
     UserLoginRequest,
@@ -29,6 +27,9 @@ from ...schemas.user import (
     SuccessResponse,
     ErrorResponse
 )
+from ...schemas.poll import VoteRecordListResponse
+from ...services.poll_service import PollService
+from ...services.user_service import UserService, mark_user_online
 
 router = APIRouter()
 
@@ -62,21 +63,13 @@ async def register_user(
                 detail="유효하지 않은 닉네임입니다"
             )
         
-        # 중복 닉네임 확인
-        existing_user = db.query(User).filter(User.nickname == nickname).first()
-        if existing_user:
-            print(f"Nickname already exists: {nickname}")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="이미 사용 중인 닉네임입니다"
-            )
-        
-        # 새 사용자 생성
+        # 새 사용자 생성 (중복 닉네임은 UNIQUE 인덱스 위반으로 판정)
         print(f"Creating new user: {nickname}")
         new_user = User.create_user(nickname=nickname)
         db.add(new_user)
         db.commit()
         db.refresh(new_user)
+        online_users.add(new_user.id)
         print(f"User created successfully: {new_user.id}")
         
         # 액세스 토큰 생성
@@ -98,6 +91,20 @@ async def register_user(
     except HTTPException:
         print(f"Registration failed with HTTPException")
         raise
+    except IntegrityError as e:
+        db.rollback()
+        # 닉네임 UNIQUE 위반만 409로 응답 (롤백 후 실제 중복 여부 재확인)
+        if UserService(db).is_nickname_taken(nickname):
+            print(f"Nickname already exists: {nickname}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 사용 중인 닉네임입니다"
+            )
+        print(f"Registration integrity error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사용자 등록 중 오류가 발생했습니다"
+        )
     except Exception as e:
         print(f"Registration error: {e}")
         import traceback
@@ -112,6 +119,7 @@ async def register_user(
 @router.post("/login", response_model=UserLoginResponse)
 async def login_user(
     login_data: UserLoginRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -119,6 +127,7 @@ async def login_user(
     
     Args:
         login_data: 로그인 요청 데이터
+        background_tasks: 백그라운드 작업
         db: 데이터베이스 세션
     
     Returns:
@@ -135,9 +144,10 @@ async def login_user(
                 detail="사용자를 찾을 수 없습니다"
             )
         
-        # 온라인 상태 업데이트
+        # 온라인 상태 업데이트 (응답에는 바로 반영, DB 쓰기는 응답 후 백그라운드에서 수행)
         user.set_online_status(True)
-        db.commit()
+        online_users.add(user.id)
+        background_tasks.add_task(mark_user_online, user.id)
         
         # 액세스 토큰 생성
         token_info = create_user_token(user.id, user.nickname)
@@ -176,13 +186,8 @@ async def get_current_user_profile(
         UserProfileResponse: 사용자 프로필 정보
     """
     try:
-        # 사용자 통계 정보 조회
-        stats = {
-            "total_polls_created": db.query(Poll).filter(Poll.created_by == current_user.id).count(),
-            "total_votes_cast": db.query(Vote).filter(Vote.user_id == current_user.id).count(),
-            "total_messages_sent": db.query(ChatMessage).filter(ChatMessage.user_id == current_user.id).count(),
-            "total_memos_written": db.query(UserMemo).filter(UserMemo.user_id == current_user.id).count()
-        }
+        # 사용자 통계 정보 조회 (단일 집계 쿼리)
+        stats = UserService(db).get_user_stats(current_user)
         
         # 프로필 응답 생성
         profile = UserProfileResponse(
@@ -234,13 +239,8 @@ async def update_current_user_profile(
                     detail="유효하지 않은 닉네임입니다"
                 )
             
-            # 중복 확인 (자신 제외)
-            existing_user = db.query(User).filter(
-                User.nickname == new_nickname,
-                User.id != current_user.id
-            ).first()
-            
-            if existing_user:
+            # 중복 확인 (자신 제외, EXISTS 조회)
+            if UserService(db).is_nickname_taken(new_nickname, current_user.id):
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="이미 사용 중인 닉네임입니다"
@@ -271,6 +271,47 @@ async def update_current_user_profile(
         )
 
 
+@router.get("/me/votes", response_model=VoteRecordListResponse)
+async def get_my_votes(
+    pagination: PaginationParams = Depends(get_pagination_params),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    현재 사용자의 투표 참여 기록 조회 (최신순, 커서 페이지네이션)
+    
+    Args:
+        pagination: 페이지네이션 파라미터 (per_page만 사용)
+        cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+        current_user: 현재 인증된 사용자
+        db: 데이터베이스 세션
+    
+    Returns:
+        VoteRecordListResponse: 투표 참여 기록 및 다음 페이지 커서
+    """
+    try:
+        # (user_id, created_at, id) 인덱스 키셋 조회
+        result = PollService(db).get_user_votes(current_user.id, per_page=pagination.limit, cursor=cursor)
+        
+        return ORJSONResponse(content={
+            "votes": [vote.to_dict() for vote in result["votes"]],
+            "next_cursor": result["next_cursor"],
+            "has_more": result["has_more"]
+        })
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="투표 참여 기록 조회 중 오류가 발생했습니다"
+        )
+
+
 @router.get("/list", response_model=UserListResponse)
 async def get_users_list(
     pagination: PaginationParams = Depends(get_pagination_params),
@@ -292,8 +333,8 @@ async def get_users_list(
         # 전체 사용자 수 조회
         total = db.query(User).count()
         
-        # 온라인 사용자 수 조회
-        online_count = db.query(User).filter(User.is_online == True).count()
+        # 온라인 사용자 수 조회 (워커 간 공유 온라인 집합 기준)
+        online_count = online_users.count(db)
         
         # 사용자 목록 조회 (최근 접속 순)
         users_query = db.query(User).order_by(User.last_seen.desc())
@@ -331,10 +372,10 @@ async def get_online_users(
         List[UserBasicInfo]: 온라인 사용자 목록
     """
     try:
-        # 온라인 사용자 조회
-        online_users = db.query(User).filter(User.is_online == True).all()
+        # 온라인 사용자 조회 (워커 간 공유 온라인 집합 기준)
+        users = online_users.users(db)
         
-        return [UserBasicInfo.from_orm(user) for user in online_users]
+        return [UserBasicInfo.from_orm(user) for user in users]
         
     except Exception as e:
         raise HTTPException(
@@ -361,7 +402,7 @@ async def get_user_by_id(
         UserResponse: 사용자 정보
     """
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         
         if not user:
             raise HTTPException(
@@ -399,6 +440,7 @@ async def logout_user(
         # 오프라인 상태로 변경
         current_user.set_online_status(False)
         db.commit()
+        online_users.discard(current_user.id)
         
         return SuccessResponse(
             success=True,
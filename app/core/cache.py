@@ -0,0 +1,218 @@
+# app/core/cache.py
+"""
+실시간 투표 플랫폼 인메모리 캐시
+짧은 TTL로 모니터링/통계성 값을 프로세스 내에 보관
+(워커 간 일관성이 필요한 값은 SharedCache로 Redis에 보관)
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """만료 시간이 있는 프로세스 내 키-값 캐시"""
+    
+    def __init__(self):
+        self._store: Dict[str, Tuple[float, Any]] = {}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시 값 조회
+        
+        Args:
+            key: 캐시 키
+            default: 값이 없거나 만료된 경우 반환할 기본값
+        
+        Returns:
+            Any: 캐시된 값 또는 기본값
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return default
+        
+        return value
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        캐시 값 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 유효 시간 (초)
+        """
+        self._store[key] = (time.monotonic() + ttl, value)
+    
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """
+        값이 없을 때만 캐시 값 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 유효 시간 (초)
+        
+        Returns:
+            bool: 저장 여부 (유효한 값이 이미 있으면 False)
+        """
+        if self.get(key) is not None:
+            return False
+        self.set(key, value, ttl)
+        return True
+    
+    def delete(self, key: str):
+        """캐시 값 삭제"""
+        self._store.pop(key, None)
+    
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: float) -> Any:
+        """
+        캐시 값 조회, 없으면 factory 결과를 저장 후 반환
+        
+        Args:
+            key: 캐시 키
+            factory: 값 생성 함수
+            ttl: 유효 시간 (초)
+        
+        Returns:
+            Any: 캐시된 값 또는 새로 생성한 값
+        """
+        value: Optional[Any] = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+    
+    def clear(self):
+        """전체 캐시 삭제"""
+        self._store.clear()
+
+
+class SharedCache:
+    """
+    워커 간 공유 캐시 (REDIS_URL 설정 시 Redis, 값은 JSON 직렬화)
+    
+    Redis가 없으면 프로세스 내 캐시를 사용하되 다른 워커의 갱신을 놓치지 않도록
+    유효 시간을 local_max_ttl 이하로 제한합니다.
+    """
+    
+    def __init__(self, local: TTLCache, local_max_ttl: float):
+        self.local = local
+        self.local_max_ttl = local_max_ttl
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시 값 조회
+        
+        Args:
+            key: 캐시 키
+            default: 값이 없거나 만료된 경우 반환할 기본값
+        
+        Returns:
+            Any: 캐시된 값 또는 기본값
+        """
+        client = get_redis()
+        if client is None:
+            return self.local.get(key, default)
+        
+        try:
+            data = client.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ 공유 캐시 조회 실패: {e}")
+            return default
+        
+        return default if data is None else orjson.loads(data)
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        캐시 값 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (JSON 직렬화 가능)
+            ttl: 유효 시간 (초)
+        """
+        client = get_redis()
+        if client is None:
+            self.local.set(key, value, min(ttl, self.local_max_ttl))
+            return
+        
+        try:
+            client.set(key, orjson.dumps(value), px=int(ttl * 1000))
+        except Exception as e:
+            logger.warning(f"⚠️ 공유 캐시 저장 실패: {e}")
+    
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """
+        값이 없을 때만 캐시 값 저장 (Redis SET NX)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (JSON 직렬화 가능)
+            ttl: 유효 시간 (초)
+        
+        Returns:
+            bool: 저장 여부 (값이 이미 있거나 저장에 실패하면 False)
+        """
+        client = get_redis()
+        if client is None:
+            return self.local.add(key, value, min(ttl, self.local_max_ttl))
+        
+        try:
+            return bool(client.set(key, orjson.dumps(value), px=int(ttl * 1000), nx=True))
+        except Exception as e:
+            logger.warning(f"⚠️ 공유 캐시 저장 실패: {e}")
+            return False
+    
+    def delete(self, key: str):
+        """캐시 값 삭제"""
+        client = get_redis()
+        if client is None:
+            self.local.delete(key)
+            return
+        
+        try:
+            client.delete(key)
+        except Exception as e:
+            logger.warning(f"⚠️ 공유 캐시 삭제 실패: {e}")
+    
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: float) -> Any:
+        """
+        캐시 값 조회, 없으면 factory 결과를 값이 없을 때만 저장 후 반환
+        
+        Args:
+            key: 캐시 키
+            factory: 값 생성 함수
+            ttl: 유효 시간 (초)
+        
+        Returns:
+            Any: 캐시된 값 또는 새로 생성한 값
+        """
+        value: Optional[Any] = self.get(key)
+        if value is None:
+            # 조회 후 저장 사이에 다른 요청이 최신 값을 저장했으면 덮어쓰지 않음
+            # (투표 직전 시점의 결과가 refresh로 갱신된 값을 대체하지 않도록)
+            value = factory()
+            self.add(key, value, ttl)
+        return value
+
+
+# 프로세스 내 Redis 미사용 시 공유 캐시 값의 최대 유효 시간 (초)
+LOCAL_SHARED_CACHE_MAX_TTL = 1
+
+# 전역 캐시 인스턴스
+cache = TTLCache()
+
+# 워커 간 공유 캐시 인스턴스 (Redis 미사용 시 프로세스 내 캐시를 짧게 사용)
+shared_cache = SharedCache(cache, LOCAL_SHARED_CACHE_MAX_TTL)
@@ -4,7 +4,9 @@
 환경 변수 및 애플리케이션 설정을 중앙 집중화
 """
 
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -32,6 +34,10 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     database_url: str = Field(default="sqlite:///./voting_app.db", env="DATABASE_URL")
     database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    # 커넥션 풀 크기 (서버 시작 시 이 수만큼 미리 연결)
+    db_pool_size: int = Field(default=5, env="DB_POOL_SIZE")
+    # 텍스트 검색 방식 (auto: PostgreSQL이면 전문 검색, 그 외 LIKE / fts / like)
+    search_backend: str = Field(default="auto", env="SEARCH_BACKEND")
     
     # JWT 토큰 설정
     jwt_secret_key: str = Field(..., env="JWT_SECRET_KEY")
@@ -48,6 +54,10 @@ class Settings(BaseSettings):
     # WebSocket 설정
     ws_max_connections: int = Field(default=1000, env="WS_MAX_CONNECTIONS")
     ws_heartbeat_interval: int = Field(default=30, env="WS_HEARTBEAT_INTERVAL")
+    # permessage-deflate 압축 (브로드캐스트 시 같은 메시지를 연결마다 다시 압축하므로 기본 비활성)
+    ws_per_message_deflate: bool = Field(default=False, env="WS_PER_MESSAGE_DEFLATE")
+    # 여러 워커 간 브로드캐스트 공유용 Redis (미설정 시 프로세스 내 브로드캐스트)
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
     
     # 개발 환경 설정
     reload: bool = Field(default=False, env="RELOAD")
@@ -87,22 +97,38 @@ def get_database_url() -> str:
 
 
 # CORS 설정 생성
-def get_cors_origins() -> List[str]:
-    """CORS 허용 원본 목록 반환"""
+@lru_cache(maxsize=1)
+def get_cors_origins() -> Tuple[str, ...]:
+    """CORS 허용 원본 목록 반환 (설정은 프로세스 수명 동안 고정이므로 한 번만 생성)"""
     if is_development():
         # 개발 환경에서는 추가 원본 허용
-        return settings.allowed_origins + [
+        return tuple(settings.allowed_origins) + (
             "http://localhost:3000",
             "http://localhost:3001", 
             "http://127.0.0.1:3000",
             "http://127.0.0.1:3001"
-        ]
-    return settings.allowed_origins
+        )
+    return tuple(settings.allowed_origins)
+
+
+@lru_cache(maxsize=1)
+def get_cors_origin_regex() -> Optional[str]:
+    """
+    CORS 허용 원본 목록을 하나의 정규식으로 변환 (요청마다 목록을 순회하지 않고 한 번의 매칭으로 판정)
+    
+    Returns:
+        Optional[str]: 허용 원본 정규식 (와일드카드 "*" 사용 시 또는 원본이 없으면 None)
+    """
+    origins = get_cors_origins()
+    if not origins or "*" in origins:
+        return None
+    return "^(?:" + "|".join(re.escape(origin) for origin in origins) + ")$"
 
 
 # 로깅 설정
+@lru_cache(maxsize=1)
 def get_logging_config() -> dict:
-    """로깅 설정 딕셔너리 반환"""
+    """로깅 설정 딕셔너리 반환 (한 번만 생성, 반환값을 수정하지 말 것)"""
     return {
         "version": 1,
         "disable_existing_loggers": False,
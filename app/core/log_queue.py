@@ -0,0 +1,73 @@
+# app/core/log_queue.py
+"""
+실시간 투표 플랫폼 로깅 설정 및 비동기 친화 로깅
+루트 로거 출력을 큐 + 백그라운드 리스너 스레드로 넘겨
+이벤트 루프에서 포맷(예외 트레이스백 포함)과 쓰기 I/O가 일어나지 않도록 함
+"""
+
+import copy
+import logging
+import logging.config
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+class DeferredQueueHandler(QueueHandler):
+    """레코드 포맷을 리스너 스레드로 미루는 QueueHandler"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자만 확정하고 exc_info는 그대로 전달 (프로세스 내 큐이므로 pickle 불필요)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_configured = False
+
+
+def configure_logging(config: dict):
+    """
+    로깅 설정 적용 (프로세스당 한 번만)
+    
+    `python main.py` 실행 시 uvicorn이 main 모듈을 다시 import하므로
+    핸들러/포매터를 다시 만들지 않도록 중복 호출을 무시
+    
+    Args:
+        config: logging.config.dictConfig 설정 딕셔너리
+    """
+    global _configured
+    
+    if _configured:
+        return
+    
+    logging.config.dictConfig(config)
+    _configured = True
+
+
+def start_log_listener():
+    """루트 로거 핸들러를 큐 핸들러로 교체하고 리스너 스레드 시작 (워커 프로세스마다 호출)"""
+    global _listener
+    
+    root = logging.getLogger()
+    if _listener is not None or not root.handlers:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [DeferredQueueHandler(log_queue)]
+    _listener.start()
+
+
+def stop_log_listener():
+    """원래 핸들러를 복원하고 큐에 남은 로그를 모두 기록한 뒤 리스너 중지"""
+    global _listener
+    
+    if _listener is None:
+        return
+    
+    logging.getLogger().handlers = list(_listener.handlers)
+    _listener.stop()
+    _listener = None
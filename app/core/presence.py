@@ -0,0 +1,133 @@
+# app/core/presence.py
+"""
+실시간 투표 플랫폼 온라인 사용자 집합
+REDIS_URL 설정 시 Redis SET으로 모든 워커가 같은 집합을 공유하고,
+없으면 users.is_online 컬럼을 조회 (프로세스 내 집합은 워커마다 달라지므로 사용하지 않음)
+"""
+
+import asyncio
+import logging
+from typing import Iterable, List
+
+from sqlalchemy.orm import Session
+
+from ..utils.constants import CacheKeys
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class OnlineUsers:
+    """온라인 사용자 ID 집합 (users.is_online 컬럼과 함께 갱신)"""
+    
+    def __init__(self, key: str = CacheKeys.ONLINE_USERS):
+        self.key = key
+    
+    def add(self, user_id: str):
+        """온라인 사용자 추가"""
+        self.set_status(user_id, True)
+    
+    def discard(self, user_id: str):
+        """온라인 사용자 제거"""
+        self.set_status(user_id, False)
+    
+    def set_status(self, user_id: str, is_online: bool):
+        """
+        온라인 상태 반영 (Redis 미사용 시 users.is_online 갱신만으로 충분)
+        
+        Args:
+            user_id: 사용자 ID
+            is_online: 온라인 여부
+        """
+        client = get_redis()
+        if client is None:
+            return
+        
+        try:
+            if is_online:
+                client.sadd(self.key, user_id)
+            else:
+                client.srem(self.key, user_id)
+        except Exception as e:
+            logger.warning(f"⚠️ 온라인 사용자 집합 갱신 실패: {e}")
+    
+    async def set_status_async(self, user_id: str, is_online: bool):
+        """
+        온라인 상태 반영 (이벤트 루프에서 호출, Redis 요청은 스레드에서 수행)
+        
+        Args:
+            user_id: 사용자 ID
+            is_online: 온라인 여부
+        """
+        if get_redis() is None:
+            return
+        
+        await asyncio.to_thread(self.set_status, user_id, is_online)
+    
+    def load(self, user_ids: Iterable[str]):
+        """
+        온라인 사용자 집합 초기화 (서버 시작 시 DB 상태로 채움)
+        
+        Args:
+            user_ids: 온라인 사용자 ID 목록
+        """
+        client = get_redis()
+        if client is None:
+            return
+        
+        user_ids = list(user_ids)
+        try:
+            with client.pipeline() as pipe:
+                pipe.delete(self.key)
+                if user_ids:
+                    pipe.sadd(self.key, *user_ids)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ 온라인 사용자 집합 초기화 실패: {e}")
+    
+    def users(self, db: Session) -> List:
+        """
+        온라인 사용자 목록 조회
+        
+        Args:
+            db: 데이터베이스 세션
+        
+        Returns:
+            List[User]: 온라인 사용자 목록
+        """
+        from ..models.user import User
+        
+        client = get_redis()
+        if client is not None:
+            try:
+                user_ids = client.smembers(self.key)
+                return db.query(User).filter(User.id.in_(user_ids)).all() if user_ids else []
+            except Exception as e:
+                logger.warning(f"⚠️ 온라인 사용자 집합 조회 실패 (DB 조회로 대체): {e}")
+        
+        return db.query(User).filter(User.is_online == True).all()
+    
+    def count(self, db: Session) -> int:
+        """
+        온라인 사용자 수 조회
+        
+        Args:
+            db: 데이터베이스 세션
+        
+        Returns:
+            int: 온라인 사용자 수
+        """
+        from ..models.user import User
+        
+        client = get_redis()
+        if client is not None:
+            try:
+                return client.scard(self.key)
+            except Exception as e:
+                logger.warning(f"⚠️ 온라인 사용자 수 조회 실패 (DB 조회로 대체): {e}")
+        
+        return db.query(User).filter(User.is_online == True).count()
+
+
+# 전역 온라인 사용자 집합
+online_users = OnlineUsers()
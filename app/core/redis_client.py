@@ -0,0 +1,33 @@
+# app/core/redis_client.py
+"""
+실시간 투표 플랫폼 공유 Redis 클라이언트
+REDIS_URL 설정 시 여러 워커 프로세스가 함께 보는 상태(온라인 사용자, 캐시)를 저장
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_redis():
+    """
+    동기 Redis 클라이언트 반환 (프로세스당 하나, 연결 풀 공유)
+    
+    Returns:
+        Optional[redis.Redis]: REDIS_URL이 없거나 redis 패키지가 없으면 None
+    """
+    if not settings.redis_url:
+        return None
+    
+    try:
+        import redis
+    except ImportError:
+        logger.warning("⚠️ redis 패키지가 없어 워커 간 공유 상태를 사용할 수 없습니다")
+        return None
+    
+    return redis.Redis.from_url(settings.redis_url, decode_responses=True)
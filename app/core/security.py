@@ -4,13 +4,17 @@
 JWT 토큰 생성/검증, 비밀번호 해싱 등
 """
 
+import string
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from passlib.hash import bcrypt
 from fastapi import HTTPException, status
 from .config import settings
+from ..utils.constants import RegexPatterns, TOKEN_CACHE_SIZE
 
 
 # 비밀번호 해싱 컨텍스트
@@ -73,6 +77,23 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _verify_token_cached(token: str) -> Optional[dict]:
+    """
+    토큰 서명 검증 결과 캐시 (재연결 시 같은 토큰의 반복 검증 방지)
+    
+    만료 여부는 캐시된 결과를 사용할 때 호출 측에서 다시 확인
+    
+    Args:
+        token: JWT 토큰 문자열
+    
+    Returns:
+        dict: 토큰 페이로드 (성공)
+        None: 토큰 검증 실패
+    """
+    return verify_token(token)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증
@@ -142,10 +163,15 @@ def extract_user_from_token(token: str) -> Optional[dict]:
         dict: 사용자 정보 (user_id, nickname)
         None: 토큰 검증 실패
     """
-    payload = verify_token(token)
+    payload = _verify_token_cached(token)
     if not payload:
         return None
     
+    # 캐시된 페이로드는 검증 이후 만료되었을 수 있으므로 만료 시각 재확인
+    expires_at = payload.get("exp")
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    
     user_id = payload.get("sub")
     nickname = payload.get("nickname")
     
@@ -207,6 +233,14 @@ def create_temporary_token(user_id: str, purpose: str) -> str:
     return create_access_token(data, expires_delta)
 
 
+# 닉네임 허용 문자 (영문, 숫자, 한글, 언더스코어, 공백)
+NICKNAME_PATTERN = RegexPatterns.NICKNAME_RE
+
+# ASCII 닉네임 빠른 검증용 (언더스코어/공백 제거 후 영숫자만 남는지 확인)
+# (\x1c-\x1f는 string.whitespace에 없지만 정규식 \s에는 포함됨)
+_NICKNAME_ASCII_EXTRA = str.maketrans('', '', '_' + string.whitespace + '\x1c\x1d\x1e\x1f')
+
+
 # 닉네임 검증 함수들
 def validate_nickname(nickname: str) -> bool:
     """
@@ -225,12 +259,12 @@ def validate_nickname(nickname: str) -> bool:
     if len(nickname) > 20:
         return False
     
-    # 특수문자 제한 (기본적인 검증)
-    import re
-    if not re.match(r'^[a-zA-Z0-9가-힣_\s]+$', nickname):
-        return False
+    # 특수문자 제한 (ASCII만으로 된 닉네임은 정규식 없이 문자열 내장 메서드로 판별)
+    if nickname.isascii():
+        rest = nickname.translate(_NICKNAME_ASCII_EXTRA)
+        return not rest or rest.isalnum()
     
-    return True
+    return NICKNAME_PATTERN.match(nickname) is not None
 
 
 def sanitize_nickname(nickname: str) -> str:
@@ -0,0 +1,19 @@
+# app/core/workers.py
+"""
+실시간 투표 플랫폼 Gunicorn 워커 설정
+프로덕션 실행 시 gunicorn -k 옵션으로 지정하는 Uvicorn 워커
+"""
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+from .config import settings
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """애플리케이션 WebSocket 설정을 반영한 Uvicorn 워커"""
+    
+    CONFIG_KWARGS = {
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "ws_per_message_deflate": settings.ws_per_message_deflate,
+        "access_log": settings.debug,
+    }
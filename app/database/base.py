@@ -4,15 +4,18 @@
 SQLAlchemy 기본 설정 및 Base 클래스 정의
 """
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 from ..core.config import settings
 
 # 데이터베이스 엔진 생성
 engine = create_engine(
     settings.database_url,
     echo=settings.database_echo,  # SQL 로그 출력 여부
+    pool_size=settings.db_pool_size,
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
 )
 
@@ -36,3 +39,31 @@ metadata = MetaData(
 
 # Base 클래스 생성
 Base = declarative_base(metadata=metadata)
+
+
+class utcnow(FunctionElement):
+    """
+    DB 서버 측 UTC 현재 시각 (server_default 용)
+
+    func.now()는 PostgreSQL에서 세션 타임존 기준 값을, SQLite에서는 초 단위 값을
+    반환하므로 기존 datetime.utcnow()와 동일한 naive UTC 값을 얻도록 방언별로 컴파일합니다.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # 밀리초 단위까지 기록 (채팅 메시지 정렬 순서 유지)
+    # SQLAlchemy가 바인딩하는 6자리 소수 형식과 맞춰야 문자열 비교가 정확함
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f', 'now') || '000')"
@@ -0,0 +1,42 @@
+# app/database/ids.py
+"""
+실시간 투표 플랫폼 ID 생성기
+UUID4 문자열 기본키를 배치 단위로 미리 생성
+"""
+
+import collections
+import os
+import uuid
+
+# 한 번의 os.urandom 호출로 생성할 UUID 개수
+UUID_BATCH_SIZE = 1024
+
+_buf = collections.deque()
+
+
+def _refill():
+    """난수 바이트를 한 번에 읽어 UUID 문자열 버퍼 채우기"""
+    raw = os.urandom(16 * UUID_BATCH_SIZE)
+    _buf.extend(
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, len(raw), 16)
+    )
+
+
+def next_uuid_str() -> str:
+    """
+    다음 UUID4 문자열 반환 (컬럼 default 용)
+    
+    Returns:
+        str: 하이픈 포함 36자 UUID4 문자열
+    """
+    try:
+        return _buf.popleft()
+    except IndexError:
+        _refill()
+        return _buf.popleft()
+
+
+# fork된 워커 프로세스가 부모와 같은 ID를 재사용하지 않도록 버퍼 비우기
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_buf.clear)
@@ -0,0 +1,145 @@
+# app/database/pagination.py
+"""
+실시간 투표 플랫폼 키셋(커서) 페이지네이션
+(정렬 시각, ID) 기준 커서 인코딩 및 페이지 조회
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select, desc, tuple_
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy.orm import Query, Session
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    커서 인코딩
+    
+    Args:
+        timestamp: 마지막 항목의 정렬 시각
+        row_id: 마지막 항목의 ID
+    
+    Returns:
+        str: URL 안전 base64 커서 문자열
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    커서 디코딩
+    
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열
+    
+    Returns:
+        Tuple[datetime, str]: (정렬 시각, ID)
+    
+    Raises:
+        ValueError: 잘못된 형식의 커서인 경우
+    """
+    try:
+        timestamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(timestamp), row_id
+    except Exception:
+        raise ValueError("유효하지 않은 커서입니다")
+
+
+def _apply_keyset(statement, timestamp_column, id_column, cursor: Optional[str], descending: bool):
+    """커서 이후 조건과 (정렬 시각, ID) 정렬 적용 (세션 Query와 Core select 공용)"""
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        # 정수 PK 등 문자열이 아닌 ID 컬럼은 컬럼 타입으로 변환해 비교
+        try:
+            cursor_id = id_column.type.python_type(cursor_id)
+        except (TypeError, ValueError):
+            raise ValueError("유효하지 않은 커서입니다")
+        key = tuple_(timestamp_column, id_column)
+        if descending:
+            statement = statement.filter(key < tuple_(cursor_ts, cursor_id))
+        else:
+            statement = statement.filter(key > tuple_(cursor_ts, cursor_id))
+    
+    if descending:
+        return statement.order_by(desc(timestamp_column), desc(id_column))
+    return statement.order_by(timestamp_column, id_column)
+
+
+def keyset_page(
+    query: Query,
+    timestamp_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    키셋 페이지 조회
+    
+    OFFSET 없이 (정렬 시각, ID) 비교로 다음 페이지를 조회하므로
+    페이지가 깊어져도 조회 비용이 일정합니다.
+    
+    Args:
+        query: 필터가 적용된 쿼리 (정렬 미적용, 엔티티 또는 정렬 컬럼을 포함한 컬럼 행)
+        timestamp_column: 정렬 기준 시각 컬럼
+        id_column: 동률 정렬용 ID 컬럼
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+        descending: 최신순 정렬 여부
+    
+    Returns:
+        Tuple[List[Any], Optional[str]]: (항목 목록, 다음 페이지 커서)
+    """
+    query = _apply_keyset(query, timestamp_column, id_column, cursor, descending)
+    items = query.limit(limit).all()
+    
+    next_cursor = None
+    if len(items) == limit:
+        last = items[-1]
+        # (엔티티, 추가 컬럼) 행은 엔티티에서, 컬럼 행은 컬럼 이름으로 커서 값을 읽음
+        if isinstance(last, Row) and timestamp_column.key not in last._mapping:
+            last = last[0]
+        next_cursor = encode_cursor(
+            getattr(last, timestamp_column.key),
+            getattr(last, id_column.key)
+        )
+    
+    return items, next_cursor
+
+
+def keyset_rows(
+    db: Session,
+    statement: Select,
+    timestamp_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True
+) -> Tuple[List[RowMapping], Optional[str]]:
+    """
+    Core select 키셋 페이지 조회 (ORM 객체 생성 없이 행 매핑으로 반환)
+    
+    Args:
+        db: 데이터베이스 세션
+        statement: 필터가 적용된 select (정렬 미적용, 정렬 컬럼 포함)
+        timestamp_column: 정렬 기준 시각 컬럼
+        id_column: 동률 정렬용 ID 컬럼
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+        descending: 최신순 정렬 여부
+    
+    Returns:
+        Tuple[List[RowMapping], Optional[str]]: (행 매핑 목록, 다음 페이지 커서)
+    """
+    statement = _apply_keyset(statement, timestamp_column, id_column, cursor, descending)
+    rows = db.execute(statement.limit(limit)).mappings().all()
+    
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(last[timestamp_column.key], last[id_column.key])
+    
+    return rows, next_cursor
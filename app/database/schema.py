@@ -0,0 +1,129 @@
+# app/database/schema.py
+"""
+실시간 투표 플랫폼 DB 스키마 호환성 확인
+기존 DB가 현재 모델과 맞는지 검사하고 Alembic 리비전을 기록
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, List, Optional, Set
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Integer, UniqueConstraint, inspect
+from sqlalchemy.engine import Connection
+
+from .base import Base
+
+# 프로젝트 루트의 Alembic 마이그레이션 디렉토리
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class SchemaOutdatedError(RuntimeError):
+    """기존 DB 스키마가 현재 모델과 호환되지 않음 (마이그레이션 필요)"""
+
+
+@lru_cache(maxsize=1)
+def get_script_directory() -> ScriptDirectory:
+    """Alembic 스크립트 디렉토리 (alembic.ini 없이 경로만으로 구성)"""
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    return ScriptDirectory.from_config(config)
+
+
+def get_alembic_head() -> str:
+    """최신 마이그레이션 리비전 반환"""
+    return get_script_directory().get_current_head()
+
+
+def get_current_revision(connection: Connection) -> Optional[str]:
+    """
+    DB에 기록된 Alembic 리비전 조회
+    
+    Args:
+        connection: DB 연결
+    
+    Returns:
+        Optional[str]: 리비전 (alembic_version 테이블이 없으면 None)
+    """
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def stamp_alembic_head(connection: Connection):
+    """
+    DB를 최신 리비전으로 기록 (현재 모델로 생성된 스키마에만 호출)
+    
+    Args:
+        connection: 트랜잭션이 시작된 DB 연결
+    """
+    MigrationContext.configure(connection).stamp(get_script_directory(), "head")
+
+
+def _unique_column_sets(table) -> Set[FrozenSet[str]]:
+    """모델 테이블의 유일성 보장 컬럼 집합 (기본 키, UNIQUE 제약/인덱스, unique 컬럼)"""
+    column_sets = {frozenset(column.name for column in table.primary_key.columns)}
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            column_sets.add(frozenset(column.name for column in constraint.columns))
+    for index in table.indexes:
+        if index.unique:
+            column_sets.add(frozenset(column.name for column in index.columns))
+    return column_sets
+
+
+def find_schema_mismatches(connection: Connection) -> List[str]:
+    """
+    이미 존재하는 테이블과 현재 모델의 차이 중 쓰기를 실패시키거나 무결성을 깨는 항목 검사
+    (create_all은 기존 테이블을 변경하지 않으므로 시작 시 확인 필요, 누락된 일반 인덱스는 제외)
+    
+    Args:
+        connection: DB 연결
+    
+    Returns:
+        List[str]: 불일치 항목 설명 목록 (비어 있으면 호환)
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    mismatches = []
+    
+    for table in Base.metadata.sorted_tables:
+        # 아직 없는 테이블은 create_all이 현재 모델대로 생성
+        if table.name not in existing_tables:
+            continue
+        
+        db_columns = {column["name"]: column for column in inspector.get_columns(table.name)}
+        
+        for column in table.columns:
+            db_column = db_columns.pop(column.name, None)
+            if db_column is None:
+                mismatches.append(f"{table.name}.{column.name}: 컬럼 없음")
+                continue
+            
+            if isinstance(column.type, Integer) != isinstance(db_column["type"], Integer):
+                mismatches.append(f"{table.name}.{column.name}: 타입 불일치 ({db_column['type']})")
+            
+            # INSERT에서 생략하는 컬럼은 DB 기본값이 있어야 함
+            if column.server_default is not None and db_column.get("default") is None and not db_column["nullable"]:
+                mismatches.append(f"{table.name}.{column.name}: DB 기본값 없음")
+        
+        # 모델에서 제거된 NOT NULL 컬럼은 INSERT를 실패시킴
+        for name, db_column in db_columns.items():
+            if not db_column["nullable"] and db_column.get("default") is None:
+                mismatches.append(f"{table.name}.{name}: 모델에 없는 NOT NULL 컬럼")
+        
+        # 중복 판정을 UNIQUE 위반에 의존하는 컬럼 확인
+        db_unique_sets = {frozenset(inspector.get_pk_constraint(table.name)["constrained_columns"])}
+        db_unique_sets.update(
+            frozenset(constraint["column_names"])
+            for constraint in inspector.get_unique_constraints(table.name)
+        )
+        db_unique_sets.update(
+            frozenset(index["column_names"])
+            for index in inspector.get_indexes(table.name)
+            if index["unique"]
+        )
+        for column_set in _unique_column_sets(table) - db_unique_sets:
+            mismatches.append(f"{table.name}({', '.join(sorted(column_set))}): UNIQUE 제약 없음")
+    
+    return mismatches
@@ -0,0 +1,55 @@
+# app/database/search.py
+"""
+실시간 투표 플랫폼 텍스트 검색 헬퍼
+PostgreSQL 전문 검색(tsvector + GIN 인덱스)과 LIKE 폴백을 공통으로 제공
+"""
+
+from sqlalchemy import func, text
+# to_tsvector/plainto_tsquery 함수 타입 등록 (모델 정의 전에 임포트되어야 함)
+import sqlalchemy.dialects.postgresql  # noqa: F401
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+from ..core.config import settings
+
+# 전문 검색 설정 (언어별 형태소 분석 없이 공백 단위 토큰화)
+# 인덱스 표현식과 쿼리 표현식이 같아야 하므로 바인딩 파라미터 대신 리터럴로 사용
+FTS_CONFIG = text("'simple'")
+
+
+def fts_document(column) -> ColumnElement:
+    """검색 대상 컬럼의 tsvector 표현식 (GIN 인덱스와 동일한 식)"""
+    return func.to_tsvector(FTS_CONFIG, column)
+
+
+def use_fulltext(db: Session) -> bool:
+    """
+    전문 검색 사용 여부 확인
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        bool: search_backend 설정이 fts이거나, auto이고 PostgreSQL이면 True
+    """
+    if settings.search_backend == "like":
+        return False
+    if settings.search_backend == "fts":
+        return True
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def text_search_filter(db: Session, column, query: str) -> ColumnElement:
+    """
+    텍스트 검색 조건 생성
+    
+    Args:
+        db: 데이터베이스 세션
+        column: 검색 대상 컬럼
+        query: 검색어
+    
+    Returns:
+        ColumnElement: 전문 검색(@@) 또는 LIKE 검색 조건
+    """
+    if use_fulltext(db):
+        return fts_document(column).op("@@")(func.plainto_tsquery(FTS_CONFIG, query))
+    return column.contains(query)
@@ -4,15 +4,27 @@
 데이터베이스 연결, 세션 생성, 초기화 관리
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Generator, AsyncGenerator
-from sqlalchemy import create_engine, event
+from contextlib import asynccontextmanager
+from typing import Generator, AsyncGenerator, AsyncIterator
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from .base import Base, engine, SessionLocal
+from .schema import (
+    SchemaOutdatedError,
+    find_schema_mismatches,
+    get_alembic_head,
+    get_current_revision,
+    stamp_alembic_head,
+)
 from ..core.config import settings
+from ..core.presence import online_users
 from ..models import user, poll, message, memo  # 모든 모델 임포트
 
 logger = logging.getLogger(__name__)
@@ -55,6 +67,7 @@ else:
     async_engine = create_async_engine(
         settings.database_url,
         echo=settings.database_echo,
+        pool_size=settings.db_pool_size,
     )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -64,8 +77,13 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    """비동기 데이터베이스 세션 생성"""
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """
+    비동기 데이터베이스 세션 컨텍스트 (WebSocket 핸들러 등 의존성 주입 밖에서 사용)
+    
+    사용 예: async with get_async_session() as db: ...
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -73,8 +91,12 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
             logger.error(f"비동기 데이터베이스 세션 오류: {e}")
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 생성 (FastAPI Depends용)"""
+    async with get_async_session() as session:
+        yield session
 
 
 def create_db_and_tables():
@@ -100,24 +122,116 @@ async def create_async_db_and_tables():
         raise
 
 
+def get_schema_version() -> int:
+    """
+    모델 스키마(DDL) 해시 계산
+    
+    Returns:
+        int: SQLite user_version에 저장할 양의 32비트 정수
+    """
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=engine.dialect)))
+    
+    digest = hashlib.blake2b("\n".join(ddl).encode(), digest_size=4).digest()
+    return (int.from_bytes(digest, "big") & 0x7FFFFFFF) or 1
+
+
+def is_schema_current(schema_version: int) -> bool:
+    """
+    DB에 현재 스키마로 테이블이 생성되어 있는지 확인 (SQLite만 지원)
+    스키마 해시와 Alembic 리비전이 모두 최신이어야 함 (검증 없이 해시만 기록된 DB는 다시 검사)
+    
+    Args:
+        schema_version: 현재 모델 스키마 해시
+    
+    Returns:
+        bool: 스키마 검사와 테이블 생성을 생략해도 되는지 여부
+    """
+    if "sqlite" not in settings.database_url:
+        return False
+    
+    with engine.connect() as connection:
+        if connection.exec_driver_sql("PRAGMA user_version").scalar() != schema_version:
+            return False
+        return get_current_revision(connection) == get_alembic_head()
+
+
+def mark_schema_version(schema_version: int):
+    """
+    스키마 해시 기록 (DB 파일 안에 저장되므로 DB 삭제 시 함께 초기화)
+    create_all은 기존 테이블을 변경하지 않으므로 verify_existing_schema 통과 후에만 호출
+    
+    Args:
+        schema_version: 현재 모델 스키마 해시
+    """
+    if "sqlite" not in settings.database_url:
+        return
+    
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {int(schema_version)}")
+
+
+def verify_existing_schema():
+    """
+    기존 테이블이 현재 모델과 호환되는지 확인
+    create_all은 이미 있는 테이블을 변경하지 않으므로, 이전 버전으로 만든 DB는 마이그레이션 전까지 시작을 중단
+    
+    Raises:
+        SchemaOutdatedError: 마이그레이션이 필요한 경우
+    """
+    with engine.connect() as connection:
+        mismatches = find_schema_mismatches(connection)
+    
+    if mismatches:
+        raise SchemaOutdatedError(
+            "DB 스키마가 현재 버전과 호환되지 않습니다. "
+            "`alembic upgrade head` 또는 `python manage.py migrate`로 마이그레이션한 뒤 다시 시작하세요. "
+            f"불일치 항목: {'; '.join(mismatches)}"
+        )
+
+
+def stamp_schema_revision():
+    """현재 모델과 일치하는 스키마를 최신 Alembic 리비전으로 기록 (이후 마이그레이션의 기준점)"""
+    with engine.begin() as connection:
+        if get_current_revision(connection) != get_alembic_head():
+            stamp_alembic_head(connection)
+
+
 async def init_db():
     """데이터베이스 초기화"""
     try:
-        # 동기 테이블 생성
-        create_db_and_tables()
-        
-        # 비동기 테이블 생성 (선택적)
-        # greenlet 패키지가 설치된 경우에만 실행
-        try:
-            import greenlet
-            if async_engine:
-                await create_async_db_and_tables()
-        except ImportError:
-            logger.warning("⚠️ greenlet 패키지가 없어 비동기 DB 기능을 사용할 수 없습니다")
+        # 스키마가 바뀌지 않았으면 테이블 생성 생략 (--reload 재시작마다 반복되는 create_all 방지)
+        schema_version = get_schema_version()
+        if is_schema_current(schema_version):
+            logger.info("✅ 스키마 변경 없음 - 테이블 생성 생략")
+        else:
+            # 이전 버전 스키마 DB는 시작 중단 (마이그레이션 안내)
+            verify_existing_schema()
+            
+            # 동기 테이블 생성
+            create_db_and_tables()
+            
+            # 비동기 테이블 생성 (선택적)
+            # greenlet 패키지가 설치된 경우에만 실행
+            try:
+                import greenlet
+                if async_engine:
+                    await create_async_db_and_tables()
+            except ImportError:
+                logger.warning("⚠️ greenlet 패키지가 없어 비동기 DB 기능을 사용할 수 없습니다")
+            
+            stamp_schema_revision()
+            mark_schema_version(schema_version)
         
         # 초기 데이터 생성
         await create_initial_data()
         
+        # 온라인 사용자 집합 초기화
+        load_online_users()
+        
         logger.info("🎉 데이터베이스 초기화 완료")
         
     except Exception as e:
@@ -125,6 +239,58 @@ async def init_db():
         raise
 
 
+async def warm_pool(size: int):
+    """
+    커넥션 풀 미리 채우기 (서버 시작 직후 요청들이 연결 생성 비용을 부담하지 않도록)
+    
+    Args:
+        size: 미리 열어 둘 연결 수
+    """
+    def warm_sync_pool():
+        # 동시에 열었다가 반환해야 풀에 size개가 남음
+        connections = [engine.connect() for _ in range(size)]
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+            connection.close()
+    
+    async def warm_async_connection():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    # SQLite 비동기 엔진은 단일 연결(StaticPool)을 공유하므로 한 번만 연결
+    async_size = 1 if isinstance(async_engine.pool, StaticPool) else size
+    
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(warm_sync_pool),
+            *(warm_async_connection() for _ in range(async_size))
+        )
+        logger.info(f"🔥 커넥션 풀 준비 완료 ({size}개)")
+    except Exception as e:
+        # 실패해도 요청 시 연결하면 되므로 서버 시작을 막지 않음
+        logger.warning(f"⚠️ 커넥션 풀 준비 실패: {e}")
+
+
+async def close_db():
+    """커넥션 풀 정리 (서버 종료 시)"""
+    engine.dispose()
+    await async_engine.dispose()
+    logger.info("🔌 데이터베이스 연결 정리 완료")
+
+
+def load_online_users():
+    """DB의 온라인 사용자 ID로 온라인 사용자 집합 채우기"""
+    from ..models.user import User
+    
+    db = SessionLocal()
+    try:
+        online_users.load(
+            user_id for (user_id,) in db.query(User.id).filter(User.is_online == True)
+        )
+    finally:
+        db.close()
+
+
 async def create_initial_data():
     """초기 데이터 생성"""
     try:
@@ -191,13 +357,33 @@ def reset_database():
         raise
 
 
-# SQLite 외래 키 제약 조건 활성화
+# SQLite 연결 설정 (풀에 남는 연결마다 한 번만 실행)
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",     # 쓰기 중에도 읽기 가능
+    "PRAGMA synchronous=NORMAL",   # WAL 모드에서 안전한 수준으로 fsync 횟수 감소
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",    # 페이지 캐시 약 64MB
+)
+
+
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    """SQLite 외래 키 제약 조건 활성화"""
+    """SQLite 외래 키 제약 조건 활성화 및 WAL 모드 설정"""
     if "sqlite" in str(dbapi_connection):
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+if "sqlite" in settings.database_url:
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_async_sqlite_pragma(dbapi_connection, connection_record):
+        """비동기 엔진 SQLite 연결 설정 (동기 엔진과 동일)"""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
         cursor.close()
 
 
@@ -238,7 +424,7 @@ def get_db_info():
             "total_polls": db.query(Poll).count(),
             "total_messages": db.query(ChatMessage).count(),
             "active_polls": db.query(Poll).filter(Poll.is_active == True).count(),
-            "online_users": db.query(User).filter(User.is_online == True).count(),
+            "online_users": online_users.count(db),
         }
         
         db.close()
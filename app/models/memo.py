@@ -4,29 +4,44 @@
 사용자별 개인 메모 관리
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime
-import uuid
-from ..database.base import Base
+from typing import Optional
+from ..database.base import Base, utcnow
+from ..database.ids import next_uuid_str
+from ..database.search import fts_document
 
 
 class UserMemo(Base):
     """사용자 메모 모델"""
     
     __tablename__ = "user_memos"
+    __table_args__ = (
+        # 사용자별 키셋 페이지네이션 (user_id, updated_at, id)
+        Index("ix_user_memos_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        # 사용자별 일별 집계 (user_id, created_at)
+        Index("ix_user_memos_user_id_created_at", "user_id", "created_at"),
+        # 투표별 메모 조회 (user_id, poll_id, updated_at, id)
+        Index("ix_user_memos_user_id_poll_id_updated_at_id", "user_id", "poll_id", "updated_at", "id"),
+    )
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=next_uuid_str)
     content = Column(Text, nullable=False)
     
+    # 내용에서 파생되는 값 (작성/수정 시점에 계산하여 저장)
+    content_preview = Column(String(50), nullable=False, default="")
+    word_count = Column(Integer, nullable=False, default=0)
+    character_count = Column(Integer, nullable=False, default=0)
+    
     # 관련 정보
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    poll_id = Column(String, ForeignKey("polls.id"), nullable=True)  # 투표별 메모 (선택적)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    poll_id = Column(String(36), ForeignKey("polls.id", ondelete="CASCADE"), nullable=True)  # 투표별 메모 (선택적)
     
     # 시간 정보
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # 관계 설정
     user = relationship("User", back_populates="memos")
@@ -65,30 +80,34 @@ class UserMemo(Base):
         self.content = new_content
         self.updated_at = datetime.utcnow()
     
-    @property
-    def content_preview(self) -> str:
-        """메모 내용 미리보기 (첫 50자)"""
-        if len(self.content) <= 50:
-            return self.content
-        return self.content[:47] + "..."
-    
-    @property
-    def word_count(self) -> int:
-        """단어 수 계산"""
-        return len(self.content.split())
-    
-    @property
-    def character_count(self) -> int:
-        """글자 수 계산"""
-        return len(self.content)
+    @validates("content")
+    def _sync_content_stats(self, key, content):
+        """내용 변경 시 미리보기(첫 50자), 단어 수, 글자 수 갱신"""
+        for name, value in self.content_stats(content).items():
+            setattr(self, name, value)
+        return content
+    
+    @staticmethod
+    def content_stats(content: str) -> dict:
+        """내용에서 파생되는 컬럼 값 계산 (미리보기, 단어 수, 글자 수)"""
+        return {
+            "content_preview": content if len(content) <= 50 else content[:47] + "...",
+            "word_count": len(content.split()),
+            "character_count": len(content)
+        }
     
     @property
     def is_recent(self) -> bool:
         """최근 메모 여부 (1시간 이내)"""
-        if not self.updated_at:
+        return self.is_recent_timestamp(self.updated_at)
+    
+    @staticmethod
+    def is_recent_timestamp(updated_at: Optional[datetime]) -> bool:
+        """수정 시각 기준 최근 메모 여부 (ORM 객체 없이 조회한 행에도 사용)"""
+        if not updated_at:
             return False
         
-        time_diff = datetime.utcnow() - self.updated_at
+        time_diff = datetime.utcnow() - updated_at
         return time_diff.total_seconds() < 3600  # 1시간 = 3600초
     
     @classmethod
@@ -97,9 +116,7 @@ class UserMemo(Base):
         return cls(
             user_id=user_id,
             content=content,
-            poll_id=poll_id,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            poll_id=poll_id
         )
     
     @classmethod
@@ -151,3 +168,11 @@ class UserMemo(Base):
         else:
             days = seconds // 86400
             return f"{days}일 전"
+
+
+# 메모 내용 전문 검색 인덱스 (PostgreSQL 전용, 그 외 DB는 LIKE 검색)
+Index(
+    "ix_user_memos_content_fts",
+    fts_document(UserMemo.content),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
@@ -4,12 +4,13 @@
 실시간 채팅, 시스템 메시지, 투표 알림 관리
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
 import enum
-from ..database.base import Base
+import orjson
+from ..database.base import Base, utcnow
+from ..database.ids import next_uuid_str
+from ..database.search import fts_document
 
 
 class MessageType(enum.Enum):
@@ -26,15 +27,23 @@ class ChatMessage(Base):
     """채팅 메시지 모델"""
     
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # 키셋 페이지네이션 (created_at, id)
+        Index("ix_chat_messages_created_at_id", "created_at", "id"),
+        # 유형별 목록/기록 조회 (message_type, created_at, id)
+        Index("ix_chat_messages_message_type_created_at_id", "message_type", "created_at", "id"),
+        # 사용자별 메시지 조회 (user_id, created_at)
+        Index("ix_chat_messages_user_id_created_at", "user_id", "created_at"),
+    )
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=next_uuid_str)
     message = Column(Text, nullable=False)
     message_type = Column(Enum(MessageType), default=MessageType.MESSAGE, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # 사용자 정보
-    user_id = Column(String, ForeignKey("users.id"), nullable=True)  # 시스템 메시지는 null 가능
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)  # 시스템 메시지는 null 가능
     
     # 추가 메타데이터 (JSON 형태의 추가 정보)
     message_metadata = Column(Text, nullable=True)  # JSON 문자열로 저장
@@ -65,10 +74,46 @@ class ChatMessage(Base):
         
         # 메타데이터 파싱 (JSON)
         if self.message_metadata:
-            import json
             try:
-                data["metadata"] = json.loads(self.message_metadata)
-            except json.JSONDecodeError:
+                data["metadata"] = orjson.loads(self.message_metadata)
+            except orjson.JSONDecodeError:
+                data["metadata"] = None
+        
+        return data
+    
+    @staticmethod
+    def mapping_to_dict(row) -> dict:
+        """
+        Core select 결과 행을 to_dict()와 같은 형태로 변환 (ORM 객체 생성 없이 직렬화)
+        
+        Args:
+            row: id, message, message_type, created_at, user_id, message_metadata, username 키를 가진 행
+        
+        Returns:
+            dict: 메시지 딕셔너리
+        """
+        created_at = row["created_at"].isoformat() if row["created_at"] else None
+        data = {
+            "id": row["id"],
+            "message": row["message"],
+            "type": row["message_type"].value,
+            "created_at": created_at,
+            "timestamp": created_at,
+            "user_id": row["user_id"]
+        }
+        
+        if row["username"]:
+            data["username"] = row["username"]
+        elif row["message_type"] == MessageType.SYSTEM:
+            data["username"] = "System"
+        else:
+            data["username"] = "Unknown"
+        
+        # 메타데이터 파싱 (JSON)
+        if row["message_metadata"]:
+            try:
+                data["metadata"] = orjson.loads(row["message_metadata"])
+            except orjson.JSONDecodeError:
                 data["metadata"] = None
         
         return data
@@ -79,26 +124,22 @@ class ChatMessage(Base):
         return cls(
             user_id=user_id,
             message=message,
-            message_type=MessageType.MESSAGE,
-            created_at=datetime.utcnow()
+            message_type=MessageType.MESSAGE
         )
     
     @classmethod
     def create_system_message(cls, message: str, metadata: dict = None):
         """시스템 메시지 생성"""
-        import json
         return cls(
             user_id=None,
             message=message,
             message_type=MessageType.SYSTEM,
-            message_metadata=json.dumps(metadata) if metadata else None,
-            created_at=datetime.utcnow()
+            message_metadata=orjson.dumps(metadata).decode() if metadata else None
         )
     
     @classmethod
     def create_vote_update_message(cls, poll_title: str, user_nickname: str, option_text: str):
         """투표 업데이트 메시지 생성"""
-        import json
         message = f"{user_nickname}님이 '{poll_title}' 투표에서 '{option_text}'에 투표했습니다."
         metadata = {
             "poll_title": poll_title,
@@ -110,14 +151,12 @@ class ChatMessage(Base):
             user_id=None,
             message=message,
             message_type=MessageType.VOTE_UPDATE,
-            message_metadata=json.dumps(metadata),
-            created_at=datetime.utcnow()
+            message_metadata=orjson.dumps(metadata).decode()
         )
     
     @classmethod
     def create_user_join_message(cls, user_nickname: str):
         """사용자 입장 메시지 생성"""
-        import json
         message = f"{user_nickname}님이 입장했습니다."
         metadata = {"user_nickname": user_nickname}
         
@@ -125,14 +164,12 @@ class ChatMessage(Base):
             user_id=None,
             message=message,
             message_type=MessageType.USER_JOIN,
-            message_metadata=json.dumps(metadata),
-            created_at=datetime.utcnow()
+            message_metadata=orjson.dumps(metadata).decode()
         )
     
     @classmethod
     def create_user_leave_message(cls, user_nickname: str):
         """사용자 퇴장 메시지 생성"""
-        import json
         message = f"{user_nickname}님이 퇴장했습니다."
         metadata = {"user_nickname": user_nickname}
         
@@ -140,14 +177,12 @@ class ChatMessage(Base):
             user_id=None,
             message=message,
             message_type=MessageType.USER_LEAVE,
-            message_metadata=json.dumps(metadata),
-            created_at=datetime.utcnow()
+            message_metadata=orjson.dumps(metadata).decode()
         )
     
     @classmethod
     def create_poll_created_message(cls, poll_title: str, creator_nickname: str):
         """새 투표 생성 메시지"""
-        import json
         message = f"{creator_nickname}님이 새로운 투표 '{poll_title}'를 생성했습니다."
         metadata = {
             "poll_title": poll_title,
@@ -158,8 +193,7 @@ class ChatMessage(Base):
             user_id=None,
             message=message,
             message_type=MessageType.POLL_CREATED,
-            message_metadata=json.dumps(metadata),
-            created_at=datetime.utcnow()
+            message_metadata=orjson.dumps(metadata).decode()
         )
     
     def is_user_message(self) -> bool:
@@ -181,8 +215,15 @@ class ChatMessage(Base):
         if not self.message_metadata:
             return {}
         
-        import json
         try:
-            return json.loads(self.message_metadata)
-        except json.JSONDecodeError:
+            return orjson.loads(self.message_metadata)
+        except orjson.JSONDecodeError:
             return {}
+
+
+# 채팅 메시지 전문 검색 인덱스 (PostgreSQL 전용, 그 외 DB는 LIKE 검색)
+Index(
+    "ix_chat_messages_message_fts",
+    fts_document(ChatMessage.message),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
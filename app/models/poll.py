@@ -4,36 +4,45 @@
 투표, 투표 옵션, 투표 기록 관리
 """
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, DDL, Index, event, func, select
+from sqlalchemy.orm import column_property, relationship
 from datetime import datetime
-import uuid
-from ..database.base import Base
+from ..database.base import Base, utcnow
+from ..database.ids import next_uuid_str
+from ..database.search import fts_document
+from .vote import Vote
 
 
 class Poll(Base):
     """투표 모델"""
     
     __tablename__ = "polls"
+    __table_args__ = (
+        # 키셋 페이지네이션 (created_at, id)
+        Index("ix_polls_created_at_id", "created_at", "id"),
+        # 사용자별 투표 목록 (created_by, created_at, id)
+        Index("ix_polls_created_by_created_at_id", "created_by", "created_at", "id"),
+        {"mysql_engine": "InnoDB", "mysql_row_format": "DYNAMIC"},
+    )
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=next_uuid_str)
     title = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     
     # 투표 상태
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     ends_at = Column(DateTime, nullable=True)  # 종료 시간 (선택적)
     
     # 작성자 정보
-    created_by = Column(String, ForeignKey("users.id"), nullable=False)
+    created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
     
     # 관계 설정
     creator = relationship("User", back_populates="created_polls")
     options = relationship("PollOption", back_populates="poll", cascade="all, delete-orphan")
-    votes = relationship("Vote", back_populates="poll", cascade="all, delete-orphan")
-    memos = relationship("UserMemo", back_populates="poll", cascade="all, delete-orphan")
+    votes = relationship("Vote", back_populates="poll", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    memos = relationship("UserMemo", back_populates="poll", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<Poll(id={self.id}, title={self.title}, active={self.is_active})>"
@@ -61,13 +70,7 @@ class Poll(Base):
     @property
     def total_votes(self) -> int:
         """전체 투표 수"""
-        try:
-            if not self.options:
-                return 0
-            return sum(option.vote_count for option in self.options)
-        except Exception as e:
-            print(f"Error calculating total_votes: {e}")
-            return 0
+        return sum(option.vote_count for option in self.options)
     
     @property
     def is_ended(self) -> bool:
@@ -80,10 +83,23 @@ class Poll(Base):
     
     def get_results(self) -> list:
         """투표 결과 조회"""
-        total = self.total_votes
+        return self.build_results(self.options)
+    
+    @staticmethod
+    def build_results(options) -> list:
+        """
+        옵션별 결과 목록 생성
+        
+        Args:
+            options: id, text, vote_count 속성을 가진 옵션 또는 행 목록
+        
+        Returns:
+            list: 옵션별 득표수/백분율
+        """
+        total = sum(option.vote_count for option in options)
         results = []
         
-        for option in self.options:
+        for option in options:
             percentage = (option.vote_count / total * 100) if total > 0 else 0
             results.append({
                 "id": option.id,
@@ -113,16 +129,24 @@ class PollOption(Base):
     """투표 옵션 모델"""
     
     __tablename__ = "poll_options"
+    __table_args__ = {"mysql_engine": "InnoDB", "mysql_row_format": "DYNAMIC"}
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    poll_id = Column(String, ForeignKey("polls.id"), nullable=False)
+    id = Column(String(36), primary_key=True, default=next_uuid_str)
+    poll_id = Column(String(36), ForeignKey("polls.id", ondelete="CASCADE"), nullable=False)
     text = Column(String(100), nullable=False)
-    vote_count = Column(Integer, default=0, nullable=False)
+    
+    # 득표수 (저장하지 않고 votes 테이블에서 조회 시점에 집계, (poll_id, option_id) 인덱스 사용)
+    vote_count = column_property(
+        select(func.count())
+        .where(Vote.poll_id == poll_id, Vote.option_id == id)
+        .correlate_except(Vote)
+        .scalar_subquery()
+    )
     
     # 관계 설정
     poll = relationship("Poll", back_populates="options")
-    votes = relationship("Vote", back_populates="option", cascade="all, delete-orphan")
+    votes = relationship("Vote", back_populates="option", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<PollOption(id={self.id}, text={self.text}, votes={self.vote_count})>"
@@ -138,15 +162,26 @@ class PollOption(Base):
             "votes": self.vote_count,
             "percentage": round(percentage, 1)
         }
-    
-    def increment_vote(self):
-        """투표 수 증가"""
-        self.vote_count += 1
-    
-    def decrement_vote(self):
-        """투표 수 감소 (투표 변경시)"""
-        if self.vote_count > 0:
-            self.vote_count -= 1
 
 
+# 갱신이 잦은 테이블은 페이지 여유 공간을 남겨 HOT 업데이트 유도 (PostgreSQL 전용)
+for _table in (Poll.__table__, PollOption.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL("ALTER TABLE %(fullname)s SET (fillfactor = 85)").execute_if(dialect="postgresql")
+    )
+
+
+# 투표 제목/설명 전문 검색 인덱스 (PostgreSQL 전용, 그 외 DB는 LIKE 검색)
+Index(
+    "ix_polls_title_fts",
+    fts_document(Poll.title),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
 
+Index(
+    "ix_polls_description_fts",
+    fts_document(Poll.description),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
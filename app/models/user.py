@@ -7,8 +7,8 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
-from ..database.base import Base
+from ..database.base import Base, utcnow
+from ..database.ids import next_uuid_str
 
 
 class User(Base):
@@ -17,13 +17,13 @@ class User(Base):
     __tablename__ = "users"
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    nickname = Column(String(20), nullable=False, index=True)
+    id = Column(String(36), primary_key=True, default=next_uuid_str)
+    nickname = Column(String(20), nullable=False, unique=True, index=True)
     
     # 상태 정보
     is_online = Column(Boolean, default=True, nullable=False)
-    joined_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    last_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    joined_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    last_seen = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # 추가 정보 (선택적)
     avatar_url = Column(String(255), nullable=True)
@@ -31,9 +31,9 @@ class User(Base):
     
     # 관계 설정
     created_polls = relationship("Poll", back_populates="creator", cascade="all, delete-orphan")
-    votes = relationship("Vote", back_populates="user", cascade="all, delete-orphan")
-    chat_messages = relationship("ChatMessage", back_populates="user", cascade="all, delete-orphan")
-    memos = relationship("UserMemo", back_populates="user", cascade="all, delete-orphan")
+    votes = relationship("Vote", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    chat_messages = relationship("ChatMessage", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    memos = relationship("UserMemo", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, nickname={self.nickname}, online={self.is_online})>"
@@ -75,8 +75,6 @@ class User(Base):
         """새 사용자 생성 클래스 메서드"""
         return cls(
             nickname=nickname,
-            joined_at=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
             is_online=True,
             **kwargs
         )
@@ -4,11 +4,10 @@
 사용자 투표 기록 관리
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
-from ..database.base import Base
+from ..database.base import Base, utcnow
+from ..database.ids import next_uuid_str
 
 
 class Vote(Base):
@@ -16,12 +15,13 @@ class Vote(Base):
     
     __tablename__ = "votes"
     
-    # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    poll_id = Column(String, ForeignKey("polls.id"), nullable=False)
-    option_id = Column(String, ForeignKey("poll_options.id"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 기본 정보 (내부 PK는 정수, 외부 API에는 public_id 노출)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    public_id = Column(String(36), default=next_uuid_str, unique=True, index=True, nullable=False)
+    poll_id = Column(String(36), ForeignKey("polls.id", ondelete="CASCADE"), nullable=False)
+    option_id = Column(String(36), ForeignKey("poll_options.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # 관계 설정
     poll = relationship("Poll", back_populates="votes")
@@ -30,6 +30,13 @@ class Vote(Base):
     
     # 유니크 제약 조건 (한 사용자는 한 투표에 한 번만 참여)
     __table_args__ = (
+        UniqueConstraint("poll_id", "user_id"),
+        # 최근 투표 집계 (created_at 범위 + poll_id 그룹핑을 인덱스만으로 처리)
+        Index("ix_votes_created_at_poll_id", "created_at", "poll_id"),
+        # 사용자별 참여 기록 (키셋 페이지네이션)
+        Index("ix_votes_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 옵션별 득표수 집계
+        Index("ix_votes_poll_id_option_id", "poll_id", "option_id"),
         {"sqlite_autoincrement": True},
     )
     
@@ -39,7 +46,7 @@ class Vote(Base):
     def to_dict(self):
         """딕셔너리 변환"""
         return {
-            "id": self.id,
+            "id": self.public_id,
             "poll_id": self.poll_id,
             "option_id": self.option_id,
             "user_id": self.user_id,
@@ -52,6 +59,5 @@ class Vote(Base):
         return cls(
             poll_id=poll_id,
             option_id=option_id,
-            user_id=user_id,
-            created_at=datetime.utcnow()
+            user_id=user_id
         )
@@ -27,10 +27,14 @@ from .poll import (
     PollResponse,
     PollBasicInfo,
     PollListResponse,
+    UserPollListResponse,
     VoteRequest,
     VoteResponse,
+    VoteRecordResponse,
+    VoteRecordListResponse,
     PollUpdateRequest,
     PollResultsResponse,
+    PollBulkResultsResponse,
     PollStatsResponse,
     VoteUpdateEvent,
     PollCreatedEvent,
@@ -89,10 +93,14 @@ __all__ = [
     "PollResponse",
     "PollBasicInfo",
     "PollListResponse",
+    "UserPollListResponse",
     "VoteRequest",
     "VoteResponse",
+    "VoteRecordResponse",
+    "VoteRecordListResponse",
     "PollUpdateRequest",
     "PollResultsResponse",
+    "PollBulkResultsResponse",
     "PollStatsResponse",
     "VoteUpdateEvent",
     "PollCreatedEvent",
@@ -6,7 +6,7 @@
 
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class ChatMessageCreateRequest(BaseModel):
@@ -41,22 +41,19 @@ class ChatMessageResponse(BaseModel):
     username: str
     metadata: Optional[dict] = None
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatMessageListResponse(BaseModel):
-    """채팅 메시지 목록 응답 스키마"""
+    """채팅 메시지 목록 응답 스키마 (커서 페이지네이션 목록은 total 없이 next_cursor 제공)"""
     messages: List[ChatMessageResponse]
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 50
+    next_cursor: Optional[str] = None
+    has_more: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SystemMessageCreate(BaseModel):
@@ -83,8 +80,7 @@ class ChatMessageEvent(BaseModel):
     type: str = "chat:message_received"
     message: ChatMessageResponse
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserJoinEvent(BaseModel):
@@ -94,11 +90,7 @@ class UserJoinEvent(BaseModel):
     nickname: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserLeaveEvent(BaseModel):
@@ -108,11 +100,7 @@ class UserLeaveEvent(BaseModel):
     nickname: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OnlineUsersEvent(BaseModel):
@@ -121,8 +109,7 @@ class OnlineUsersEvent(BaseModel):
     users: List[dict]  # 간소화된 사용자 정보 목록
     count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatHistoryRequest(BaseModel):
@@ -133,14 +120,18 @@ class ChatHistoryRequest(BaseModel):
         le=100,
         description="조회할 메시지 수 (1-100)"
     )
-    before_id: Optional[str] = Field(
+    cursor: Optional[str] = Field(
         None,
-        description="이 메시지 ID 이전의 메시지들 조회"
+        description="이전 응답의 next_cursor (첫 페이지는 생략)"
     )
     message_types: Optional[List[str]] = Field(
         None,
         description="조회할 메시지 유형 필터"
     )
+    include_total: bool = Field(
+        False,
+        description="필터 적용 전체 메시지 수 포함 여부"
+    )
 
 
 class ChatStatsResponse(BaseModel):
@@ -151,5 +142,4 @@ class ChatStatsResponse(BaseModel):
     most_active_user: Optional[dict] = None
     message_types_count: dict = {}
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -4,7 +4,7 @@
 사용자 메모 관련 Pydantic 모델
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import List, Optional
 from datetime import datetime
 
@@ -66,11 +66,7 @@ class MemoResponse(BaseModel):
     character_count: Optional[int] = None
     is_recent: Optional[bool] = None
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoDetailResponse(BaseModel):
@@ -92,24 +88,21 @@ class MemoDetailResponse(BaseModel):
     character_count: int
     is_recent: bool
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoListResponse(BaseModel):
-    """메모 목록 응답 스키마"""
+    """메모 목록 응답 스키마 (개수는 첫 페이지에서만 포함)"""
     memos: List[MemoResponse]
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 20
-    poll_related_count: int = 0
-    general_count: int = 0
+    poll_related_count: Optional[int] = None
+    general_count: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoQueryRequest(BaseModel):
@@ -176,8 +169,7 @@ class MemoStatsResponse(BaseModel):
     most_active_day: Optional[str] = None
     recent_memos_count: int = 0  # 최근 24시간 내 메모 수
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoSearchRequest(BaseModel):
@@ -207,6 +199,10 @@ class MemoSearchRequest(BaseModel):
         le=50,
         description="페이지당 항목 수"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="이전 응답의 next_cursor (첫 페이지는 생략)"
+    )
     
     @validator('query')
     def validate_query(cls, v):
@@ -217,15 +213,16 @@ class MemoSearchRequest(BaseModel):
 
 
 class MemoSearchResponse(BaseModel):
-    """메모 검색 응답 스키마"""
+    """메모 검색 응답 스키마 (전체 결과 수는 첫 페이지에서만 포함)"""
     results: List[MemoResponse]
-    total: int
+    total: Optional[int] = None
     query: str
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # 응답 메시지 스키마들
@@ -235,8 +232,7 @@ class MemoCreateResponse(BaseModel):
     message: str = "메모가 성공적으로 생성되었습니다"
     memo: MemoResponse
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoUpdateResponse(BaseModel):
@@ -245,8 +241,7 @@ class MemoUpdateResponse(BaseModel):
     message: str = "메모가 성공적으로 수정되었습니다"
     memo: MemoResponse
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemoDeleteResponse(BaseModel):
@@ -255,5 +250,4 @@ class MemoDeleteResponse(BaseModel):
     message: str = "메모가 성공적으로 삭제되었습니다"
     deleted_memo_id: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -4,8 +4,8 @@
 투표, 투표 옵션, 투표 결과 관련 Pydantic 모델
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, validator
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -43,8 +43,7 @@ class PollOptionResponse(BaseModel):
             percentage=option.to_dict().get('percentage', 0.0)
         )
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PollCreateRequest(BaseModel):
@@ -142,11 +141,7 @@ class PollResponse(BaseModel):
             total_votes=poll.total_votes
         )
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PollBasicInfo(BaseModel):
@@ -159,21 +154,25 @@ class PollBasicInfo(BaseModel):
     created_by: str
     total_votes: int
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PollListResponse(BaseModel):
-    """투표 목록 응답 스키마"""
+    """투표 목록 응답 스키마 (커서 페이지네이션, 개수는 첫 페이지에서만 포함)"""
     polls: List[PollResponse]
-    total: int
-    active_count: int
+    total: Optional[int] = None
+    active_count: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserPollListResponse(BaseModel):
+    """사용자 투표 목록 응답 스키마 (커서 페이지네이션)"""
+    polls: List[PollBasicInfo]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class VoteRequest(BaseModel):
@@ -191,8 +190,23 @@ class VoteResponse(BaseModel):
     vote_id: Optional[str] = None
     poll_results: Optional[List[PollOptionResponse]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class VoteRecordResponse(BaseModel):
+    """투표 참여 기록 스키마"""
+    id: str
+    poll_id: str
+    option_id: str
+    user_id: str
+    created_at: datetime
+
+
+class VoteRecordListResponse(BaseModel):
+    """투표 참여 기록 목록 응답 스키마 (커서 페이지네이션)"""
+    votes: List[VoteRecordResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class PollUpdateRequest(BaseModel):
@@ -244,11 +258,12 @@ class PollResultsResponse(BaseModel):
     created_at: datetime
     ends_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PollBulkResultsResponse(BaseModel):
+    """여러 투표 결과 일괄 조회 응답 스키마 (없는 투표 ID는 제외)"""
+    results: Dict[str, List[PollOptionResponse]]
 
 
 class PollStatsResponse(BaseModel):
@@ -259,8 +274,7 @@ class PollStatsResponse(BaseModel):
     most_popular_option: Optional[PollOptionResponse] = None
     voting_timeline: List[dict] = []  # 시간대별 투표 현황
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # WebSocket 이벤트 스키마들
@@ -272,8 +286,7 @@ class VoteUpdateEvent(BaseModel):
     total_votes: int
     voter_nickname: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PollCreatedEvent(BaseModel):
@@ -282,8 +295,7 @@ class PollCreatedEvent(BaseModel):
     poll: PollResponse
     creator_nickname: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PollClosedEvent(BaseModel):
@@ -293,5 +305,4 @@ class PollClosedEvent(BaseModel):
     poll_title: str
     final_results: List[PollOptionResponse]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
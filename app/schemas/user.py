@@ -4,56 +4,50 @@
 Pydantic 모델을 사용한 데이터 검증 및 직렬화
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
-import re
+
+from ..core.security import NICKNAME_PATTERN
+
+# 닉네임 (앞뒤 공백 제거 후 1-20자, 한글/영문/숫자/언더스코어/공백)
+# 검증은 pydantic-core에서 처리되므로 필드마다 파이썬 validator를 두지 않음
+Nickname = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    min_length=1,
+    max_length=20,
+    pattern=NICKNAME_PATTERN.pattern
+)]
+
+# 로그인 닉네임 (앞뒤 공백 제거 후 1-20자, 문자 제한 없음)
+# 문자 규칙은 가입 시에만 적용하고, 로그인은 존재하지 않는 닉네임을 조회 결과로 처리
+LoginNickname = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    min_length=1,
+    max_length=20
+)]
+
+# 아바타 URL (빈 값 또는 http(s):// 로 시작)
+AvatarUrl = Annotated[str, StringConstraints(
+    max_length=255,
+    pattern=r'^(?:https?://|\s*$)'
+)]
 
 
 class UserCreateRequest(BaseModel):
     """사용자 생성 요청 스키마"""
-    nickname: str = Field(
+    nickname: Nickname = Field(
         ...,
-        min_length=1,
-        max_length=20,
         description="사용자 닉네임 (1-20자)"
     )
-    
-    @validator('nickname')
-    def validate_nickname(cls, v):
-        """닉네임 유효성 검증"""
-        if not v or len(v.strip()) == 0:
-            raise ValueError('닉네임은 필수입니다')
-        
-        # 공백 제거
-        v = v.strip()
-        
-        # 길이 검증
-        if len(v) > 20:
-            raise ValueError('닉네임은 20자 이하여야 합니다')
-        
-        # 특수문자 제한
-        if not re.match(r'^[a-zA-Z0-9가-힣_\s]+$', v):
-            raise ValueError('닉네임에는 한글, 영문, 숫자, 언더스코어, 공백만 사용 가능합니다')
-        
-        return v
 
 
 class UserLoginRequest(BaseModel):
     """사용자 로그인 요청 스키마"""
-    nickname: str = Field(
+    nickname: LoginNickname = Field(
         ...,
-        min_length=1,
-        max_length=20,
         description="사용자 닉네임"
     )
-    
-    @validator('nickname')
-    def validate_nickname(cls, v):
-        """닉네임 유효성 검증"""
-        if not v or len(v.strip()) == 0:
-            raise ValueError('닉네임은 필수입니다')
-        return v.strip()
 
 
 class UserResponse(BaseModel):
@@ -66,11 +60,7 @@ class UserResponse(BaseModel):
     avatar_url: Optional[str] = None
     bio: Optional[str] = None
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserBasicInfo(BaseModel):
@@ -79,16 +69,13 @@ class UserBasicInfo(BaseModel):
     nickname: str
     is_online: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdateRequest(BaseModel):
     """사용자 정보 수정 요청 스키마"""
-    nickname: Optional[str] = Field(
+    nickname: Optional[Nickname] = Field(
         None,
-        min_length=1,
-        max_length=20,
         description="새 닉네임"
     )
     bio: Optional[str] = Field(
@@ -96,39 +83,17 @@ class UserUpdateRequest(BaseModel):
         max_length=200,
         description="자기소개"
     )
-    avatar_url: Optional[str] = Field(
+    avatar_url: Optional[AvatarUrl] = Field(
         None,
-        max_length=255,
         description="아바타 이미지 URL"
     )
-    
-    @validator('nickname')
-    def validate_nickname(cls, v):
-        """닉네임 유효성 검증"""
-        if v is not None:
-            v = v.strip()
-            if len(v) == 0:
-                raise ValueError('닉네임은 공백일 수 없습니다')
-            if not re.match(r'^[a-zA-Z0-9가-힣_\s]+$', v):
-                raise ValueError('닉네임에는 한글, 영문, 숫자, 언더스코어, 공백만 사용 가능합니다')
-        return v
-    
-    @validator('avatar_url')
-    def validate_avatar_url(cls, v):
-        """아바타 URL 검증"""
-        if v is not None and v.strip():
-            # 기본적인 URL 형식 검증
-            if not v.startswith(('http://', 'https://')):
-                raise ValueError('유효한 URL 형식이 아닙니다')
-        return v
 
 
 class UserStatusUpdate(BaseModel):
     """사용자 상태 업데이트 스키마"""
     is_online: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserLoginResponse(BaseModel):
@@ -139,8 +104,7 @@ class UserLoginResponse(BaseModel):
     token_type: str = "bearer"
     expires_in: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserListResponse(BaseModel):
@@ -149,8 +113,7 @@ class UserListResponse(BaseModel):
     total: int
     online_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserProfileResponse(BaseModel):
@@ -169,11 +132,7 @@ class UserProfileResponse(BaseModel):
     total_messages_sent: int = 0
     total_memos_written: int = 0
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 # 응답 메시지 스키마들
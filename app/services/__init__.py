@@ -8,10 +8,12 @@ from .user_service import UserService
 from .poll_service import PollService
 from .chat_service import ChatService
 from .memo_service import MemoService
+from .stats_service import StatsService
 
 __all__ = [
     "UserService",
     "PollService", 
     "ChatService",
-    "MemoService"
+    "MemoService",
+    "StatsService"
 ]
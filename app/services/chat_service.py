@@ -6,11 +6,31 @@
 
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, case, delete, select
+from sqlalchemy.engine import RowMapping
 from datetime import datetime, timedelta
 
+from ..core.cache import cache
+from ..database.pagination import keyset_page, keyset_rows
+from ..database.search import text_search_filter
 from ..models.message import ChatMessage, MessageType
 from ..models.user import User
+from ..utils.constants import CacheKeys, STATS_CACHE_TTL
+
+
+# 메시지 유형 값 목록 (유형별 개수 기본값)
+_MESSAGE_TYPE_VALUES = tuple(message_type.value for message_type in MessageType)
+
+# 읽기 전용 목록에서 조회할 컬럼 (ChatMessage.mapping_to_dict 입력 형태)
+_MESSAGE_COLUMNS = (
+    ChatMessage.id,
+    ChatMessage.message,
+    ChatMessage.message_type,
+    ChatMessage.created_at,
+    ChatMessage.user_id,
+    ChatMessage.message_metadata,
+    User.nickname.label("username"),
+)
 
 
 class ChatService:
@@ -18,100 +38,168 @@ class ChatService:
     
     def __init__(self, db: Session):
         self.db = db
+        self._pending: List[ChatMessage] = []
+    
+    def create_messages_bulk(self, messages: List[ChatMessage]) -> List[ChatMessage]:
+        """
+        여러 메시지를 한 번의 커밋으로 저장
+        
+        Args:
+            messages: 저장할 메시지 객체 목록
+        
+        Returns:
+            List[ChatMessage]: 저장된 메시지 목록
+        """
+        if not messages:
+            return messages
+        
+        self.db.add_all(messages)
+        self.db.flush()
+        message_ids = [message.id for message in messages]
+        self.db.commit()
+        
+        # 커밋으로 만료된 속성을 메시지별 refresh 대신 한 번의 조회로 다시 채움
+        self.db.query(ChatMessage)\
+               .filter(ChatMessage.id.in_(message_ids))\
+               .all()
+        
+        return messages
+    
+    def flush_pending(self) -> List[ChatMessage]:
+        """
+        commit=False로 생성해 둔 메시지들을 한 번에 커밋
+        
+        Returns:
+            List[ChatMessage]: 저장된 메시지 목록
+        """
+        pending, self._pending = self._pending, []
+        return self.create_messages_bulk(pending)
+    
+    def _persist(self, message: ChatMessage, commit: bool) -> ChatMessage:
+        """메시지 저장 (commit=False면 flush_pending 호출 시까지 보류)"""
+        if commit:
+            self.create_messages_bulk([message])
+        else:
+            self.db.add(message)
+            self._pending.append(message)
+        return message
     
-    def create_user_message(self, user_id: str, message: str) -> ChatMessage:
+    def create_user_message(self, user_id: str, message: str, commit: bool = True) -> ChatMessage:
         """
         사용자 채팅 메시지 생성
         
         Args:
             user_id: 사용자 ID
             message: 메시지 내용
+            commit: 즉시 커밋 여부 (False면 flush_pending에서 일괄 커밋)
         
         Returns:
             ChatMessage: 생성된 메시지 객체
         """
         new_message = ChatMessage.create_user_message(user_id, message)
-        self.db.add(new_message)
-        self.db.commit()
-        self.db.refresh(new_message)
-        return new_message
+        return self._persist(new_message, commit)
     
-    def create_system_message(self, message: str, metadata: Dict[str, Any] = None) -> ChatMessage:
+    def create_system_message(
+        self, 
+        message: str, 
+        metadata: Dict[str, Any] = None, 
+        commit: bool = True
+    ) -> ChatMessage:
         """
         시스템 메시지 생성
         
         Args:
             message: 메시지 내용
             metadata: 추가 메타데이터
+            commit: 즉시 커밋 여부 (False면 flush_pending에서 일괄 커밋)
         
         Returns:
             ChatMessage: 생성된 시스템 메시지 객체
         """
         system_message = ChatMessage.create_system_message(message, metadata)
-        self.db.add(system_message)
-        self.db.commit()
-        self.db.refresh(system_message)
-        return system_message
+        return self._persist(system_message, commit)
     
     def get_messages_list(
         self, 
-        page: int = 1, 
         per_page: int = 50,
-        message_type: Optional[MessageType] = None
+        message_type: Optional[MessageType] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
-        채팅 메시지 목록 조회
+        채팅 메시지 목록 조회 (최신순, 커서 페이지네이션)
         
         Args:
-            page: 페이지 번호
             per_page: 페이지당 항목 수
             message_type: 메시지 유형 필터
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            include_total: 전체 개수 조회 여부 (무한 스크롤에서는 불필요)
         
         Returns:
-            Dict[str, Any]: 메시지 목록 및 통계
+            Dict[str, Any]: 메시지 행 목록(작성자 닉네임 포함) 및 통계
         """
-        offset = (page - 1) * per_page
-        
-        query = self.db.query(ChatMessage).order_by(desc(ChatMessage.created_at))
+        query = self._message_row_query()
         
         if message_type:
             query = query.filter(ChatMessage.message_type == message_type)
         
-        total = query.count()
-        messages = query.offset(offset).limit(per_page).all()
+        total = None
+        if include_total:
+            total = query.with_entities(func.count(ChatMessage.id)).scalar()
+        
+        rows, next_cursor = keyset_page(
+            query, ChatMessage.created_at, ChatMessage.id, per_page, cursor
+        )
         
         return {
-            "messages": messages,
+            "messages": [row._mapping for row in rows],
             "total": total,
-            "page": page,
             "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
         }
     
-    def get_recent_messages(self, limit: int = 50) -> List[ChatMessage]:
+    def get_recent_messages(self, limit: int = 50) -> List[RowMapping]:
         """
-        최근 채팅 메시지 조회
+        최근 채팅 메시지 조회 (읽기 전용, ORM 객체 생성 없이 행 매핑으로 반환)
         
         Args:
             limit: 조회할 메시지 수
         
         Returns:
-            List[ChatMessage]: 최근 메시지 목록
+            List[RowMapping]: 최근 메시지 목록 (작성자 닉네임 포함)
         """
-        return self.db.query(ChatMessage)\
-                     .order_by(desc(ChatMessage.created_at))\
-                     .limit(limit)\
-                     .all()
+        return self.db.execute(
+            self._message_rows()
+            .order_by(desc(ChatMessage.created_at), desc(ChatMessage.id))
+            .limit(limit)
+        ).mappings().all()
     
     def get_message_by_id(self, message_id: str) -> Optional[ChatMessage]:
         """메시지 ID로 조회"""
-        return self.db.query(ChatMessage).filter(ChatMessage.id == message_id).first()
+        return self.db.get(ChatMessage, message_id)
     
     def delete_message(self, message: ChatMessage):
         """메시지 삭제"""
         self.db.delete(message)
         self.db.commit()
     
+    def delete_message_by_id(self, message_id: str, commit: bool = True) -> bool:
+        """
+        메시지 ID로 삭제 (객체 로드 없이 DELETE 한 번)
+        
+        Args:
+            message_id: 메시지 ID
+            commit: False이면 커밋하지 않음 (여러 건 삭제 후 호출자가 한 번에 커밋)
+        
+        Returns:
+            bool: 삭제 여부
+        """
+        result = self.db.execute(delete(ChatMessage).where(ChatMessage.id == message_id))
+        if commit:
+            self.db.commit()
+        return result.rowcount > 0
+    
     def get_chat_stats(self) -> Dict[str, Any]:
         """
         채팅 통계 조회
@@ -119,73 +207,86 @@ class ChatService:
         Returns:
             Dict[str, Any]: 채팅 통계 정보
         """
-        # 전체 메시지 수
-        total_messages = self.db.query(ChatMessage).count()
-        
-        # 최근 24시간 내 활성 사용자
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        active_users = self.db.query(ChatMessage.user_id)\
-                             .filter(ChatMessage.created_at >= yesterday)\
-                             .filter(ChatMessage.user_id.isnot(None))\
-                             .distinct().count()
-        
-        # 오늘 메시지 수
-        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        messages_today = self.db.query(ChatMessage)\
-                               .filter(ChatMessage.created_at >= today)\
-                               .count()
-        
-        # 가장 활발한 사용자
-        most_active_user = None
-        user_message_count = self.db.query(
-            ChatMessage.user_id,
+        # 전체/오늘/최근 24시간 활성 사용자 수 (모니터링 값이므로 짧게 캐시)
+        counts = cache.get_or_set(CacheKeys.CHAT_STATS, self._get_chat_counts, STATS_CACHE_TTL)
+        
+        # 가장 활발한 사용자 (내부 조인으로 사용자 정보까지 한 번에 조회)
+        top_user = self.db.query(
+            User.id,
+            User.nickname,
             func.count(ChatMessage.id).label('message_count')
-        ).filter(ChatMessage.user_id.isnot(None))\
-         .group_by(ChatMessage.user_id)\
+        ).join(ChatMessage, ChatMessage.user_id == User.id)\
+         .group_by(User.id, User.nickname)\
          .order_by(desc('message_count'))\
          .first()
         
-        if user_message_count:
-            user = self.db.query(User).filter(User.id == user_message_count.user_id).first()
-            if user:
-                most_active_user = {
-                    "user_id": user.id,
-                    "nickname": user.nickname,
-                    "message_count": user_message_count.message_count
-                }
+        most_active_user = {
+            "user_id": top_user.id,
+            "nickname": top_user.nickname,
+            "message_count": top_user.message_count
+        } if top_user else None
         
         # 메시지 유형별 개수
-        message_types_count = {}
-        for message_type in MessageType:
-            count = self.db.query(ChatMessage)\
-                          .filter(ChatMessage.message_type == message_type)\
-                          .count()
-            message_types_count[message_type.value] = count
+        rows = self.db.query(ChatMessage.message_type, func.count(ChatMessage.id))\
+                      .group_by(ChatMessage.message_type)\
+                      .all()
+        message_types_count = dict.fromkeys(_MESSAGE_TYPE_VALUES, 0)
+        message_types_count.update({message_type.value: count for message_type, count in rows})
         
         return {
-            "total_messages": total_messages,
-            "active_users": active_users,
-            "messages_today": messages_today,
+            "total_messages": counts["total_messages"],
+            "active_users": counts["active_users"],
+            "messages_today": counts["messages_today"],
             "most_active_user": most_active_user,
             "message_types_count": message_types_count
         }
     
-    def get_user_messages(self, user_id: str, limit: int = 100) -> List[ChatMessage]:
+    def _get_chat_counts(self) -> Dict[str, int]:
+        """전체 메시지 수, 오늘 메시지 수, 최근 24시간 활성 사용자 수를 한 번에 집계"""
+        now = datetime.utcnow()
+        yesterday = now - timedelta(days=1)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        row = self.db.query(
+            func.count(ChatMessage.id).label('total_messages'),
+            func.count(case((ChatMessage.created_at >= today, 1))).label('messages_today'),
+            func.count(func.distinct(
+                case((ChatMessage.created_at >= yesterday, ChatMessage.user_id))
+            )).label('active_users')
+        ).one()
+        
+        return {
+            "total_messages": row.total_messages,
+            "messages_today": row.messages_today,
+            "active_users": row.active_users
+        }
+    
+    def get_user_messages(self, user_id: str, limit: int = 100) -> List[RowMapping]:
         """
-        특정 사용자의 메시지 조회
+        특정 사용자의 메시지 조회 (읽기 전용, 행 매핑으로 반환)
         
         Args:
             user_id: 사용자 ID
             limit: 조회할 메시지 수
         
         Returns:
-            List[ChatMessage]: 사용자 메시지 목록
+            List[RowMapping]: 사용자 메시지 목록
         """
-        return self.db.query(ChatMessage)\
-                     .filter(ChatMessage.user_id == user_id)\
-                     .order_by(desc(ChatMessage.created_at))\
-                     .limit(limit)\
-                     .all()
+        return self.db.execute(
+            self._message_rows()
+            .where(ChatMessage.user_id == user_id)
+            .order_by(desc(ChatMessage.created_at), desc(ChatMessage.id))
+            .limit(limit)
+        ).mappings().all()
+    
+    @staticmethod
+    def _message_rows():
+        """읽기 전용 메시지 목록용 select (작성자 닉네임 LEFT OUTER JOIN)"""
+        return select(*_MESSAGE_COLUMNS).outerjoin(User, ChatMessage.user_id == User.id)
+    
+    def _message_row_query(self):
+        """_message_rows()와 같은 컬럼/조인의 세션 쿼리 (keyset_page 입력용)"""
+        return self.db.query(*_MESSAGE_COLUMNS).outerjoin(User, ChatMessage.user_id == User.id)
     
     def search_messages(self, query: str, limit: int = 50) -> List[ChatMessage]:
         """
@@ -199,75 +300,80 @@ class ChatService:
             List[ChatMessage]: 검색된 메시지 목록
         """
         return self.db.query(ChatMessage)\
-                     .filter(ChatMessage.message.contains(query))\
+                     .filter(text_search_filter(self.db, ChatMessage.message, query))\
                      .order_by(desc(ChatMessage.created_at))\
                      .limit(limit)\
                      .all()
     
     def get_message_history(
         self, 
-        before_id: Optional[str] = None,
+        cursor: Optional[str] = None,
         message_types: Optional[List[MessageType]] = None,
-        limit: int = 50
-    ) -> List[ChatMessage]:
+        limit: int = 50,
+        include_total: bool = False
+    ) -> Dict[str, Any]:
         """
-        채팅 기록 조회 (고급 필터링)
+        채팅 기록 조회 (고급 필터링, 읽기 전용 행 매핑으로 반환)
         
         Args:
-            before_id: 이 메시지 ID 이전의 메시지들
+            cursor: 이 커서 이전의 메시지들 (이전 조회의 next_cursor)
             message_types: 메시지 유형 필터
             limit: 결과 제한
+            include_total: 필터 적용 전체 개수 조회 여부
         
         Returns:
-            List[ChatMessage]: 필터링된 메시지 목록
+            Dict[str, Any]: 필터링된 메시지 행 목록(작성자 닉네임 포함), 전체 개수 및 다음 커서
         """
-        query = self.db.query(ChatMessage)
-        
-        # before_id 필터
-        if before_id:
-            before_message = self.get_message_by_id(before_id)
-            if before_message:
-                query = query.filter(ChatMessage.created_at < before_message.created_at)
+        conditions = []
         
         # 메시지 유형 필터
         if message_types:
-            query = query.filter(ChatMessage.message_type.in_(message_types))
+            conditions.append(ChatMessage.message_type.in_(message_types))
+        
+        total = None
+        if include_total:
+            total = self.db.scalar(select(func.count(ChatMessage.id)).where(*conditions))
+        
+        rows, next_cursor = keyset_rows(
+            self.db,
+            self._message_rows().where(*conditions),
+            ChatMessage.created_at,
+            ChatMessage.id,
+            limit,
+            cursor
+        )
         
-        return query.order_by(desc(ChatMessage.created_at))\
-                   .limit(limit)\
-                   .all()
+        return {
+            "messages": rows,
+            "total": total,
+            "next_cursor": next_cursor
+        }
     
-    def create_vote_update_message(self, poll_title: str, user_nickname: str, option_text: str) -> ChatMessage:
+    def create_vote_update_message(
+        self, 
+        poll_title: str, 
+        user_nickname: str, 
+        option_text: str, 
+        commit: bool = True
+    ) -> ChatMessage:
         """투표 업데이트 시스템 메시지 생성"""
         message = ChatMessage.create_vote_update_message(poll_title, user_nickname, option_text)
-        self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
-        return message
+        return self._persist(message, commit)
     
-    def create_user_join_message(self, user_nickname: str) -> ChatMessage:
+    def create_user_join_message(self, user_nickname: str, commit: bool = True) -> ChatMessage:
         """사용자 입장 시스템 메시지 생성"""
         message = ChatMessage.create_user_join_message(user_nickname)
-        self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
-        return message
+        return self._persist(message, commit)
     
-    def create_user_leave_message(self, user_nickname: str) -> ChatMessage:
+    def create_user_leave_message(self, user_nickname: str, commit: bool = True) -> ChatMessage:
         """사용자 퇴장 시스템 메시지 생성"""
         message = ChatMessage.create_user_leave_message(user_nickname)
-        self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
-        return message
+        return self._persist(message, commit)
     
-    def create_poll_created_message(self, poll_title: str, creator_nickname: str) -> ChatMessage:
+    def create_poll_created_message(self, poll_title: str, creator_nickname: str, commit: bool = True) -> ChatMessage:
         """새 투표 생성 시스템 메시지 생성"""
         message = ChatMessage.create_poll_created_message(poll_title, creator_nickname)
-        self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
-        return message
+        return self._persist(message, commit)
     
     def get_daily_message_stats(self, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -4,21 +4,50 @@
 메모 관련 비즈니스 로직 처리
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_, or_
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Sequence
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import desc, func, and_, or_, case, delete, select, update
+from sqlalchemy.engine import RowMapping
 from datetime import datetime, timedelta
 
+from ..core.cache import cache
+from ..database.pagination import keyset_page
+from ..database.search import text_search_filter
 from ..models.memo import UserMemo
 from ..models.poll import Poll
 from ..models.user import User
+from ..utils.constants import CacheKeys, DatabaseConfig, STATS_CACHE_TTL
+
+
+# 읽기 전용 목록에서 조회할 컬럼 (MemoResponse 필드와 동일, is_recent 제외)
+_MEMO_COLUMNS = (
+    UserMemo.id,
+    UserMemo.content,
+    UserMemo.user_id,
+    UserMemo.poll_id,
+    UserMemo.created_at,
+    UserMemo.updated_at,
+    UserMemo.content_preview,
+    UserMemo.word_count,
+    UserMemo.character_count,
+)
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+    """시퀀스를 size 크기 단위로 분할"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class MemoService:
     """메모 서비스 클래스"""
     
+    # 일별 집계를 미리 구해 두는 기간 (통계/활동 요약 공용)
+    DAILY_AGGREGATE_DAYS = 30
+    
     def __init__(self, db: Session):
         self.db = db
+        self._agg_cache: Dict[str, List[Dict[str, Any]]] = {}
     
     def create_memo(
         self, 
@@ -39,7 +68,7 @@ class MemoService:
         """
         # 투표 ID가 있으면 투표 존재 확인
         if poll_id:
-            poll = self.db.query(Poll).filter(Poll.id == poll_id).first()
+            poll = self.db.get(Poll, poll_id)
             if not poll:
                 raise Exception("해당 투표를 찾을 수 없습니다")
         
@@ -53,6 +82,8 @@ class MemoService:
         self.db.commit()
         self.db.refresh(new_memo)
         
+        cache.delete(CacheKeys.MEMO_STATS.format(user_id=user_id))
+        
         return new_memo
     
     def get_memo_by_id(self, memo_id: str, user_id: str) -> Optional[UserMemo]:
@@ -66,10 +97,11 @@ class MemoService:
         Returns:
             Optional[UserMemo]: 메모 객체 또는 None
         """
-        return self.db.query(UserMemo).filter(
-            UserMemo.id == memo_id,
-            UserMemo.user_id == user_id
-        ).first()
+        # 식별자 맵에 이미 로드된 메모는 SQL 없이 반환됨
+        memo = self.db.get(UserMemo, memo_id)
+        if memo is None or memo.user_id != user_id:
+            return None
+        return memo
     
     def get_user_memos(
         self, 
@@ -78,18 +110,25 @@ class MemoService:
         per_page: int = 20,
         poll_id: Optional[str] = None,
         sort_by: str = "updated_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
         사용자 메모 목록 조회
         
+        시각 기준 정렬(created_at, updated_at)은 커서 페이지네이션을,
+        그 외 정렬 기준은 페이지 번호 기반 조회를 사용합니다.
+        
         Args:
             user_id: 사용자 ID
-            page: 페이지 번호
+            page: 페이지 번호 (시각 외 정렬 기준일 때 사용)
             per_page: 페이지당 항목 수
             poll_id: 특정 투표 필터 (선택적)
             sort_by: 정렬 기준
             sort_order: 정렬 순서
+            cursor: 이전 페이지의 next_cursor (시각 기준 정렬일 때 사용)
+            include_total: 전체/투표 관련/일반 메모 개수 조회 여부
         
         Returns:
             Dict[str, Any]: 메모 목록 및 통계
@@ -101,27 +140,35 @@ class MemoService:
         if poll_id:
             query = query.filter(UserMemo.poll_id == poll_id)
         
-        # 전체 개수
-        total = query.count()
-        
-        # 투표 관련/일반 메모 개수
-        poll_related_count = self.db.query(UserMemo)\
-                                  .filter(UserMemo.user_id == user_id)\
-                                  .filter(UserMemo.poll_id.isnot(None))\
-                                  .count()
-        general_count = total - poll_related_count
-        
-        # 정렬 적용
-        if hasattr(UserMemo, sort_by):
-            if sort_order.lower() == "asc":
-                query = query.order_by(getattr(UserMemo, sort_by))
+        total = poll_related_count = general_count = None
+        if include_total:
+            if poll_id:
+                # 특정 투표로 필터링된 경우 모두 투표 관련 메모
+                total = query.with_entities(func.count(UserMemo.id)).scalar()
+                poll_related_count = total
             else:
-                query = query.order_by(desc(getattr(UserMemo, sort_by)))
+                # 전체/투표 관련 메모 개수를 한 번의 조건부 집계로 조회
+                total, poll_related_count = query.with_entities(
+                    func.count(UserMemo.id),
+                    func.count(case((UserMemo.poll_id.isnot(None), 1)))
+                ).one()
+            general_count = total - poll_related_count
+        
+        # 정렬 및 페이지네이션 적용
+        if not hasattr(UserMemo, sort_by):
+            sort_by = "updated_at"
+        descending = sort_order.lower() != "asc"
+        
+        next_cursor = None
+        if sort_by in ("created_at", "updated_at"):
+            memos, next_cursor = keyset_page(
+                query, getattr(UserMemo, sort_by), UserMemo.id, per_page, cursor,
+                descending=descending
+            )
         else:
-            query = query.order_by(desc(UserMemo.updated_at))
-        
-        # 페이지네이션
-        memos = query.offset(offset).limit(per_page).all()
+            sort_column = getattr(UserMemo, sort_by)
+            query = query.order_by(desc(sort_column) if descending else sort_column)
+            memos = query.offset(offset).limit(per_page).all()
         
         return {
             "memos": memos,
@@ -130,7 +177,9 @@ class MemoService:
             "general_count": general_count,
             "page": page,
             "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page
+            "total_pages": (total + per_page - 1) // per_page if total is not None else None,
+            "next_cursor": next_cursor,
+            "has_more": len(memos) == per_page
         }
     
     def update_memo(self, memo: UserMemo, content: str) -> UserMemo:
@@ -147,56 +196,83 @@ class MemoService:
         memo.update_content(content)
         self.db.commit()
         self.db.refresh(memo)
+        cache.delete(CacheKeys.MEMO_STATS.format(user_id=memo.user_id))
         return memo
     
     def delete_memo(self, memo: UserMemo):
         """메모 삭제"""
+        user_id = memo.user_id
         self.db.delete(memo)
         self.db.commit()
+        cache.delete(CacheKeys.MEMO_STATS.format(user_id=user_id))
+    
+    def delete_memo_by_id(self, memo_id: str, user_id: str, commit: bool = True) -> bool:
+        """
+        메모 ID로 삭제 (소유권 조건을 포함한 DELETE 한 번, 객체 로드 없음)
+        
+        Args:
+            memo_id: 메모 ID
+            user_id: 사용자 ID
+            commit: False이면 커밋하지 않음 (여러 건 삭제 후 호출자가 한 번에 커밋하고
+                메모 통계 캐시도 커밋 후 호출자가 삭제)
+        
+        Returns:
+            bool: 삭제 여부 (없거나 다른 사용자의 메모이면 False)
+        """
+        result = self.db.execute(
+            delete(UserMemo).where(UserMemo.id == memo_id, UserMemo.user_id == user_id)
+        )
+        if commit:
+            self.db.commit()
+            # 커밋 전에 삭제하면 다른 요청이 이전 상태로 캐시를 다시 채울 수 있음
+            cache.delete(CacheKeys.MEMO_STATS.format(user_id=user_id))
+        return result.rowcount > 0
     
     def search_memos(
         self, 
         user_id: str,
         query: str,
-        page: int = 1,
         per_page: int = 20,
-        poll_id: Optional[str] = None
+        poll_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
-        메모 검색
+        메모 검색 (최근 수정순, 커서 페이지네이션)
         
         Args:
             user_id: 사용자 ID
             query: 검색 쿼리
-            page: 페이지 번호
             per_page: 페이지당 항목 수
             poll_id: 특정 투표 필터 (선택적)
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            include_total: 전체 검색 결과 수 조회 여부
         
         Returns:
             Dict[str, Any]: 검색 결과
         """
-        offset = (page - 1) * per_page
-        
         db_query = self.db.query(UserMemo)\
                          .filter(UserMemo.user_id == user_id)\
-                         .filter(UserMemo.content.contains(query))
+                         .filter(text_search_filter(self.db, UserMemo.content, query))
         
         if poll_id:
             db_query = db_query.filter(UserMemo.poll_id == poll_id)
         
-        total = db_query.count()
-        memos = db_query.order_by(desc(UserMemo.updated_at))\
-                       .offset(offset)\
-                       .limit(per_page)\
-                       .all()
+        total = None
+        if include_total:
+            total = db_query.with_entities(func.count(UserMemo.id)).scalar()
+        
+        memos, next_cursor = keyset_page(
+            db_query, UserMemo.updated_at, UserMemo.id, per_page, cursor
+        )
         
         return {
             "results": memos,
             "total": total,
             "query": query,
-            "page": page,
             "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
         }
     
     def get_memo_stats(self, user_id: str) -> Dict[str, Any]:
@@ -209,92 +285,109 @@ class MemoService:
         Returns:
             Dict[str, Any]: 메모 통계
         """
-        # 전체 메모 수
-        total_memos = self.db.query(UserMemo)\
-                           .filter(UserMemo.user_id == user_id)\
-                           .count()
-        
-        # 투표 관련 메모 수
-        poll_related_memos = self.db.query(UserMemo)\
-                                  .filter(UserMemo.user_id == user_id)\
-                                  .filter(UserMemo.poll_id.isnot(None))\
-                                  .count()
-        
-        # 일반 메모 수
-        general_memos = total_memos - poll_related_memos
-        
-        # 총 단어/글자 수
-        memos = self.db.query(UserMemo)\
-                     .filter(UserMemo.user_id == user_id)\
-                     .all()
+        # 생성/수정/삭제 시 무효화되는 짧은 캐시
+        return cache.get_or_set(
+            CacheKeys.MEMO_STATS.format(user_id=user_id),
+            lambda: self._query_memo_stats(user_id),
+            STATS_CACHE_TTL
+        )
+    
+    def _query_memo_stats(self, user_id: str) -> Dict[str, Any]:
+        """메모 통계 집계 (합계 쿼리 1회 + 공용 일별 집계)"""
+        yesterday = datetime.utcnow() - timedelta(days=1)
         
-        total_words = sum(memo.word_count for memo in memos)
-        total_characters = sum(memo.character_count for memo in memos)
+        row = self.db.query(
+            func.count(UserMemo.id).label('total_memos'),
+            func.count(case((UserMemo.poll_id.isnot(None), 1))).label('poll_related_memos'),
+            func.coalesce(func.sum(UserMemo.word_count), 0).label('total_words'),
+            func.coalesce(func.sum(UserMemo.character_count), 0).label('total_characters'),
+            func.count(case((UserMemo.created_at >= yesterday, 1))).label('recent_memos_count')
+        ).filter(UserMemo.user_id == user_id).one()
         
         # 가장 활발한 날 (최근 30일)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        daily_counts = self.db.query(
-            func.date(UserMemo.created_at).label('date'),
-            func.count(UserMemo.id).label('count')
-        ).filter(
-            UserMemo.user_id == user_id,
-            UserMemo.created_at >= thirty_days_ago
-        ).group_by(func.date(UserMemo.created_at))\
-         .order_by(desc('count'))\
-         .first()
-        
-        most_active_day = daily_counts.date.strftime('%Y-%m-%d') if daily_counts else None
-        
-        # 최근 24시간 메모 수
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_memos_count = self.db.query(UserMemo)\
-                                  .filter(UserMemo.user_id == user_id)\
-                                  .filter(UserMemo.created_at >= yesterday)\
-                                  .count()
+        daily = self._aggregates(user_id)
+        most_active = max(daily, key=lambda day: day["memo_count"]) if daily else None
         
         return {
-            "total_memos": total_memos,
-            "poll_related_memos": poll_related_memos,
-            "general_memos": general_memos,
-            "total_words": total_words,
-            "total_characters": total_characters,
-            "most_active_day": most_active_day,
-            "recent_memos_count": recent_memos_count
+            "total_memos": row.total_memos,
+            "poll_related_memos": row.poll_related_memos,
+            "general_memos": row.total_memos - row.poll_related_memos,
+            "total_words": row.total_words,
+            "total_characters": row.total_characters,
+            "most_active_day": most_active["date"] if most_active else None,
+            "recent_memos_count": row.recent_memos_count
         }
     
-    def get_poll_memos(self, user_id: str, poll_id: str) -> List[UserMemo]:
+    def _aggregates(self, user_id: str) -> List[Dict[str, Any]]:
+        """최근 DAILY_AGGREGATE_DAYS일 일별 집계 (서비스 인스턴스 단위로 메모이즈)"""
+        if user_id not in self._agg_cache:
+            self._agg_cache[user_id] = self._query_daily_aggregates(user_id, self.DAILY_AGGREGATE_DAYS)
+        return self._agg_cache[user_id]
+    
+    def _query_daily_aggregates(self, user_id: str, days: int) -> List[Dict[str, Any]]:
+        """일별 메모 수 및 글자 수 집계 (날짜순)"""
+        start_date = datetime.utcnow() - timedelta(days=days)
+        memo_date = func.date(UserMemo.created_at)
+        
+        daily_stats = self.db.query(
+            memo_date.label('date'),
+            func.count(UserMemo.id).label('memo_count'),
+            func.sum(UserMemo.character_count).label('total_characters')
+        ).filter(
+            UserMemo.user_id == user_id,
+            UserMemo.created_at >= start_date
+        ).group_by(memo_date)\
+         .order_by(memo_date)\
+         .all()
+        
+        return [
+            {
+                # SQLite는 DATE()를 문자열로, PostgreSQL은 date로 반환
+                "date": str(stat.date),
+                "memo_count": stat.memo_count,
+                "total_characters": stat.total_characters or 0
+            }
+            for stat in daily_stats
+        ]
+    
+    def get_poll_memos(self, user_id: str, poll_id: str, stream: bool = False) -> Iterable[RowMapping]:
         """
-        특정 투표의 사용자 메모 조회
+        특정 투표의 사용자 메모 조회 (읽기 전용, ORM 객체 생성 없이 행 매핑으로 반환)
         
         Args:
             user_id: 사용자 ID
             poll_id: 투표 ID
+            stream: True이면 전체 결과를 리스트로 만들지 않고 나눠서 가져오는 이터레이터 반환
         
         Returns:
-            List[UserMemo]: 투표 관련 메모 목록
+            Iterable[RowMapping]: 투표 관련 메모 목록
         """
-        return self.db.query(UserMemo)\
-                     .filter(UserMemo.user_id == user_id)\
-                     .filter(UserMemo.poll_id == poll_id)\
-                     .order_by(desc(UserMemo.updated_at))\
-                     .all()
+        stmt = select(*_MEMO_COLUMNS)\
+            .where(UserMemo.user_id == user_id, UserMemo.poll_id == poll_id)\
+            .order_by(desc(UserMemo.updated_at))
+        
+        if stream:
+            stmt = stmt.execution_options(yield_per=DatabaseConfig.YIELD_PER)
+            return self.db.execute(stmt).mappings()
+        return self.db.execute(stmt).mappings().all()
     
-    def get_recent_memos(self, user_id: str, limit: int = 10) -> List[UserMemo]:
+    def get_recent_memos(self, user_id: str, limit: int = 10) -> List[RowMapping]:
         """
-        최근 메모 목록 조회
+        최근 메모 목록 조회 (읽기 전용, 행 매핑으로 반환)
         
         Args:
             user_id: 사용자 ID
             limit: 조회할 메모 수
         
         Returns:
-            List[UserMemo]: 최근 메모 목록
+            List[RowMapping]: 최근 메모 목록
         """
-        return self.db.query(UserMemo)\
-                     .filter(UserMemo.user_id == user_id)\
-                     .order_by(desc(UserMemo.updated_at))\
-                     .limit(limit)\
-                     .all()
+        return self.db.execute(
+            select(*_MEMO_COLUMNS)
+            .where(UserMemo.user_id == user_id)
+            .order_by(desc(UserMemo.updated_at))
+            .limit(limit)
+        ).mappings().all()
     
     def get_memo_activity_summary(self, user_id: str, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -307,27 +400,11 @@ class MemoService:
         Returns:
             List[Dict[str, Any]]: 일별 메모 활동
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-        
-        daily_stats = self.db.query(
-            func.date(UserMemo.created_at).label('date'),
-            func.count(UserMemo.id).label('memo_count'),
-            func.sum(func.length(UserMemo.content)).label('total_characters')
-        ).filter(
-            UserMemo.user_id == user_id,
-            UserMemo.created_at >= start_date
-        ).group_by(func.date(UserMemo.created_at))\
-         .order_by('date')\
-         .all()
+        if days > self.DAILY_AGGREGATE_DAYS:
+            return self._query_daily_aggregates(user_id, days)
         
-        return [
-            {
-                "date": stat.date.strftime('%Y-%m-%d'),
-                "memo_count": stat.memo_count,
-                "total_characters": stat.total_characters or 0
-            }
-            for stat in daily_stats
-        ]
+        start_date = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
+        return [day for day in self._aggregates(user_id) if day["date"] >= start_date]
     
     def get_memo_with_relations(self, memo_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -344,8 +421,8 @@ class MemoService:
         if not memo:
             return None
         
-        # 사용자 정보
-        user = self.db.query(User).filter(User.id == user_id).first()
+        # 사용자 정보 (필요한 컬럼만 로드)
+        user = self.db.get(User, user_id, options=[load_only(User.id, User.nickname)])
         user_info = {
             "id": user.id,
             "nickname": user.nickname
@@ -354,7 +431,7 @@ class MemoService:
         # 투표 정보
         poll_info = None
         if memo.poll_id:
-            poll = self.db.query(Poll).filter(Poll.id == memo.poll_id).first()
+            poll = self.db.get(Poll, memo.poll_id, options=[load_only(Poll.id, Poll.title)])
             if poll:
                 poll_info = {
                     "id": poll.id,
@@ -378,37 +455,69 @@ class MemoService:
         Returns:
             int: 삭제된 메모 수
         """
-        deleted_count = self.db.query(UserMemo)\
-                             .filter(
-                                 UserMemo.user_id == user_id,
-                                 UserMemo.id.in_(memo_ids)
-                             ).delete(synchronize_session=False)
+        deleted_count = 0
+        
+        # ID 목록을 나눠 Core DELETE 실행 (바인딩 파라미터 한도 및 세션 동기화 회피)
+        for chunk in _chunks(memo_ids, DatabaseConfig.IN_CLAUSE_CHUNK_SIZE):
+            result = self.db.execute(
+                delete(UserMemo)
+                .where(UserMemo.user_id == user_id, UserMemo.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            deleted_count += result.rowcount
         
         self.db.commit()
+        cache.delete(CacheKeys.MEMO_STATS.format(user_id=user_id))
         return deleted_count
     
-    def export_user_memos(self, user_id: str) -> List[Dict[str, Any]]:
+    def backfill_content_stats(self) -> int:
+        """
+        파생 컬럼(미리보기, 단어 수, 글자 수)이 비어 있는 메모 일괄 재계산
+        컬럼 추가 이전에 저장된 메모를 위한 1회성 작업 (수정 시각은 유지)
+        
+        Returns:
+            int: 갱신된 메모 수
+        """
+        updated_count = 0
+        
+        while True:
+            rows = self.db.execute(
+                select(UserMemo.id, UserMemo.content, UserMemo.updated_at)
+                .where(UserMemo.character_count == 0, func.length(UserMemo.content) > 0)
+                .limit(DatabaseConfig.YIELD_PER)
+            ).all()
+            if not rows:
+                break
+            
+            # 기본 키 기준 일괄 UPDATE (updated_at을 그대로 넘겨 onupdate 갱신 방지)
+            self.db.execute(update(UserMemo), [
+                {"id": row.id, "updated_at": row.updated_at, **UserMemo.content_stats(row.content)}
+                for row in rows
+            ])
+            self.db.commit()
+            updated_count += len(rows)
+        
+        return updated_count
+    
+    def export_user_memos(self, user_id: str) -> Iterator[Dict[str, Any]]:
         """
-        사용자 메모 내보내기 (전체)
+        사용자 메모 내보내기 (전체, 스트리밍)
         
         Args:
             user_id: 사용자 ID
         
         Returns:
-            List[Dict[str, Any]]: 모든 메모 데이터
+            Iterator[Dict[str, Any]]: 메모 데이터를 한 건씩 생성하는 이터레이터
         """
-        memos = self.db.query(UserMemo)\
+        # 투표 제목은 LEFT OUTER JOIN으로 함께 조회 (메모별 추가 쿼리 방지)
+        rows = self.db.query(UserMemo, Poll.title)\
+                     .outerjoin(Poll, UserMemo.poll_id == Poll.id)\
                      .filter(UserMemo.user_id == user_id)\
                      .order_by(UserMemo.created_at)\
-                     .all()
+                     .yield_per(DatabaseConfig.YIELD_PER)
         
-        export_data = []
-        for memo in memos:
-            poll_title = None
-            if memo.poll_id and memo.poll:
-                poll_title = memo.poll.title
-            
-            export_data.append({
+        for memo, poll_title in rows:
+            yield {
                 "id": memo.id,
                 "content": memo.content,
                 "poll_id": memo.poll_id,
@@ -417,6 +526,4 @@ class MemoService:
                 "updated_at": memo.updated_at.isoformat(),
                 "word_count": memo.word_count,
                 "character_count": memo.character_count
-            })
-        
-        return export_data
+            }
@@ -5,12 +5,27 @@
 """
 
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from datetime import datetime
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import desc, func, case, insert, select
+from datetime import datetime, timedelta
 
-from ..models.poll import Poll, PollOption, Vote
+from ..core.cache import cache, shared_cache
+from ..database.pagination import keyset_page
+from ..database.search import text_search_filter
+from ..models.poll import Poll, PollOption
+from ..models.vote import Vote
 from ..models.user import User
+from ..utils.constants import CacheKeys, POLL_RESULTS_CACHE_TTL, TRENDING_POLLS_CACHE_TTL
+
+
+# 목록 조회용 로더 옵션 (옵션은 IN 쿼리 한 번으로 일괄 로드, 그 외 관계의 지연 로드 SQL은 금지)
+POLL_LIST_LOAD_OPTIONS = (selectinload(Poll.options), raiseload("*", sql_only=True))
+
+# 목록 행마다 붙는 전체 개수 / 활성 개수 윈도 함수 컬럼 (LIMIT 적용 전 집합 기준)
+POLL_COUNT_COLUMNS = (
+    func.count().over().label("total"),
+    func.sum(case((Poll.is_active == True, 1), else_=0)).over().label("active_count"),
+)
 
 
 class PollService:
@@ -50,65 +65,73 @@ class PollService:
         )
         
         self.db.add(poll)
-        self.db.commit()
-        self.db.refresh(poll)
+        self.db.flush([poll])
         
-        # 투표 옵션 생성
-        for option_text in options:
-            option = PollOption(
-                poll_id=poll.id,
-                text=option_text
-            )
-            self.db.add(option)
+        # 투표 옵션 생성 (한 번의 다중 행 INSERT, 투표와 같은 트랜잭션으로 커밋)
+        self.db.execute(
+            insert(PollOption),
+            [{"poll_id": poll.id, "text": option_text} for option_text in options]
+        )
         
         self.db.commit()
-        self.db.refresh(poll)
         
         return poll
     
     def get_poll_by_id(self, poll_id: str) -> Optional[Poll]:
         """투표 ID로 조회"""
-        return self.db.query(Poll).filter(Poll.id == poll_id).first()
+        return self.db.get(Poll, poll_id)
     
     def get_polls_list(
         self, 
-        page: int = 1, 
         per_page: int = 20, 
-        active_only: bool = False
+        active_only: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
-        투표 목록 조회
+        투표 목록 조회 (최신순, 커서 페이지네이션)
         
         Args:
-            page: 페이지 번호
             per_page: 페이지당 항목 수
             active_only: 활성 투표만 조회 여부
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            include_total: 전체/활성 투표 수 조회 여부 (첫 페이지에서만 필요)
         
         Returns:
             Dict[str, Any]: 투표 목록 및 통계
         """
-        offset = (page - 1) * per_page
-        
-        query = self.db.query(Poll)
+        query = self.db.query(Poll).options(*POLL_LIST_LOAD_OPTIONS)
         
         if active_only:
             query = query.filter(Poll.is_active == True)
         
-        total = query.count()
-        active_count = self.db.query(Poll).filter(Poll.is_active == True).count()
+        total = active_count = None
+        if include_total and not cursor:
+            # 첫 페이지: 전체/활성 개수를 윈도 함수로 페이지 조회에 함께 실어 한 번에 조회
+            rows, next_cursor = keyset_page(
+                query.add_columns(*POLL_COUNT_COLUMNS),
+                Poll.created_at, Poll.id, per_page
+            )
+            polls = [row[0] for row in rows]
+            total, active_count = (rows[0][1], rows[0][2]) if rows else (0, 0)
+        else:
+            if include_total:
+                total, active_count = self.db.query(
+                    func.count(Poll.id),
+                    func.count(case((Poll.is_active == True, 1)))
+                ).one()
+            polls, next_cursor = keyset_page(query, Poll.created_at, Poll.id, per_page, cursor)
         
-        polls = query.order_by(desc(Poll.created_at))\
-                    .offset(offset)\
-                    .limit(per_page)\
-                    .all()
+        if active_only and total is not None:
+            total = active_count
         
         return {
             "polls": polls,
             "total": total,
             "active_count": active_count,
-            "page": page,
             "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
         }
     
     def vote_on_poll(self, poll_id: str, option_id: str, user_id: str) -> Dict[str, Any]:
@@ -131,12 +154,8 @@ class PollService:
         if not poll.is_active or poll.is_ended:
             raise Exception("종료된 투표에는 참여할 수 없습니다")
         
-        option = self.db.query(PollOption).filter(
-            PollOption.id == option_id,
-            PollOption.poll_id == poll_id
-        ).first()
-        
-        if not option:
+        # 옵션 검증 (결과 계산에도 쓰이는 poll.options에서 확인)
+        if option_id not in {option.id for option in poll.options}:
             raise Exception("투표 옵션을 찾을 수 없습니다")
         
         # 기존 투표 확인
@@ -147,42 +166,64 @@ class PollService:
         
         if existing_vote:
             # 기존 투표 변경
-            old_option = self.db.query(PollOption).filter(
-                PollOption.id == existing_vote.option_id
-            ).first()
-            
-            if old_option:
-                old_option.decrement_vote()
-            
-            existing_vote.option_id = option_id
-            option.increment_vote()
-            
+            vote = self.change_vote(existing_vote, option_id)
             message = "투표가 변경되었습니다"
-            vote_id = existing_vote.id
         else:
             # 새 투표 생성
-            new_vote = Vote.create_vote(
-                poll_id=poll_id,
-                option_id=option_id,
-                user_id=user_id
-            )
-            
-            self.db.add(new_vote)
-            option.increment_vote()
-            
+            vote = self.record_vote(poll_id, option_id, user_id)
             message = "투표가 완료되었습니다"
-            vote_id = new_vote.id
         
+        vote_id = vote.public_id
         self.db.commit()
-        self.db.refresh(poll)
         
         return {
             "success": True,
             "message": message,
             "vote_id": vote_id,
-            "poll_results": poll.get_results()
+            "poll_results": self.refresh_cached_results(poll_id)
         }
     
+    def record_vote(self, poll_id: str, option_id: str, user_id: str) -> Vote:
+        """
+        새 투표 기록
+        
+        득표수는 votes 테이블에서 조회 시점에 집계하므로 별도로 갱신하지 않습니다.
+        옵션이 해당 투표에 속하는지는 호출자가 확인합니다.
+        
+        Args:
+            poll_id: 투표 ID
+            option_id: 선택한 옵션 ID
+            user_id: 투표자 ID
+        
+        Returns:
+            Vote: 생성된 투표 기록 (커밋은 호출자가 수행)
+        
+        Raises:
+            IntegrityError: 이미 해당 투표에 참여한 사용자인 경우
+        """
+        vote = Vote.create_vote(poll_id=poll_id, option_id=option_id, user_id=user_id)
+        self.db.add(vote)
+        self.db.flush([vote])
+        
+        return vote
+    
+    def change_vote(self, vote: Vote, option_id: str) -> Vote:
+        """
+        기존 투표의 선택 옵션 변경
+        
+        옵션이 해당 투표에 속하는지는 호출자가 확인합니다.
+        
+        Args:
+            vote: 기존 투표 기록
+            option_id: 새로 선택한 옵션 ID
+        
+        Returns:
+            Vote: 변경된 투표 기록 (커밋은 호출자가 수행)
+        """
+        vote.option_id = option_id
+        
+        return vote
+    
     def update_poll(self, poll: Poll, **update_data) -> Poll:
         """
         투표 정보 업데이트
@@ -206,6 +247,7 @@ class PollService:
         """투표 삭제"""
         self.db.delete(poll)
         self.db.commit()
+        shared_cache.delete(CacheKeys.POLL_RESULTS.format(poll_id=poll.id))
     
     def close_poll(self, poll: Poll) -> Poll:
         """투표 종료"""
@@ -224,55 +266,108 @@ class PollService:
         Returns:
             Dict[str, Any]: 투표 통계
         """
-        # 고유 투표자 수
-        unique_voters = self.db.query(Vote.user_id)\
-                              .filter(Vote.poll_id == poll.id)\
-                              .distinct().count()
+        # 옵션별 득표수 집계 (votes 테이블 GROUP BY)
+        counts = select(
+            Vote.option_id,
+            func.count().label('votes')
+        ).where(Vote.poll_id == poll.id)\
+         .group_by(Vote.option_id)\
+         .subquery()
+        
+        votes = func.coalesce(counts.c.votes, 0)
+        unique_voters = select(func.count(func.distinct(Vote.user_id)))\
+                            .where(Vote.poll_id == poll.id)\
+                            .scalar_subquery()
+        
+        # 최다 득표 옵션 한 행에 전체 합계/옵션 수/고유 투표자 수를 함께 조회 (윈도우 함수는 LIMIT 전에 계산됨)
+        row = self.db.execute(
+            select(
+                PollOption.id,
+                PollOption.text,
+                votes.label('votes'),
+                func.coalesce(func.sum(votes).over(), 0).label('total_votes'),
+                func.count().over().label('options_count'),
+                unique_voters.label('unique_voters')
+            ).outerjoin(counts, counts.c.option_id == PollOption.id)
+             .where(PollOption.poll_id == poll.id)
+             .order_by(desc('votes'), PollOption.id)
+             .limit(1)
+        ).first()
         
-        # 가장 인기 있는 옵션
         most_popular_option = None
-        if poll.options:
-            most_popular = max(poll.options, key=lambda opt: opt.vote_count)
-            if most_popular.vote_count > 0:
-                most_popular_option = most_popular.to_dict()
+        if row is not None and row.votes > 0:
+            most_popular_option = {
+                "id": row.id,
+                "text": row.text,
+                "votes": row.votes,
+                "percentage": round(row.votes / row.total_votes * 100, 1)
+            }
         
         return {
             "poll_id": poll.id,
-            "total_votes": poll.total_votes,
-            "unique_voters": unique_voters,
+            "total_votes": row.total_votes if row is not None else 0,
+            "unique_voters": row.unique_voters if row is not None else 0,
             "most_popular_option": most_popular_option,
-            "options_count": len(poll.options),
+            "options_count": row.options_count if row is not None else 0,
             "is_active": poll.is_active,
             "is_ended": poll.is_ended
         }
     
-    def get_user_polls(self, user_id: str, page: int = 1, per_page: int = 20) -> List[Poll]:
+    def get_user_polls(
+        self, 
+        user_id: str, 
+        per_page: int = 20, 
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        사용자가 생성한 투표 목록 조회
+        사용자가 생성한 투표 목록 조회 (최신순, 커서 페이지네이션)
         
         Args:
             user_id: 사용자 ID
-            page: 페이지 번호
             per_page: 페이지당 항목 수
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
         
         Returns:
-            List[Poll]: 사용자 투표 목록
+            Dict[str, Any]: 사용자 투표 목록
         """
-        offset = (page - 1) * per_page
+        query = self.db.query(Poll)\
+                      .options(*POLL_LIST_LOAD_OPTIONS)\
+                      .filter(Poll.created_by == user_id)
+        polls, next_cursor = keyset_page(query, Poll.created_at, Poll.id, per_page, cursor)
         
-        return self.db.query(Poll)\
-                     .filter(Poll.created_by == user_id)\
-                     .order_by(desc(Poll.created_at))\
-                     .offset(offset)\
-                     .limit(per_page)\
-                     .all()
+        return {
+            "polls": polls,
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
     
-    def get_user_votes(self, user_id: str) -> List[Vote]:
-        """사용자가 참여한 투표 목록 조회"""
-        return self.db.query(Vote)\
-                     .filter(Vote.user_id == user_id)\
-                     .order_by(desc(Vote.created_at))\
-                     .all()
+    def get_user_votes(
+        self, 
+        user_id: str, 
+        per_page: int = 50, 
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        사용자가 참여한 투표 기록 조회 (최신순, 커서 페이지네이션)
+        
+        Args:
+            user_id: 사용자 ID
+            per_page: 페이지당 항목 수
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+        
+        Returns:
+            Dict[str, Any]: 투표 기록 목록
+        """
+        query = self.db.query(Vote).filter(Vote.user_id == user_id)
+        votes, next_cursor = keyset_page(query, Vote.created_at, Vote.id, per_page, cursor)
+        
+        return {
+            "votes": votes,
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
     
     def check_user_voted(self, poll_id: str, user_id: str) -> Optional[Vote]:
         """사용자가 특정 투표에 참여했는지 확인"""
@@ -291,16 +386,55 @@ class PollService:
         Returns:
             Dict[str, Any]: 투표 결과
         """
+        results = self.get_cached_results(poll)
+        
         return {
             "poll_id": poll.id,
             "poll_title": poll.title,
-            "total_votes": poll.total_votes,
-            "results": poll.get_results(),
+            "total_votes": sum(result["votes"] for result in results),
+            "results": results,
             "is_active": poll.is_active,
             "created_at": poll.created_at,
             "ends_at": poll.ends_at
         }
     
+    def get_cached_results(self, poll: Poll) -> List[Dict[str, Any]]:
+        """
+        옵션별 투표 결과 조회 (워커 간 공유 캐시 적중 시 옵션/득표수 조회 없음)
+        
+        Args:
+            poll: 투표 객체
+        
+        Returns:
+            List[Dict[str, Any]]: 옵션별 결과 (호출자는 수정하지 않음)
+        """
+        return shared_cache.get_or_set(
+            CacheKeys.POLL_RESULTS.format(poll_id=poll.id),
+            poll.get_results,
+            POLL_RESULTS_CACHE_TTL
+        )
+    
+    def refresh_cached_results(self, poll_id: str) -> List[Dict[str, Any]]:
+        """
+        투표 결과 재계산 후 캐시 갱신 (투표 커밋 직후 호출)
+        
+        만료된 Poll 객체를 다시 읽지 않고 옵션/득표수만 한 번의 쿼리로 조회합니다.
+        
+        Args:
+            poll_id: 투표 ID
+        
+        Returns:
+            List[Dict[str, Any]]: 옵션별 결과
+        """
+        rows = self.db.execute(
+            select(PollOption.id, PollOption.text, PollOption.vote_count)
+            .where(PollOption.poll_id == poll_id)
+        ).all()
+        
+        results = Poll.build_results(rows)
+        shared_cache.set(CacheKeys.POLL_RESULTS.format(poll_id=poll_id), results, POLL_RESULTS_CACHE_TTL)
+        return results
+    
     def search_polls(self, query: str, limit: int = 10) -> List[Poll]:
         """
         투표 검색
@@ -313,9 +447,10 @@ class PollService:
             List[Poll]: 검색된 투표 목록
         """
         return self.db.query(Poll)\
+                     .options(*POLL_LIST_LOAD_OPTIONS)\
                      .filter(
-                         Poll.title.contains(query) | 
-                         Poll.description.contains(query)
+                         text_search_filter(self.db, Poll.title, query) | 
+                         text_search_filter(self.db, Poll.description, query)
                      )\
                      .order_by(desc(Poll.created_at))\
                      .limit(limit)\
@@ -331,25 +466,35 @@ class PollService:
         Returns:
             List[Poll]: 인기 투표 목록
         """
-        from datetime import timedelta
+        # 순위(투표 ID 목록)만 짧게 캐시하고, 적중 시 기본 키 조회로 투표를 로드
+        cache_key = CacheKeys.TRENDING_POLLS.format(limit=limit)
+        poll_ids = cache.get(cache_key)
+        if poll_ids is not None:
+            polls_by_id = {
+                poll.id: poll
+                for poll in self.db.query(Poll)
+                                   .options(*POLL_LIST_LOAD_OPTIONS)
+                                   .filter(Poll.id.in_(poll_ids))
+            }
+            return [polls_by_id[poll_id] for poll_id in poll_ids if poll_id in polls_by_id]
         
         # 최근 24시간 내 투표가 많은 순으로 정렬
         yesterday = datetime.utcnow() - timedelta(days=1)
         
-        poll_vote_counts = self.db.query(
-            Poll.id,
+        recent_votes = select(
+            Vote.poll_id,
             func.count(Vote.id).label('recent_votes')
-        ).join(Vote)\
-         .filter(Vote.created_at >= yesterday)\
-         .group_by(Poll.id)\
-         .order_by(desc('recent_votes'))\
-         .limit(limit)\
-         .all()
-        
-        # 투표 객체들 조회
-        poll_ids = [poll_id for poll_id, _ in poll_vote_counts]
-        polls = self.db.query(Poll).filter(Poll.id.in_(poll_ids)).all()
-        
-        # 원래 순서대로 정렬
-        polls_dict = {poll.id: poll for poll in polls}
-        return [polls_dict[poll_id] for poll_id in poll_ids if poll_id in polls_dict]
+        ).where(Vote.created_at >= yesterday)\
+         .group_by(Vote.poll_id)\
+         .subquery()
+        
+        # 집계 결과와 조인하여 정렬까지 한 쿼리로 처리
+        polls = self.db.query(Poll)\
+                      .join(recent_votes, Poll.id == recent_votes.c.poll_id)\
+                      .options(*POLL_LIST_LOAD_OPTIONS)\
+                      .order_by(desc(recent_votes.c.recent_votes))\
+                      .limit(limit)\
+                      .all()
+        
+        cache.set(cache_key, [poll.id for poll in polls], TRENDING_POLLS_CACHE_TTL)
+        return polls
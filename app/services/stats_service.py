@@ -0,0 +1,71 @@
+# app/services/stats_service.py
+"""
+실시간 투표 플랫폼 통계 서비스
+여러 투표에 걸친 집계 통계 처리 (관리자/대시보드용)
+"""
+
+from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+
+from ..models.poll import PollOption
+from ..models.vote import Vote
+
+
+class StatsService:
+    """통계 서비스 클래스"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_bulk_poll_results(self, poll_ids: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 투표의 옵션별 결과를 한 번의 쿼리로 계산
+        
+        투표별 합계와 백분율을 윈도우 함수로 DB에서 계산하므로
+        투표 수만큼 Poll.get_results()를 반복 호출하지 않아도 됩니다.
+        
+        Args:
+            poll_ids: 대상 투표 ID 목록 (None이면 전체 투표)
+        
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 투표 ID별 옵션 결과 목록
+        """
+        # 옵션별 득표수 (votes 테이블 GROUP BY 한 번으로 집계)
+        counts = select(
+            Vote.option_id,
+            func.count().label("vote_count")
+        ).group_by(Vote.option_id)
+        if poll_ids is not None:
+            counts = counts.where(Vote.poll_id.in_(poll_ids))
+        counts = counts.subquery()
+        
+        vote_count = func.coalesce(counts.c.vote_count, 0)
+        poll_total = func.sum(vote_count).over(partition_by=PollOption.poll_id)
+        percentage = func.coalesce(
+            vote_count * 100.0 / func.nullif(poll_total, 0),
+            0
+        )
+        
+        stmt = select(
+            PollOption.poll_id,
+            PollOption.id,
+            PollOption.text,
+            vote_count.label("vote_count"),
+            percentage.label("percentage")
+        ).outerjoin(counts, counts.c.option_id == PollOption.id)\
+         .order_by(PollOption.poll_id, PollOption.id)
+        
+        if poll_ids is not None:
+            stmt = stmt.where(PollOption.poll_id.in_(poll_ids))
+        
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.db.execute(stmt):
+            results.setdefault(row.poll_id, []).append({
+                "id": row.id,
+                "text": row.text,
+                "votes": row.vote_count,
+                "percentage": round(row.percentage, 1)
+            })
+        
+        return results
@@ -6,14 +6,39 @@
 
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from datetime import datetime, timedelta
+from sqlalchemy import func, desc, select, update
+from sqlalchemy.exc import IntegrityError
 
+from ..database.base import SessionLocal, utcnow
 from ..models.user import User
 from ..models.poll import Poll
 from ..models.vote import Vote
 from ..models.message import ChatMessage
 from ..models.memo import UserMemo
 from ..core.security import create_user_token, validate_nickname, sanitize_nickname
+from ..core.presence import online_users
+
+
+def mark_user_online(user_id: str):
+    """
+    사용자 온라인 상태 DB 반영 (응답 이후 백그라운드 작업으로 실행)
+    
+    요청 세션과 분리된 자체 세션에서 UPDATE 한 번만 실행합니다.
+    
+    Args:
+        user_id: 사용자 ID
+    """
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_online=True, last_seen=utcnow())
+        )
+        db.commit()
+    finally:
+        db.close()
 
 
 class UserService:
@@ -36,27 +61,35 @@ class UserService:
         Raises:
             ValueError: 닉네임 검증 실패
             Exception: 닉네임 중복
+            IntegrityError: 닉네임 중복 외의 제약 조건 위반
         """
         # 닉네임 정제 및 검증
         clean_nickname = sanitize_nickname(nickname)
         if not validate_nickname(clean_nickname):
             raise ValueError("유효하지 않은 닉네임입니다")
         
-        # 중복 확인
-        if self.is_nickname_taken(clean_nickname):
-            raise Exception("이미 사용 중인 닉네임입니다")
-        
-        # 사용자 생성
+        # 사용자 생성 (중복은 nickname UNIQUE 인덱스가 판정)
         user = User.create_user(nickname=clean_nickname, **kwargs)
         self.db.add(user)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            # 닉네임 UNIQUE 위반만 중복으로 판정 (롤백 후 실제 중복 여부 재확인)
+            if self.is_nickname_taken(clean_nickname):
+                raise Exception("이미 사용 중인 닉네임입니다")
+            raise
         self.db.refresh(user)
+        online_users.add(user.id)
         
         return user
     
     def authenticate_user(self, nickname: str) -> Optional[User]:
         """
-        사용자 인증 (닉네임 기반)
+        사용자 인증 (닉네임 기반, 읽기 전용)
+        
+        온라인 상태의 DB 반영은 호출자가 mark_user_online을
+        백그라운드 작업으로 예약하여 인증 경로에서 커밋하지 않습니다.
         
         Args:
             nickname: 사용자 닉네임
@@ -68,9 +101,7 @@ class UserService:
         user = self.db.query(User).filter(User.nickname == clean_nickname).first()
         
         if user:
-            # 온라인 상태 업데이트
-            user.set_online_status(True)
-            self.db.commit()
+            online_users.add(user.id)
         
         return user
     
@@ -85,16 +116,16 @@ class UserService:
         Returns:
             bool: 중복 여부
         """
-        query = self.db.query(User).filter(User.nickname == nickname)
+        query = self.db.query(User.id).filter(User.nickname == nickname)
         
         if exclude_user_id:
             query = query.filter(User.id != exclude_user_id)
         
-        return query.first() is not None
+        return self.db.query(query.exists()).scalar()
     
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """사용자 ID로 조회"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
     
     def get_user_by_nickname(self, nickname: str) -> Optional[User]:
         """닉네임으로 사용자 조회"""
@@ -140,18 +171,46 @@ class UserService:
         Returns:
             Dict[str, Any]: 사용자 통계
         """
+        counts = self._activity_counts(user.id)
+        
         stats = {
-            "total_polls_created": self.db.query(Poll).filter(Poll.created_by == user.id).count(),
-            "total_votes_cast": self.db.query(Vote).filter(Vote.user_id == user.id).count(),
-            "total_messages_sent": self.db.query(ChatMessage).filter(ChatMessage.user_id == user.id).count(),
-            "total_memos_written": self.db.query(UserMemo).filter(UserMemo.user_id == user.id).count()
+            "total_polls_created": counts.polls,
+            "total_votes_cast": counts.votes,
+            "total_messages_sent": counts.messages,
+            "total_memos_written": counts.memos
         }
         
         return stats
     
+    def _activity_counts(self, user_id: str, since: Optional[datetime] = None):
+        """
+        사용자 활동 개수 집계 (투표/참여/메시지/메모를 스칼라 서브쿼리로 한 번에 조회)
+        
+        Args:
+            user_id: 사용자 ID
+            since: 집계 시작 시각 (None이면 전체 기간)
+        
+        Returns:
+            Row: polls, votes, messages, memos 컬럼을 가진 단일 행
+        """
+        def count_of(model, owner_column):
+            conditions = [owner_column == user_id]
+            if since is not None:
+                conditions.append(model.created_at >= since)
+            return select(func.count()).select_from(model).where(*conditions).scalar_subquery()
+        
+        stmt = select(
+            count_of(Poll, Poll.created_by).label('polls'),
+            count_of(Vote, Vote.user_id).label('votes'),
+            count_of(ChatMessage, ChatMessage.user_id).label('messages'),
+            count_of(UserMemo, UserMemo.user_id).label('memos')
+        )
+        
+        return self.db.execute(stmt).one()
+    
     def get_online_users(self) -> List[User]:
-        """온라인 사용자 목록 조회"""
-        return self.db.query(User).filter(User.is_online == True).all()
+        """온라인 사용자 목록 조회 (워커 간 공유 온라인 집합 기준)"""
+        return online_users.users(self.db)
     
     def get_users_list(self, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
         """
@@ -167,7 +226,7 @@ class UserService:
         offset = (page - 1) * per_page
         
         total = self.db.query(User).count()
-        online_count = self.db.query(User).filter(User.is_online == True).count()
+        online_count = online_users.count(self.db)
         
         users = self.db.query(User)\
                      .order_by(desc(User.last_seen))\
@@ -188,11 +247,13 @@ class UserService:
         """사용자 오프라인 상태로 변경"""
         user.set_online_status(False)
         self.db.commit()
+        online_users.discard(user.id)
     
     def set_user_online(self, user: User):
         """사용자 온라인 상태로 변경"""
         user.set_online_status(True)
         self.db.commit()
+        online_users.add(user.id)
     
     def get_user_activity_summary(self, user: User) -> Dict[str, Any]:
         """
@@ -204,38 +265,23 @@ class UserService:
         Returns:
             Dict[str, Any]: 활동 요약
         """
-        from datetime import datetime, timedelta
-        
-        # 최근 7일간 활동
+        return {
+            **self._recent_activity_counts(user.id),
+            "is_active": user.is_active,
+            "last_seen": user.last_seen
+        }
+    
+    def _recent_activity_counts(self, user_id: str) -> Dict[str, int]:
+        """최근 7일간 활동 개수 집계"""
         week_ago = datetime.utcnow() - timedelta(days=7)
         
-        recent_polls = self.db.query(Poll)\
-                            .filter(Poll.created_by == user.id)\
-                            .filter(Poll.created_at >= week_ago)\
-                            .count()
-        
-        recent_votes = self.db.query(Vote)\
-                            .filter(Vote.user_id == user.id)\
-                            .filter(Vote.created_at >= week_ago)\
-                            .count()
-        
-        recent_messages = self.db.query(ChatMessage)\
-                               .filter(ChatMessage.user_id == user.id)\
-                               .filter(ChatMessage.created_at >= week_ago)\
-                               .count()
-        
-        recent_memos = self.db.query(UserMemo)\
-                            .filter(UserMemo.user_id == user.id)\
-                            .filter(UserMemo.created_at >= week_ago)\
-                            .count()
+        counts = self._activity_counts(user_id, since=week_ago)
         
         return {
-            "recent_polls": recent_polls,
-            "recent_votes": recent_votes,
-            "recent_messages": recent_messages,
-            "recent_memos": recent_memos,
-            "is_active": user.is_active,
-            "last_seen": user.last_seen
+            "recent_polls": counts.polls,
+            "recent_votes": counts.votes,
+            "recent_messages": counts.messages,
+            "recent_memos": counts.memos
         }
     
     def create_user_token(self, user: User) -> Dict[str, Any]:
@@ -4,24 +4,6 @@
 공통 유틸리티 함수들을 관리
 """
 
-from .helpers import (
-    generate_unique_id,
-    validate_email,
-    validate_url,
-    sanitize_html,
-    format_datetime,
-    calculate_percentage,
-    paginate_query,
-    create_response
-)
-
-from .validators import (
-    validate_poll_data,
-    validate_user_data,
-    validate_memo_data,
-    validate_chat_message
-)
-
 from .constants import (
     MAX_POLL_OPTIONS,
     MAX_POLL_TITLE_LENGTH,
@@ -33,22 +15,6 @@ from .constants import (
 )
 
 __all__ = [
-    # 헬퍼 함수들
-    "generate_unique_id",
-    "validate_email",
-    "validate_url", 
-    "sanitize_html",
-    "format_datetime",
-    "calculate_percentage",
-    "paginate_query",
-    "create_response",
-    
-    # 검증 함수들
-    "validate_poll_data",
-    "validate_user_data",
-    "validate_memo_data",
-    "validate_chat_message",
-    
     # 상수들
     "MAX_POLL_OPTIONS",
     "MAX_POLL_TITLE_LENGTH",
@@ -4,6 +4,9 @@
 애플리케이션 전체에서 사용되는 상수들을 정의
 """
 
+import re
+from enum import StrEnum
+
 # 투표 관련 상수
 MAX_POLL_OPTIONS = 8
 MIN_POLL_OPTIONS = 2
@@ -27,21 +30,32 @@ MIN_MEMO_LENGTH = 1
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 MIN_PAGE_SIZE = 1
+MAX_BULK_RESULTS_POLLS = 50  # 결과 일괄 조회 한 번에 요청할 수 있는 투표 수
 
 # WebSocket 관련 상수
 WS_MAX_CONNECTIONS = 1000
 WS_HEARTBEAT_INTERVAL = 30  # 초
 WS_CLEANUP_INTERVAL = 300   # 초 (5분)
 WS_INACTIVE_TIMEOUT = 1800  # 초 (30분)
+WS_SEND_QUEUE_SIZE = 256  # 연결별 송신 대기열 크기 (초과 시 연결 해제)
+WS_MAX_BATCH_SIZE = 32  # 한 프레임으로 묶어 보낼 최대 메시지 수
+WS_PERSIST_FLUSH_INTERVAL = 0.2  # 초 (입장/퇴장 메시지 일괄 저장 주기)
+WS_SEND_TIMEOUT = 5  # 초 (연결별 전송 제한 시간)
 
 # 파일 업로드 관련 상수
 MAX_AVATAR_SIZE = 5 * 1024 * 1024  # 5MB
-ALLOWED_AVATAR_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+ALLOWED_AVATAR_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
 
 # 시간 관련 상수
 MAX_POLL_DURATION_DAYS = 30
 DEFAULT_TOKEN_EXPIRE_MINUTES = 30
 
+# 캐시 관련 상수
+STATS_CACHE_TTL = 30  # 초 (통계성 집계 값)
+POLL_RESULTS_CACHE_TTL = 60  # 초 (투표 결과, 투표 시 갱신, Redis 공유 캐시 사용 시)
+TRENDING_POLLS_CACHE_TTL = 30  # 초 (인기 투표 순위)
+TOKEN_CACHE_SIZE = 4096  # 서명 검증을 마친 토큰 캐시 항목 수
+
 # 응답 메시지 상수
 class ResponseMessages:
     """응답 메시지 상수 클래스"""
@@ -119,8 +133,8 @@ class HTTPStatus:
 
 
 # WebSocket 메시지 타입 상수
-class WSMessageType:
-    """WebSocket 메시지 타입 상수 클래스"""
+class WSMessageType(StrEnum):
+    """WebSocket 메시지 타입 (문자열과 그대로 비교/직렬화 가능)"""
     
     # 클라이언트 → 서버
     PING = "ping"
@@ -142,6 +156,7 @@ class WSMessageType:
     ERROR = "error"
     SYSTEM_NOTIFICATION = "system_notification"
     PERSONAL_NOTIFICATION = "personal_notification"
+    BATCH = "batch"
 
 
 # 데이터베이스 관련 상수
@@ -157,6 +172,12 @@ class DatabaseConfig:
     # 쿼리 제한
     MAX_QUERY_LIMIT = 1000
     DEFAULT_QUERY_LIMIT = 100
+    
+    # 대용량 결과 스트리밍 시 한 번에 가져올 행 수
+    YIELD_PER = 200
+    
+    # IN 절 한 번에 넣을 최대 값 수 (구버전 SQLite 바인딩 변수 한도 999 이내)
+    IN_CLAUSE_CHUNK_SIZE = 500
 
 
 # 로깅 관련 상수
@@ -177,8 +198,9 @@ class CacheKeys:
     ONLINE_USERS = "online_users"
     POLL_RESULTS = "poll_results:{poll_id}"
     USER_STATS = "user_stats:{user_id}"
-    TRENDING_POLLS = "trending_polls"
+    TRENDING_POLLS = "trending_polls:{limit}"
     CHAT_STATS = "chat_stats"
+    MEMO_STATS = "memo_stats:{user_id}"
 
 
 # 정규표현식 패턴 상수
@@ -196,6 +218,12 @@ class RegexPatterns:
     
     # UUID 패턴
     UUID = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+    
+    # 임포트 시점에 컴파일한 패턴 (호출마다 re 모듈 캐시 조회/재컴파일 없음)
+    NICKNAME_RE = re.compile(NICKNAME)
+    EMAIL_RE = re.compile(EMAIL)
+    URL_RE = re.compile(URL)
+    UUID_RE = re.compile(UUID)
 
 
 # 환경 변수 기본값
@@ -238,6 +266,7 @@ class MediaType:
     """미디어 타입 상수 클래스"""
     
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     HTML = "text/html"
     PLAIN_TEXT = "text/plain"
     FORM_DATA = "application/x-www-form-urlencoded"
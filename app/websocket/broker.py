@@ -0,0 +1,130 @@
+# app/websocket/broker.py
+"""
+실시간 투표 플랫폼 WebSocket 메시지 브로커
+Redis Pub/Sub으로 여러 워커 프로세스 간 브로드캐스트/개인 메시지 공유
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+import orjson
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "ws:broadcast"
+USER_CHANNEL_PREFIX = "ws:user:"
+
+# 구독 연결이 끊겼을 때 재연결 대기 시간 (초, 실패할 때마다 두 배)
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class RedisBroker:
+    """Redis Pub/Sub 메시지 브로커 (각 워커는 수신한 메시지를 자신의 연결에만 전달)"""
+    
+    def __init__(self, url: str):
+        self.redis = redis.from_url(url)
+        self.pubsub = self.redis.pubsub()
+        self.listener_task: Optional[asyncio.Task] = None
+    
+    async def start(
+        self,
+        on_broadcast: Callable[[str, Optional[str]], Awaitable[None]],
+        on_personal: Callable[[str, str], Awaitable[None]]
+    ):
+        """
+        채널 구독 및 수신 작업 시작
+        
+        Args:
+            on_broadcast: 브로드캐스트 수신 시 호출 (payload, exclude_user_id)
+            on_personal: 개인 메시지 수신 시 호출 (user_id, payload)
+        """
+        await self._subscribe()
+        self.listener_task = asyncio.create_task(self._listen(on_broadcast, on_personal))
+        logger.info("📡 Redis 메시지 브로커 구독 시작")
+    
+    async def _subscribe(self):
+        """브로드캐스트 채널 및 사용자별 채널 패턴 구독"""
+        await self.pubsub.subscribe(BROADCAST_CHANNEL)
+        await self.pubsub.psubscribe(f"{USER_CHANNEL_PREFIX}*")
+    
+    async def _listen(
+        self,
+        on_broadcast: Callable[[str, Optional[str]], Awaitable[None]],
+        on_personal: Callable[[str, str], Awaitable[None]]
+    ):
+        """구독 채널 메시지를 로컬 연결로 전달 (구독 연결이 끊기면 지수 백오프로 재구독)"""
+        delay = RECONNECT_INITIAL_DELAY
+        
+        while True:
+            try:
+                async for message in self.pubsub.listen():
+                    delay = RECONNECT_INITIAL_DELAY
+                    await self._dispatch(message, on_broadcast, on_personal)
+                logger.warning(f"⚠️ Redis 구독이 종료되었습니다 ({delay:.0f}초 후 재구독)")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Redis 구독 연결 끊김 ({delay:.0f}초 후 재연결): {e}")
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            
+            try:
+                await self._subscribe()
+                logger.info("📡 Redis 메시지 브로커 재구독 완료")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Redis 재구독 실패: {e}")
+    
+    async def _dispatch(
+        self,
+        message: dict,
+        on_broadcast: Callable[[str, Optional[str]], Awaitable[None]],
+        on_personal: Callable[[str, str], Awaitable[None]]
+    ):
+        """수신한 Pub/Sub 메시지 하나를 채널에 맞는 콜백으로 전달"""
+        if message["type"] not in ("message", "pmessage"):
+            return
+        
+        try:
+            channel = message["channel"].decode()
+            if channel == BROADCAST_CHANNEL:
+                envelope = orjson.loads(message["data"])
+                await on_broadcast(envelope["payload"], envelope.get("exclude_user_id"))
+            else:
+                user_id = channel[len(USER_CHANNEL_PREFIX):]
+                await on_personal(user_id, message["data"].decode())
+        except Exception as e:
+            logger.error(f"❌ 브로커 메시지 처리 실패: {e}")
+    
+    async def publish_broadcast(self, payload: str, exclude_user_id: Optional[str] = None):
+        """
+        모든 워커에 브로드캐스트 발행
+        
+        Args:
+            payload: 직렬화된 메시지
+            exclude_user_id: 제외할 사용자 ID
+        """
+        envelope = orjson.dumps({"payload": payload, "exclude_user_id": exclude_user_id})
+        await self.redis.publish(BROADCAST_CHANNEL, envelope)
+    
+    async def publish_personal(self, user_id: str, payload: str):
+        """
+        사용자 연결을 가진 워커로 개인 메시지 발행
+        
+        Args:
+            user_id: 대상 사용자 ID
+            payload: 직렬화된 메시지
+        """
+        await self.redis.publish(f"{USER_CHANNEL_PREFIX}{user_id}", payload)
+    
+    async def close(self):
+        """구독 해제 및 연결 종료"""
+        if self.listener_task and not self.listener_task.done():
+            self.listener_task.cancel()
+        await self.pubsub.aclose()
+        await self.redis.aclose()
@@ -4,20 +4,27 @@
 WebSocket 연결, 이벤트 핸들링, 실시간 통신 관리
 """
 
-import json
+import orjson
 import logging
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 from fastapi import WebSocket, WebSocketDisconnect, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from ..database.session import get_db, get_async_db
+from ..database.session import get_db, get_async_session
 from ..models.user import User
 from ..models.message import ChatMessage
 from ..core.security import extract_user_from_token
-from .manager import websocket_manager
+from ..utils.constants import WSMessageType
+from .manager import encode_message, receive_frame, websocket_manager
 
 logger = logging.getLogger(__name__)
 
+# 내용이 고정된 응답 프레임 (한 번만 직렬화)
+PONG_FRAME = encode_message({"type": "pong"})
+
 
 async def authenticate_websocket_user(
     websocket: WebSocket,
@@ -84,39 +91,24 @@ async def handle_websocket_message(
         
         logger.info(f"WebSocket 메시지 수신: {message_type} from {connection_id}")
         
-        # 메시지 유형별 처리
-        if message_type == "ping":
-            await handle_ping(websocket, connection_id)
-        
-        elif message_type == "chat_message":
-            await handle_chat_message(websocket, connection_id, data)
-        
-        elif message_type == "vote_cast":
-            await handle_vote_cast(websocket, connection_id, data)
-        
-        elif message_type == "poll_subscribe":
-            await handle_poll_subscribe(websocket, connection_id, data)
-        
-        elif message_type == "user_typing":
-            await handle_user_typing(websocket, connection_id, data)
-        
-        else:
+        # 메시지 유형별 처리 (핸들러 테이블 조회)
+        handler = MESSAGE_HANDLERS.get(message_type)
+        if handler is None:
             logger.warning(f"알 수 없는 메시지 유형: {message_type}")
             await send_error_message(websocket, "알 수 없는 메시지 유형입니다")
+            return
+        
+        await handler(websocket, connection_id, data)
     
     except Exception as e:
         logger.error(f"WebSocket 메시지 처리 오류: {e}")
         await send_error_message(websocket, "메시지 처리 중 오류가 발생했습니다")
 
 
-async def handle_ping(websocket: WebSocket, connection_id: str):
+async def handle_ping(websocket: WebSocket, connection_id: str, data: Dict[str, Any] = None):
     """핑 메시지 처리 (하트비트)"""
     try:
-        pong_message = {
-            "type": "pong",
-            "timestamp": "2025-01-16T15:30:00Z"
-        }
-        await websocket.send_text(json.dumps(pong_message))
+        await websocket.send_text(PONG_FRAME)
         
     except Exception as e:
         logger.error(f"핑 처리 오류: {e}")
@@ -137,22 +129,22 @@ async def handle_chat_message(websocket: WebSocket, connection_id: str, data: Di
             return
         
         # 데이터베이스에 메시지 저장 (비동기)
-        async for db in get_async_db():
+        async with get_async_session() as db:
             new_message = ChatMessage.create_user_message(
-                user_id=user_info["user_id"],
+                user_id=user_info.user_id,
                 message=message_text
             )
             db.add(new_message)
             await db.commit()
             await db.refresh(new_message)
             
-            # 모든 사용자에게 브로드캐스트
             broadcast_data = {
                 "type": "chat_message_received",
                 "data": new_message.to_dict()
             }
-            await websocket_manager.broadcast_message(broadcast_data)
-            break
+        
+        # 세션 반환 후 모든 사용자에게 브로드캐스트
+        await websocket_manager.broadcast_message(broadcast_data)
         
     except Exception as e:
         logger.error(f"채팅 메시지 처리 오류: {e}")
@@ -184,7 +176,7 @@ async def handle_vote_cast(websocket: WebSocket, connection_id: str, data: Dict[
                 "poll_id": poll_id
             }
         }
-        await websocket.send_text(json.dumps(response_message))
+        await websocket.send_text(encode_message(response_message))
         
     except Exception as e:
         logger.error(f"투표 처리 오류: {e}")
@@ -207,7 +199,7 @@ async def handle_poll_subscribe(websocket: WebSocket, connection_id: str, data:
                 "message": f"투표 {poll_id}의 실시간 업데이트를 구독했습니다"
             }
         }
-        await websocket.send_text(json.dumps(response_message))
+        await websocket.send_text(encode_message(response_message))
         
     except Exception as e:
         logger.error(f"투표 구독 처리 오류: {e}")
@@ -228,36 +220,58 @@ async def handle_user_typing(websocket: WebSocket, connection_id: str, data: Dic
         typing_message = {
             "type": "user_typing",
             "data": {
-                "user_id": user_info["user_id"],
-                "nickname": user_info["nickname"],
+                "user_id": user_info.user_id,
+                "nickname": user_info.nickname,
                 "is_typing": is_typing
             }
         }
         await websocket_manager.broadcast_message(
             typing_message, 
-            exclude_user_id=user_info["user_id"]
+            exclude_user_id=user_info.user_id
         )
         
     except Exception as e:
         logger.error(f"타이핑 상태 처리 오류: {e}")
 
 
+@lru_cache(maxsize=64)
+def build_error_frame(error_message: str) -> str:
+    """
+    에러 응답 프레임 직렬화 (에러 문구는 고정 문자열이므로 문구별로 캐시)
+    
+    Args:
+        error_message: 에러 메시지
+    
+    Returns:
+        str: 직렬화된 에러 응답
+    """
+    return encode_message({
+        "type": "error",
+        "data": {
+            "message": error_message
+        }
+    })
+
+
 async def send_error_message(websocket: WebSocket, error_message: str):
     """에러 메시지 전송"""
     try:
-        error_response = {
-            "type": "error",
-            "data": {
-                "message": error_message,
-                "timestamp": "2025-01-16T15:30:00Z"
-            }
-        }
-        await websocket.send_text(json.dumps(error_response))
+        await websocket.send_text(build_error_frame(error_message))
         
     except Exception as e:
         logger.error(f"에러 메시지 전송 실패: {e}")
 
 
+# 클라이언트 → 서버 메시지 유형별 핸들러
+MESSAGE_HANDLERS = {
+    WSMessageType.PING: handle_ping,
+    WSMessageType.CHAT_MESSAGE: handle_chat_message,
+    WSMessageType.VOTE_CAST: handle_vote_cast,
+    WSMessageType.POLL_SUBSCRIBE: handle_poll_subscribe,
+    WSMessageType.USER_TYPING: handle_user_typing,
+}
+
+
 def setup_websocket_events(app):
     """
     FastAPI 앱에 WebSocket 이벤트 설정
@@ -302,12 +316,15 @@ def setup_websocket_events(app):
             # 메시지 수신 루프
             while True:
                 try:
-                    # 메시지 수신 (텍스트 또는 JSON)
-                    message = await websocket.receive_text()
+                    # 메시지 수신 (텍스트 프레임 또는 JSON 바이너리 프레임)
+                    message = await receive_frame(websocket)
+                    websocket_manager.touch(connection_id)
                     
                     try:
-                        message_data = json.loads(message)
-                    except json.JSONDecodeError:
+                        message_data = orjson.loads(message)
+                    except orjson.JSONDecodeError:
+                        if isinstance(message, bytes):
+                            raise
                         # 일반 텍스트 메시지로 처리
                         message_data = {
                             "type": "chat_message",
@@ -321,7 +338,7 @@ def setup_websocket_events(app):
                     logger.info(f"🔌 WebSocket 연결 종료: {user_data['nickname']}")
                     break
                     
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"JSON 파싱 오류: {e}")
                     await send_error_message(websocket, "잘못된 메시지 형식입니다")
                     
@@ -358,12 +375,12 @@ def setup_websocket_events(app):
                 "type": "health_check",
                 "data": {
                     "status": "healthy",
-                    "timestamp": "2025-01-16T15:30:00Z",
+                    "timestamp": datetime.utcnow(),
                     "connections": stats
                 }
             }
             
-            await websocket.send_text(json.dumps(health_data))
+            await websocket.send_text(encode_message(health_data))
             await websocket.close()
             
         except Exception as e:
@@ -385,14 +402,15 @@ def setup_websocket_events(app):
             stats = websocket_manager.get_stats()
             online_users = await websocket_manager.get_online_users()
             
-            return {
+            # 응답 재인코딩 없이 orjson으로 바로 직렬화
+            return ORJSONResponse(content={
                 "success": True,
                 "data": {
                     "websocket_stats": stats,
-                    "online_users": [user.dict() for user in online_users],
-                    "timestamp": "2025-01-16T15:30:00Z"
+                    "online_users": online_users,
+                    "timestamp": datetime.utcnow()
                 }
-            }
+            })
             
         except Exception as e:
             logger.error(f"WebSocket 통계 조회 오류: {e}")
@@ -427,7 +445,7 @@ async def broadcast_system_notification(message: str, notification_type: str = "
             "data": {
                 "message": message,
                 "notification_type": notification_type,
-                "timestamp": "2025-01-16T15:30:00Z"
+                "timestamp": datetime.utcnow()
             }
         }
         await websocket_manager.broadcast_message(notification)
@@ -444,7 +462,7 @@ async def send_personal_notification(user_id: str, message: str, notification_ty
             "data": {
                 "message": message,
                 "notification_type": notification_type,
-                "timestamp": "2025-01-16T15:30:00Z"
+                "timestamp": datetime.utcnow()
             }
         }
         await websocket_manager.send_personal_message(notification, user_id)
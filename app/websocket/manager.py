@@ -5,22 +5,91 @@ WebSocket 연결, 사용자 세션, 실시간 이벤트 브로드캐스트 관
 """
 
 import asyncio
-import json
 import logging
+import time
+import uuid
+import orjson
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.session import get_async_db
+from ..core.config import settings
+from ..core.presence import online_users
+from ..database.ids import next_uuid_str
+from ..database.session import get_async_session
 from ..models.user import User
 from ..models.message import ChatMessage, MessageType
-from ..schemas.user import UserBasicInfo
 from ..schemas.chat import ChatMessageResponse
+from ..utils.constants import (
+    WS_INACTIVE_TIMEOUT, WS_MAX_BATCH_SIZE, WS_PERSIST_FLUSH_INTERVAL, WS_SEND_QUEUE_SIZE, WS_SEND_TIMEOUT
+)
 
 logger = logging.getLogger(__name__)
 
 
+def encode_message(message: dict) -> str:
+    """
+    WebSocket 메시지 JSON 직렬화 (브로드캐스트 시 연결 수와 관계없이 한 번만 수행)
+    
+    Args:
+        message: 전송할 메시지
+    
+    Returns:
+        str: JSON 문자열 (텍스트 프레임으로 전송)
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def merge_payloads(payloads: List[str]) -> str:
+    """
+    직렬화된 여러 메시지를 batch 메시지 하나로 병합 (재직렬화 없이 문자열 결합)
+    
+    Args:
+        payloads: encode_message로 직렬화한 메시지 목록
+    
+    Returns:
+        str: 메시지가 하나면 그대로, 여러 개면 {"type": "batch", "data": [...]} 문자열
+    """
+    if len(payloads) == 1:
+        return payloads[0]
+    return '{"type":"batch","data":[' + ",".join(payloads) + "]}"
+
+
+async def receive_frame(websocket: WebSocket) -> str | bytes:
+    """
+    WebSocket 프레임 수신 (텍스트/바이너리 프레임 모두 허용)
+    
+    바이너리 프레임은 문자열 변환 없이 그대로 반환하여 orjson이 바로 파싱하도록 함
+    
+    Args:
+        websocket: WebSocket 연결
+    
+    Returns:
+        str | bytes: 텍스트 프레임은 문자열, 바이너리 프레임은 바이트
+    
+    Raises:
+        WebSocketDisconnect: 연결 종료 시
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    
+    if message.get("bytes") is not None:
+        return message["bytes"]
+    return message.get("text") or ""
+
+
+@dataclass(slots=True)
+class ConnectionInfo:
+    """연결별 사용자 정보 (메시지마다 조회되므로 dict 대신 속성 접근)"""
+    
+    user_id: str
+    nickname: str
+    connected_at: float = field(default_factory=time.monotonic)  # time.monotonic 초
+
+
 class ConnectionManager:
     """WebSocket 연결 관리자"""
     
@@ -31,14 +100,21 @@ class ConnectionManager:
         # 사용자별 연결 매핑: {user_id: connection_id}
         self.user_connections: Dict[str, str] = {}
         
-        # 연결별 사용자 매핑: {connection_id: user_info}
-        self.connection_users: Dict[str, dict] = {}
+        # 연결별 사용자 매핑: {connection_id: ConnectionInfo}
+        self.connection_users: Dict[str, ConnectionInfo] = {}
         
-        # 연결별 마지막 활동 시간
-        self.last_activity: Dict[str, datetime] = {}
+        # 온라인 사용자 목록 항목 (연결/해제 시 한 항목씩 갱신): {connection_id: {"id", "nickname", "is_online"}}
+        self.online_user_entries: Dict[str, dict] = {}
+        
+        # 연결별 마지막 수신 시각 (time.monotonic 초)
+        self.last_activity: Dict[str, float] = {}
         
         # 룸별 연결 관리 (미래 확장용)
         self.rooms: Dict[str, Set[str]] = {}
+        
+        # 연결별 송신 대기열 및 전송 전담 작업: {connection_id: Queue/Task}
+        self.out_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
 
 
 class WebSocketManager:
@@ -49,13 +125,52 @@ class WebSocketManager:
         self.heartbeat_task: Optional[asyncio.Task] = None
         self.cleanup_task: Optional[asyncio.Task] = None
         
+        # 워커 간 메시지 브로커 (REDIS_URL 설정 시 start()에서 연결)
+        self.broker = None
+        
+        # 직렬화된 users_online 메시지 (온라인 사용자 목록이 바뀔 때만 다시 생성)
+        self._online_users_frame: Optional[str] = None
+        
+        # 입장/퇴장 메시지 일괄 저장 대기열 및 저장 작업
+        self.pending_messages: asyncio.Queue = asyncio.Queue()
+        self.persist_task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """메시지 브로커 연결 (REDIS_URL 설정 시 여러 워커의 연결에 브로드캐스트 공유)"""
+        if not settings.redis_url or self.broker:
+            return
+        
+        try:
+            from .broker import RedisBroker
+        except ImportError:
+            logger.warning("⚠️ redis 패키지가 없어 워커 간 브로드캐스트를 사용할 수 없습니다")
+            return
+        
+        try:
+            broker = RedisBroker(settings.redis_url)
+            await broker.start(self._local_broadcast_text, self._local_send_text)
+            broker.listener_task.add_done_callback(self._on_broker_stopped)
+            self.broker = broker
+        except Exception as e:
+            logger.error(f"❌ Redis 메시지 브로커 연결 실패 (프로세스 내 브로드캐스트만 사용): {e}")
+    
+    def _on_broker_stopped(self, task: asyncio.Task):
+        """브로커 수신 작업이 예기치 않게 종료되면 프로세스 내 전송으로 전환"""
+        if task.cancelled():
+            return
+        
+        logger.error(f"❌ Redis 메시지 브로커 수신 중단 (프로세스 내 브로드캐스트로 전환): {task.exception()}")
+        if self.broker and self.broker.listener_task is task:
+            broker, self.broker = self.broker, None
+            asyncio.create_task(broker.close())
+        
     async def connect(self, websocket: WebSocket, user_id: str, user_nickname: str) -> str:
         """WebSocket 연결 설정"""
         try:
             await websocket.accept()
             
-            # 고유 연결 ID 생성
-            connection_id = f"{user_id}_{datetime.utcnow().timestamp()}"
+            # 고유 연결 ID 생성 (같은 초 안에 재연결해도 충돌하지 않음)
+            connection_id = uuid.uuid4().hex
             
             # 기존 연결이 있다면 해제
             if user_id in self.connection_manager.user_connections:
@@ -65,12 +180,24 @@ class WebSocketManager:
             # 새 연결 등록
             self.connection_manager.active_connections[connection_id] = websocket
             self.connection_manager.user_connections[user_id] = connection_id
-            self.connection_manager.connection_users[connection_id] = {
-                "user_id": user_id,
+            self.connection_manager.connection_users[connection_id] = ConnectionInfo(
+                user_id=user_id,
+                nickname=user_nickname
+            )
+            self.connection_manager.online_user_entries[connection_id] = {
+                "id": user_id,
                 "nickname": user_nickname,
-                "connected_at": datetime.utcnow()
+                "is_online": True
             }
-            self.connection_manager.last_activity[connection_id] = datetime.utcnow()
+            self._online_users_frame = None
+            self.connection_manager.last_activity[connection_id] = time.monotonic()
+            
+            # 송신 대기열 및 전송 전담 작업 생성
+            queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+            self.connection_manager.out_queues[connection_id] = queue
+            self.connection_manager.writer_tasks[connection_id] = asyncio.create_task(
+                self._writer_loop(connection_id, websocket, queue)
+            )
             
             logger.info(f"✅ WebSocket 연결됨: {user_nickname} (ID: {user_id})")
             
@@ -102,42 +229,40 @@ class WebSocketManager:
     async def _disconnect_by_id(self, connection_id: str, send_message: bool = True):
         """연결 ID로 연결 해제"""
         try:
-            # 연결 정보 조회
-            user_info = self.connection_manager.connection_users.get(connection_id)
+            # 연결 정보를 await 전에 한 번에 제거 (다른 작업에서 해제 중인 연결이 보이지 않도록)
+            websocket = self.connection_manager.active_connections.pop(connection_id, None)
+            if websocket is None:
+                return
             
-            if connection_id in self.connection_manager.active_connections:
-                # WebSocket 연결 해제
-                try:
-                    websocket = self.connection_manager.active_connections[connection_id]
-                    await websocket.close()
-                except:
-                    pass  # 이미 닫힌 연결일 수 있음
-                
-                # 연결 정보 삭제
-                del self.connection_manager.active_connections[connection_id]
+            user_info = self.connection_manager.connection_users.pop(connection_id, None)
+            self.connection_manager.last_activity.pop(connection_id, None)
+            self.connection_manager.online_user_entries.pop(connection_id, None)
+            self._online_users_frame = None
+            
+            # 송신 대기열 및 전송 작업 정리 (전송 작업 자신이 호출한 경우 취소하지 않음)
+            self.connection_manager.out_queues.pop(connection_id, None)
+            writer_task = self.connection_manager.writer_tasks.pop(connection_id, None)
+            if writer_task and writer_task is not asyncio.current_task():
+                writer_task.cancel()
+            
+            if user_info and self.connection_manager.user_connections.get(user_info.user_id) == connection_id:
+                del self.connection_manager.user_connections[user_info.user_id]
+            
+            # WebSocket 연결 해제
+            try:
+                await websocket.close()
+            except:
+                pass  # 이미 닫힌 연결일 수 있음
+            
+            if user_info:
+                # 사용자 오프라인 상태 업데이트
+                await self._update_user_online_status(user_info.user_id, False)
                 
-                if user_info:
-                    user_id = user_info["user_id"]
-                    user_nickname = user_info["nickname"]
-                    
-                    # 사용자 매핑 삭제
-                    if user_id in self.connection_manager.user_connections:
-                        del self.connection_manager.user_connections[user_id]
-                    
-                    # 사용자 오프라인 상태 업데이트
-                    await self._update_user_online_status(user_id, False)
-                    
-                    # 다른 사용자들에게 퇴장 알림
-                    if send_message:
-                        await self._broadcast_user_left(user_nickname)
-                    
-                    logger.info(f"🔌 WebSocket 연결 해제됨: {user_nickname} (ID: {user_id})")
+                # 다른 사용자들에게 퇴장 알림
+                if send_message:
+                    await self._broadcast_user_left(user_info.nickname)
                 
-                # 기타 정보 삭제
-                if connection_id in self.connection_manager.connection_users:
-                    del self.connection_manager.connection_users[connection_id]
-                if connection_id in self.connection_manager.last_activity:
-                    del self.connection_manager.last_activity[connection_id]
+                logger.info(f"🔌 WebSocket 연결 해제됨: {user_info.nickname} (ID: {user_info.user_id})")
                     
         except Exception as e:
             logger.error(f"❌ WebSocket 연결 해제 오류: {e}")
@@ -145,61 +270,146 @@ class WebSocketManager:
     async def send_personal_message(self, message: dict, user_id: str):
         """특정 사용자에게 개인 메시지 전송"""
         try:
-            connection_id = self.connection_manager.user_connections.get(user_id)
-            if connection_id and connection_id in self.connection_manager.active_connections:
-                websocket = self.connection_manager.active_connections[connection_id]
-                await websocket.send_text(json.dumps(message, ensure_ascii=False))
-                
-                # 활동 시간 업데이트
-                self.connection_manager.last_activity[connection_id] = datetime.utcnow()
+            payload = encode_message(message)
+            if self.broker:
+                await self.broker.publish_personal(user_id, payload)
+            else:
+                await self._local_send_text(user_id, payload)
                 
-        except WebSocketDisconnect:
-            await self._disconnect_by_id(connection_id)
         except Exception as e:
             logger.error(f"❌ 개인 메시지 전송 실패 (user_id: {user_id}): {e}")
     
+    async def _local_send_text(self, user_id: str, payload: str):
+        """
+        이 프로세스에 연결된 사용자에게 직렬화된 메시지 전송
+        
+        Args:
+            user_id: 대상 사용자 ID
+            payload: 직렬화된 메시지
+        """
+        connection_id = self.connection_manager.user_connections.get(user_id)
+        if connection_id and not self._enqueue(connection_id, payload):
+            await self._disconnect_by_id(connection_id, send_message=False)
+    
     async def broadcast_message(self, message: dict, exclude_user_id: Optional[str] = None):
         """모든 연결된 사용자에게 메시지 브로드캐스트"""
-        if not self.connection_manager.active_connections:
+        if not self.broker and not self.connection_manager.active_connections:
             return
         
-        disconnected_connections = []
+        await self.broadcast_text(encode_message(message), exclude_user_id)
+    
+    async def broadcast_text(self, payload: str, exclude_user_id: Optional[str] = None):
+        """
+        직렬화된 메시지 브로드캐스트 (브로커가 있으면 모든 워커에 발행, 없으면 이 프로세스 연결에 전송)
         
-        for connection_id, websocket in self.connection_manager.active_connections.items():
+        Args:
+            payload: encode_message로 직렬화한 메시지
+            exclude_user_id: 제외할 사용자 ID
+        """
+        if self.broker:
             try:
-                # 제외할 사용자 확인
-                user_info = self.connection_manager.connection_users.get(connection_id)
-                if user_info and exclude_user_id and user_info["user_id"] == exclude_user_id:
-                    continue
-                
-                await websocket.send_text(json.dumps(message, ensure_ascii=False))
-                
-                # 활동 시간 업데이트
-                self.connection_manager.last_activity[connection_id] = datetime.utcnow()
-                
-            except WebSocketDisconnect:
-                disconnected_connections.append(connection_id)
+                await self.broker.publish_broadcast(payload, exclude_user_id)
+                return
             except Exception as e:
-                logger.error(f"❌ 브로드캐스트 실패 (connection_id: {connection_id}): {e}")
-                disconnected_connections.append(connection_id)
+                logger.error(f"❌ 브로드캐스트 발행 실패 (프로세스 내 전송으로 대체): {e}")
+        
+        await self._local_broadcast_text(payload, exclude_user_id)
+    
+    async def _local_broadcast_text(self, payload: str, exclude_user_id: Optional[str] = None):
+        """
+        직렬화된 메시지를 이 프로세스 연결의 송신 대기열에 추가 (실제 전송은 연결별 전송 작업이 수행)
+        
+        Args:
+            payload: encode_message로 직렬화한 메시지
+            exclude_user_id: 제외할 사용자 ID
+        """
+        # 제외할 연결 ID를 한 번만 조회하고, 순회 중 연결 해제에 영향받지 않도록 스냅샷 사용
+        exclude_connection_id = (
+            self.connection_manager.user_connections.get(exclude_user_id) if exclude_user_id else None
+        )
+        queues = tuple(self.connection_manager.out_queues.items())
+        overflowed_connections = []
         
-        # 연결이 끊어진 사용자들 정리
-        for connection_id in disconnected_connections:
+        for connection_id, queue in queues:
+            if connection_id == exclude_connection_id:
+                continue
+            
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                overflowed_connections.append(connection_id)
+        
+        # 대기열이 가득 찬 느린 연결 정리
+        for connection_id in overflowed_connections:
+            logger.warning(f"⚠️ 송신 대기열 초과로 연결 해제 (connection_id: {connection_id})")
             await self._disconnect_by_id(connection_id, send_message=False)
     
-    async def get_online_users(self) -> List[UserBasicInfo]:
-        """현재 온라인 사용자 목록 조회"""
-        online_users = []
+    def touch(self, connection_id: str):
+        """
+        연결 활동 시간 갱신 (클라이언트 메시지 수신 시 호출)
+        
+        Args:
+            connection_id: 연결 ID
+        """
+        self.connection_manager.last_activity[connection_id] = time.monotonic()
+    
+    def _enqueue(self, connection_id: str, payload: str) -> bool:
+        """
+        연결의 송신 대기열에 메시지 추가
+        
+        Args:
+            connection_id: 연결 ID
+            payload: 직렬화된 메시지
+        
+        Returns:
+            bool: 추가 성공 여부 (대기열이 가득 찬 경우 False)
+        """
+        queue = self.connection_manager.out_queues.get(connection_id)
+        if queue is None:
+            return True  # 이미 정리된 연결
+        
+        try:
+            queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def _writer_loop(self, connection_id: str, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        연결별 전송 작업 (송신 대기열을 순서대로 비우며 전송, 대기 중인 메시지는 한 프레임으로 병합)
+        
+        Args:
+            connection_id: 연결 ID
+            websocket: WebSocket 연결
+            queue: 송신 대기열
+        """
+        try:
+            while True:
+                payloads = [await queue.get()]
+                while len(payloads) < WS_MAX_BATCH_SIZE and not queue.empty():
+                    payloads.append(queue.get_nowait())
+                
+                await asyncio.wait_for(
+                    websocket.send_text(merge_payloads(payloads)),
+                    timeout=WS_SEND_TIMEOUT
+                )
         
-        for connection_id, user_info in self.connection_manager.connection_users.items():
-            if connection_id in self.connection_manager.active_connections:
-                online_users.append(UserBasicInfo(
-                    id=user_info["user_id"],
-                    nickname=user_info["nickname"],
-                    is_online=True
-                ))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not isinstance(e, WebSocketDisconnect):
+                logger.error(f"❌ 메시지 전송 실패 (connection_id: {connection_id}): {e}")
+            await self._disconnect_by_id(connection_id, send_message=False)
+    
+    async def get_online_users(self) -> List[dict]:
+        """
+        현재 온라인 사용자 목록 조회 (UserBasicInfo와 같은 형태의 dict, 모델 생성 없이 바로 직렬화)
         
-        return online_users
+        Returns:
+            List[dict]: {"id", "nickname", "is_online"} 목록
+        """
+        # 연결/해제 시 갱신되는 항목을 그대로 사용 (연결 수만큼의 dict 생성 없음)
+        return list(self.connection_manager.online_user_entries.values())
     
     async def get_connection_count(self) -> int:
         """현재 연결 수 반환"""
@@ -207,8 +417,11 @@ class WebSocketManager:
     
     async def _update_user_online_status(self, user_id: str, is_online: bool):
         """사용자 온라인 상태 데이터베이스 업데이트"""
+        # 온라인 사용자 집합은 DB 반영 여부와 관계없이 연결 상태를 따름
+        await online_users.set_status_async(user_id, is_online)
+        
         try:
-            async for db in get_async_db():
+            async with get_async_session() as db:
                 # SQLAlchemy 2.0 스타일로 사용자 조회 및 업데이트
                 from sqlalchemy import select, update
                 
@@ -223,71 +436,123 @@ class WebSocketManager:
                 )
                 await db.execute(stmt)
                 await db.commit()
-                break
                 
         except Exception as e:
             logger.error(f"❌ 사용자 온라인 상태 업데이트 실패: {e}")
     
     async def _broadcast_user_joined(self, user_nickname: str):
-        """사용자 입장 알림 브로드캐스트"""
+        """사용자 입장 알림 브로드캐스트 (먼저 전송하고 저장은 일괄 저장 작업에 위임)"""
         try:
-            # 채팅 메시지 저장
-            async for db in get_async_db():
-                join_message = ChatMessage.create_user_join_message(user_nickname)
-                db.add(join_message)
-                await db.commit()
-                await db.refresh(join_message)
-                
-                # 브로드캐스트 메시지 생성
-                message = {
-                    "type": "user_joined",
-                    "data": join_message.to_dict()
-                }
-                
-                await self.broadcast_message(message)
-                break
+            join_message = self._build_chat_message(ChatMessage.create_user_join_message(user_nickname))
+            
+            message = {
+                "type": "user_joined",
+                "data": join_message.to_dict()
+            }
+            
+            await self.broadcast_message(message)
+            self._persist_later(join_message)
                 
         except Exception as e:
             logger.error(f"❌ 사용자 입장 알림 실패: {e}")
     
     async def _broadcast_user_left(self, user_nickname: str):
-        """사용자 퇴장 알림 브로드캐스트"""
+        """사용자 퇴장 알림 브로드캐스트 (먼저 전송하고 저장은 일괄 저장 작업에 위임)"""
         try:
-            # 채팅 메시지 저장
-            async for db in get_async_db():
-                leave_message = ChatMessage.create_user_leave_message(user_nickname)
-                db.add(leave_message)
-                await db.commit()
-                await db.refresh(leave_message)
+            leave_message = self._build_chat_message(ChatMessage.create_user_leave_message(user_nickname))
+            
+            message = {
+                "type": "user_left",
+                "data": leave_message.to_dict()
+            }
+            
+            await self.broadcast_message(message)
+            self._persist_later(leave_message)
                 
-                # 브로드캐스트 메시지 생성
-                message = {
-                    "type": "user_left",
-                    "data": leave_message.to_dict()
-                }
+        except Exception as e:
+            logger.error(f"❌ 사용자 퇴장 알림 실패: {e}")
+    
+    @staticmethod
+    def _build_chat_message(chat_message: ChatMessage) -> ChatMessage:
+        """
+        저장 전 메시지에 ID와 생성 시각 지정 (DB 왕복 없이 바로 직렬화 가능하도록)
+        
+        Args:
+            chat_message: 아직 저장하지 않은 채팅 메시지
+        
+        Returns:
+            ChatMessage: ID와 생성 시각이 채워진 메시지
+        """
+        chat_message.id = next_uuid_str()
+        chat_message.created_at = datetime.utcnow()
+        return chat_message
+    
+    def _persist_later(self, chat_message: ChatMessage):
+        """
+        채팅 메시지를 일괄 저장 대기열에 추가
+        
+        Args:
+            chat_message: 저장할 채팅 메시지
+        """
+        self.pending_messages.put_nowait(chat_message)
+        if not self.persist_task or self.persist_task.done():
+            self.persist_task = asyncio.create_task(self._persist_worker())
+    
+    async def _persist_worker(self):
+        """일괄 저장 워커 (대기열의 메시지를 주기마다 한 번의 커밋으로 저장)"""
+        batch = []
+        flush = None
+        try:
+            while True:
+                batch = [await self.pending_messages.get()]
+                await asyncio.sleep(WS_PERSIST_FLUSH_INTERVAL)
                 
-                await self.broadcast_message(message)
-                break
+                while not self.pending_messages.empty():
+                    batch.append(self.pending_messages.get_nowait())
                 
+                # 저장을 시작한 메시지는 batch에서 빼고, 취소되어도 커밋이 끝까지 진행되도록 보호
+                flush = asyncio.ensure_future(self._flush_chat_messages(batch))
+                batch = []
+                await asyncio.shield(flush)
+        
+        except asyncio.CancelledError:
+            # 진행 중이던 저장을 마친 뒤 아직 저장하지 않은 메시지만 저장
+            if flush and not flush.done():
+                await flush
+            while not self.pending_messages.empty():
+                batch.append(self.pending_messages.get_nowait())
+            if batch:
+                await self._flush_chat_messages(batch)
+            raise
+    
+    async def _flush_chat_messages(self, batch: List[ChatMessage]):
+        """
+        채팅 메시지 일괄 저장
+        
+        Args:
+            batch: 저장할 채팅 메시지 목록
+        """
+        try:
+            async with get_async_session() as db:
+                db.add_all(batch)
+                await db.commit()
         except Exception as e:
-            logger.error(f"❌ 사용자 퇴장 알림 실패: {e}")
+            logger.error(f"❌ 입장/퇴장 메시지 저장 실패 ({len(batch)}개): {e}")
     
     async def _send_online_users(self, connection_id: str):
-        """온라인 사용자 목록 전송"""
+        """온라인 사용자 목록 전송 (목록이 바뀌지 않았으면 직렬화된 메시지 재사용)"""
         try:
-            online_users = await self.get_online_users()
+            if self._online_users_frame is None:
+                online_users = await self.get_online_users()
+                self._online_users_frame = encode_message({
+                    "type": "users_online",
+                    "data": {
+                        "users": online_users,
+                        "count": len(online_users)
+                    }
+                })
             
-            message = {
-                "type": "users_online",
-                "data": {
-                    "users": [user.dict() for user in online_users],
-                    "count": len(online_users)
-                }
-            }
-            
-            if connection_id in self.connection_manager.active_connections:
-                websocket = self.connection_manager.active_connections[connection_id]
-                await websocket.send_text(json.dumps(message, ensure_ascii=False))
+            self._enqueue(connection_id, self._online_users_frame)
                 
         except Exception as e:
             logger.error(f"❌ 온라인 사용자 목록 전송 실패: {e}")
@@ -301,10 +566,11 @@ class WebSocketManager:
                 # 모든 연결에 핑 메시지 전송
                 ping_message = {
                     "type": "ping",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.utcnow()
                 }
                 
-                await self.broadcast_message(ping_message)
+                # 하트비트는 워커마다 실행되므로 자신의 연결에만 전송
+                await self._local_broadcast_text(encode_message(ping_message))
                 
             except Exception as e:
                 logger.error(f"❌ 하트비트 워커 오류: {e}")
@@ -316,13 +582,14 @@ class WebSocketManager:
             try:
                 await asyncio.sleep(300)  # 5분마다 실행
                 
-                current_time = datetime.utcnow()
-                inactive_connections = []
+                deadline = time.monotonic() - WS_INACTIVE_TIMEOUT
                 
-                # 30분 이상 비활성 연결 찾기
-                for connection_id, last_activity in self.connection_manager.last_activity.items():
-                    if current_time - last_activity > timedelta(minutes=30):
-                        inactive_connections.append(connection_id)
+                # 30분 이상 메시지를 보내지 않은 연결 찾기
+                inactive_connections = [
+                    connection_id
+                    for connection_id, last_activity in self.connection_manager.last_activity.items()
+                    if last_activity < deadline
+                ]
                 
                 # 비활성 연결 정리
                 for connection_id in inactive_connections:
@@ -345,11 +612,21 @@ class WebSocketManager:
             if self.cleanup_task and not self.cleanup_task.done():
                 self.cleanup_task.cancel()
             
+            # 메시지 브로커 연결 종료
+            if self.broker:
+                await self.broker.close()
+                self.broker = None
+            
             # 모든 연결 해제
             connection_ids = list(self.connection_manager.active_connections.keys())
             for connection_id in connection_ids:
                 await self._disconnect_by_id(connection_id, send_message=False)
             
+            # 대기 중인 입장/퇴장 메시지 저장 후 저장 작업 종료
+            if self.persist_task and not self.persist_task.done():
+                self.persist_task.cancel()
+                await asyncio.gather(self.persist_task, return_exceptions=True)
+            
             logger.info("🧹 WebSocket 매니저 정리 완료")
             
         except Exception as e:
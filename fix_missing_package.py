@@ -3,22 +3,15 @@
 빠른 패키지 설치 및 테스트 스크립트
 """
 
-import subprocess
-import sys
-import os
+from _bootstrap import QUICK_FIX_PACKAGES, pip_install
 
 def install_missing_package():
-    """누락된 pydantic-settings 패키지 설치"""
-    try:
-        print("📦 pydantic-settings 패키지를 설치합니다...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "pydantic-settings==2.7.0"
-        ], check=True)
-        print("✅ pydantic-settings 설치 완료")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 패키지 설치 실패: {e}")
+    """누락된 패키지(pydantic-settings, greenlet) 설치"""
+    print(f"📦 {', '.join(QUICK_FIX_PACKAGES)} 패키지를 설치합니다...")
+    if not pip_install(*QUICK_FIX_PACKAGES):
         return False
+    print("✅ 패키지 설치 완료")
+    return True
 
 def test_imports():
     """프로젝트 모듈 import 테스트"""
@@ -81,10 +74,8 @@ def main():
     print("   python start_server.py")
 
 if __name__ == "__main__":
-    # 프로젝트 루트 디렉토리로 이동
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Python 경로에 현재 디렉토리 추가
-    sys.path.insert(0, os.getcwd())
+    # 프로젝트 루트 디렉토리로 이동 및 Python 경로 추가
+    from _bootstrap import bootstrap
+    bootstrap()
     
     main()
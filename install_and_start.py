@@ -7,18 +7,15 @@ greenlet 패키지 설치 포함
 import subprocess
 import sys
 
+from _bootstrap import QUICK_FIX_PACKAGES, pip_install
+
 def install_greenlet():
-    """greenlet 패키지 설치"""
-    try:
-        print("📦 greenlet 패키지를 설치합니다...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "greenlet==3.0.3"
-        ], check=True)
-        print("✅ greenlet 패키지 설치 완료")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ greenlet 설치 실패: {e}")
+    """greenlet 패키지 설치 (자주 누락되는 패키지를 한 번의 pip 실행으로 함께 설치)"""
+    print(f"📦 {', '.join(QUICK_FIX_PACKAGES)} 패키지를 설치합니다...")
+    if not pip_install(*QUICK_FIX_PACKAGES):
         return False
+    print("✅ 패키지 설치 완료")
+    return True
 
 def start_server():
     """서버 시작"""
@@ -4,41 +4,48 @@
 FastAPI 서버 및 WebSocket 서버 실행
 """
 
+import orjson
 import uvicorn
 import asyncio
+import importlib.util
 import logging
-import logging.config
+import os
+import sys
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
+from pathlib import Path
 
-from app.core.config import settings, get_cors_origins, get_logging_config
-from app.database.session import init_db
+from app.core.config import settings, get_cors_origins, get_cors_origin_regex, get_logging_config
+from app.core.log_queue import configure_logging, start_log_listener, stop_log_listener
+from app.database.session import init_db, warm_pool, close_db
 from app.api.routes import users, polls, chat, memos
 from app.websocket.manager import websocket_manager
 from app.websocket.events import setup_websocket_events
 
 
 # 로깅 설정
-logging.config.dictConfig(get_logging_config())
+configure_logging(get_logging_config())
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
-    # 시작 시 실행
+    # 시작 시 실행 (로그 출력은 백그라운드 스레드에서 수행, fork 이후 워커마다 시작)
+    start_log_listener()
     logger.info("🚀 실시간 투표 플랫폼 백엔드 서버 시작")
     
     # 데이터베이스 초기화
     logger.info("📊 데이터베이스 초기화 중...")
     await init_db()
+    await warm_pool(settings.db_pool_size)
     logger.info("✅ 데이터베이스 초기화 완료")
     
     # WebSocket 매니저 초기화
     app.state.websocket_manager = websocket_manager
+    await websocket_manager.start()
     logger.info("🔌 WebSocket 매니저 초기화 완료")
     
     yield
@@ -47,7 +54,9 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 서버 종료 중...")
     if hasattr(app.state, 'websocket_manager'):
         await app.state.websocket_manager.cleanup()
+    await close_db()
     logger.info("👋 서버 종료 완료")
+    stop_log_listener()
 
 
 # FastAPI 애플리케이션 생성
@@ -57,14 +66,17 @@ app = FastAPI(
     description="WebSocket 기반 실시간 투표 및 채팅 플랫폼",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
-# CORS 미들웨어 설정
+# CORS 미들웨어 설정 (허용 원본은 미들웨어가 컴파일하는 정규식 하나로 판정, "*"이면 목록 그대로 사용)
+cors_origin_regex = get_cors_origin_regex()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_cors_origins(),
+    allow_origins=() if cors_origin_regex else get_cors_origins(),
+    allow_origin_regex=cors_origin_regex,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
@@ -75,9 +87,10 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """전역 예외 처리"""
+    # 트레이스백 포맷은 로그 리스너 스레드에서 수행되어 이벤트 루프를 막지 않음
     logger.error(f"글로벌 예외 발생: {exc}", exc_info=True)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -87,26 +100,32 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# 기본 라우트 응답 (프로세스 내에서 변하지 않으므로 시작 시 한 번만 직렬화)
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "message": f"🗳️ {settings.app_name} API 서버",
+    "version": settings.app_version,
+    "status": "healthy",
+    "docs": "/docs" if settings.debug else "비활성화됨"
+})
+
+HEALTH_RESPONSE_BODY = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "2025-01-16T15:30:00Z",
+    "environment": "development" if settings.debug else "production"
+})
+
+
 # 기본 라우트
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    return {
-        "message": f"🗳️ {settings.app_name} API 서버",
-        "version": settings.app_version,
-        "status": "healthy",
-        "docs": "/docs" if settings.debug else "비활성화됨"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {
-        "status": "healthy",
-        "timestamp": "2025-01-16T15:30:00Z",
-        "environment": "development" if settings.debug else "production"
-    }
+    """헬스 체크 엔드포인트 (헬스 체크 프로브가 자주 호출)"""
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 # API 라우터 등록
@@ -120,25 +139,54 @@ app.include_router(memos.router, prefix="/api/memos", tags=["memos"])
 setup_websocket_events(app)
 
 
-# 정적 파일 서빙 (개발 환경에서만)
-if settings.debug:
-    try:
-        app.mount("/static", StaticFiles(directory="static"), name="static")
-    except:
-        pass  # static 디렉토리가 없으면 무시
+# 정적 파일 서빙 (개발 환경에서만, 디렉토리 존재 여부는 시작 시 한 번만 확인)
+STATIC_DIR = Path("static")
+if settings.debug and STATIC_DIR.is_dir():
+    from fastapi.staticfiles import StaticFiles
+    
+    app.mount("/static", StaticFiles(directory=str(STATIC_DIR), check_dir=False), name="static")
 
 
 def run_server():
     """서버 실행 함수"""
-    uvicorn.run(
-        "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.reload,
-        log_level=settings.log_level.lower(),
-        access_log=settings.debug,
-        workers=1 if settings.debug else 4
-    )
+    if not settings.debug and importlib.util.find_spec("gunicorn"):
+        # 프로덕션: 앱을 한 번 로드한 뒤 워커를 fork하여 모듈/캐시를 공유 (--preload)
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn", "main:app",
+            "-k", "app.core.workers.UvicornWorker",
+            "-w", "4",
+            "--preload",
+            "--reuse-port",  # SO_REUSEPORT: 재시작 시 새 마스터가 기존 프로세스 종료를 기다리지 않고 바인딩
+            "-b", f"{settings.host}:{settings.port}",
+            "--log-level", settings.log_level.lower(),
+        ])
+    
+    # 개발 환경 또는 gunicorn 미설치 시 uvicorn 직접 실행
+    if settings.debug:
+        uvicorn.run(
+            "main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=settings.reload,
+            log_level=settings.log_level.lower(),
+            access_log=True,
+            ws_per_message_deflate=settings.ws_per_message_deflate,
+            workers=1
+        )
+    else:
+        # 프로덕션: 리로드 감시 없이 실행, 요청마다의 액세스 로그 기록 생략
+        # (loop/http는 auto로 두어 uvicorn[standard]의 uvloop/httptools 사용, 미지원 플랫폼은 asyncio로 대체)
+        uvicorn.run(
+            "main:app",
+            host=settings.host,
+            port=settings.port,
+            loop="auto",
+            http="auto",
+            log_level=settings.log_level.lower(),
+            access_log=False,
+            ws_per_message_deflate=settings.ws_per_message_deflate,
+            workers=4
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+실시간 투표 플랫폼 관리 스크립트
+설치/진단/DB 초기화/서버 실행을 한 프로세스에서 순서대로 수행
+(인터프리터 시작과 SQLAlchemy 등 무거운 import를 작업 간에 한 번만 수행)
+
+사용 예:
+    python manage.py install doctor reset start
+    python manage.py migrate backfill start
+"""
+
+import argparse
+import asyncio
+import sys
+
+from _bootstrap import bootstrap
+
+# 프로젝트 루트 디렉토리로 이동 및 Python 경로 추가
+PROJECT_ROOT = bootstrap()
+
+
+def cmd_install() -> bool:
+    """의존성 패키지 설치"""
+    from start_server import install_dependencies
+    return install_dependencies()
+
+
+def cmd_doctor() -> bool:
+    """패키지 설치 여부 및 프로젝트 모듈 import 확인"""
+    from start_server import check_packages
+    from fix_missing_package import test_imports
+    
+    print("\n📦 패키지 확인:")
+    return check_packages() and test_imports()
+
+
+def cmd_init() -> bool:
+    """데이터베이스 초기화 (기존 데이터 유지)"""
+    from fix_missing_package import init_database
+    return init_database()
+
+
+def cmd_migrate() -> bool:
+    """기존 DB를 최신 스키마로 마이그레이션 (alembic upgrade head)"""
+    from alembic import command
+    from alembic.config import Config
+    
+    command.upgrade(Config(str(PROJECT_ROOT / "alembic.ini")), "head")
+    return True
+
+
+def cmd_backfill() -> bool:
+    """마이그레이션 이전 메모의 파생 컬럼(미리보기, 단어 수, 글자 수) 채우기"""
+    from app.database.base import SessionLocal
+    from app.services.memo_service import MemoService
+    
+    db = SessionLocal()
+    try:
+        updated_count = MemoService(db).backfill_content_stats()
+    finally:
+        db.close()
+    
+    print(f"✅ 메모 {updated_count}개의 파생 컬럼을 채웠습니다")
+    return True
+
+
+def cmd_reset() -> bool:
+    """데이터베이스 파일 삭제 후 재생성"""
+    from reset_database import remove_old_database, create_new_database
+    
+    remove_old_database()
+    return asyncio.run(create_new_database())
+
+
+def cmd_start() -> bool:
+    """서버 실행 (이미 로드된 앱 모듈 재사용)"""
+    from main import run_server
+    
+    run_server()
+    return True
+
+
+COMMANDS = {
+    "install": cmd_install,
+    "doctor": cmd_doctor,
+    "init": cmd_init,
+    "migrate": cmd_migrate,
+    "backfill": cmd_backfill,
+    "reset": cmd_reset,
+    "start": cmd_start,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 투표 플랫폼 관리 스크립트")
+    parser.add_argument(
+        "commands",
+        nargs="+",
+        choices=list(COMMANDS),
+        help="순서대로 실행할 작업"
+    )
+    args = parser.parse_args()
+    
+    for name in args.commands:
+        print(f"\n▶️ {name}")
+        if not COMMANDS[name]():
+            print(f"❌ '{name}' 작업 실패로 중단합니다.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
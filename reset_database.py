@@ -22,9 +22,6 @@ def remove_old_database():
 async def create_new_database():
     """새 데이터베이스 생성"""
     try:
-        # Python 경로에 현재 디렉토리 추가
-        sys.path.insert(0, os.getcwd())
-        
         from app.database.session import init_db
         
         print("🗄️ 새 데이터베이스를 생성합니다...")
@@ -59,26 +56,37 @@ def test_server_start():
         print(f"❌ 서버 테스트 실패: {e}")
         return False
 
-def main():
+async def main():
+    """모든 단계를 하나의 이벤트 루프에서 실행 (단계마다 루프/비동기 엔진을 다시 만들지 않음)"""
     print("🔧 데이터베이스 재생성 스크립트")
     print("=" * 40)
     
-    # 1. 기존 데이터베이스 삭제
-    remove_old_database()
-    
-    # 2. 새 데이터베이스 생성
-    success = asyncio.run(create_new_database())
-    if not success:
-        return
-    
-    # 3. 서버 시작 테스트
-    if test_server_start():
-        print("\n🚀 이제 다음 명령어로 서버를 시작하세요:")
-        print("   python main.py")
-        print("\n📚 서버 주소:")
-        print("   - API: http://localhost:8000")
-        print("   - 문서: http://localhost:8000/docs")
-        print("   - WebSocket: ws://localhost:8000/ws")
+    try:
+        # 1. 기존 데이터베이스 삭제
+        remove_old_database()
+        
+        # 2. 새 데이터베이스 생성
+        success = await create_new_database()
+        if not success:
+            return
+        
+        # 3. 서버 시작 테스트
+        if test_server_start():
+            print("\n🚀 이제 다음 명령어로 서버를 시작하세요:")
+            print("   python main.py")
+            print("\n📚 서버 주소:")
+            print("   - API: http://localhost:8000")
+            print("   - 문서: http://localhost:8000/docs")
+            print("   - WebSocket: ws://localhost:8000/ws")
+    finally:
+        # 루프가 닫히기 전에 같은 루프에서 커넥션 풀 정리
+        if "app.database.session" in sys.modules:
+            from app.database.session import close_db
+            await close_db()
 
 if __name__ == "__main__":
-    main()
+    # 프로젝트 루트 디렉토리로 이동 및 Python 경로 추가
+    from _bootstrap import bootstrap
+    bootstrap()
+    
+    asyncio.run(main())
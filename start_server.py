@@ -4,17 +4,14 @@
 가상환경 및 의존성 문제 해결을 위한 스크립트
 """
 
+import importlib.util
 import sys
-import os
 import subprocess
-from pathlib import Path
 
-# 프로젝트 루트 디렉토리 설정
-PROJECT_ROOT = Path(__file__).parent
-os.chdir(PROJECT_ROOT)
+from _bootstrap import bootstrap
 
-# Python 경로에 프로젝트 루트 추가
-sys.path.insert(0, str(PROJECT_ROOT))
+# 프로젝트 루트 디렉토리로 이동 및 Python 경로 추가
+PROJECT_ROOT = bootstrap()
 
 def check_virtual_environment():
     """가상환경 활성화 확인"""
@@ -40,7 +37,8 @@ def install_dependencies():
     """의존성 패키지 설치"""
     try:
         print("📦 의존성 패키지 설치 중...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
+        # 빌드된 wheel을 우선 사용 (소스 빌드 없이 pip 캐시의 wheel 재사용)
+        subprocess.run([sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"], check=True)
         print("✅ 의존성 패키지 설치 완료")
         return True
     except subprocess.CalledProcessError as e:
@@ -55,33 +53,24 @@ def check_packages():
         "pydantic",
         "uvicorn",
         "alembic",
-        "python_jose",
+        "jose",  # python-jose
         "passlib"
     ]
     
     missing_packages = []
     
+    # 설치 여부만 확인 (패키지 초기화 코드는 실행하지 않음)
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package}")
             missing_packages.append(package)
     
     return len(missing_packages) == 0
 
-def create_env_file():
-    """환경 변수 파일 확인 및 생성"""
-    env_file = PROJECT_ROOT / ".env"
-    
-    if env_file.exists():
-        print("✅ .env 파일이 존재합니다.")
-        return True
-    
-    print("⚠️ .env 파일이 없습니다. 기본 .env 파일을 생성합니다...")
-    
-    env_content = """# 실시간 투표 플랫폼 백엔드 환경 변수
+# 기본 .env 파일 내용 (모듈 로드 시 한 번만 UTF-8로 인코딩, 플랫폼 기본 인코딩과 무관)
+_ENV_TEMPLATE = """# 실시간 투표 플랫폼 백엔드 환경 변수
 
 # 애플리케이션 설정
 APP_NAME="실시간 투표 플랫폼"
@@ -96,7 +85,7 @@ SOCKET_PORT=8001
 
 # 데이터베이스 설정
 DATABASE_URL="sqlite:///./voting_app.db"
-DATABASE_ECHO=true
+DATABASE_ECHO=false
 
 # JWT 토큰 설정
 JWT_SECRET_KEY="your-jwt-secret-key-here"
@@ -108,10 +97,20 @@ LOG_LEVEL="INFO"
 
 # 개발 환경 설정
 RELOAD=true
-"""
+""".encode("utf-8")
+
+def create_env_file():
+    """환경 변수 파일 확인 및 생성"""
+    env_file = PROJECT_ROOT / ".env"
+    
+    if env_file.exists():
+        print("✅ .env 파일이 존재합니다.")
+        return True
+    
+    print("⚠️ .env 파일이 없습니다. 기본 .env 파일을 생성합니다...")
     
     try:
-        env_file.write_text(env_content)
+        env_file.write_bytes(_ENV_TEMPLATE)
         print("✅ .env 파일 생성 완료")
         return True
     except Exception as e:
@@ -133,6 +132,7 @@ def run_server():
             "main:app", 
             "--host", "0.0.0.0", 
             "--port", "8000", 
+            "--ws-per-message-deflate", "false",
             "--reload"
         ], check=True)
         
@@ -9,19 +9,50 @@ import subprocess
 import sys
 import os
 
-def find_free_port(start_port=8000, max_port=8010):
-    """사용 가능한 포트 찾기"""
-    for port in range(start_port, max_port + 1):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', port))
-                return port
-        except OSError:
-            continue
-    return None
+try:
+    import psutil
+except ImportError:  # psutil 미설치 시 lsof로 대체
+    psutil = None
+
+def find_free_port(preferred_port=None):
+    """사용 가능한 포트 찾기 (선호 포트가 사용 중이면 OS가 빈 포트를 배정)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # uvicorn과 같은 조건으로 확인 (TIME_WAIT 포트는 사용 가능으로 판단)
+        # Windows의 SO_REUSEADDR는 사용 중인 포트도 바인딩되므로 제외
+        if os.name != 'nt':
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        
+        if preferred_port:
+            try:
+                s.bind(('localhost', preferred_port))
+                return preferred_port
+            except OSError:
+                pass
+        
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
 
 def kill_process_on_port(port):
     """특정 포트를 사용하는 프로세스 종료"""
+    if psutil is not None:
+        try:
+            # 프로세스 내에서 소켓 목록 조회 (lsof/kill 하위 프로세스 없이, Windows 포함)
+            pids = {
+                conn.pid for conn in psutil.net_connections(kind="inet")
+                if conn.laddr and conn.laddr.port == port and conn.pid
+            }
+            for pid in pids:
+                try:
+                    psutil.Process(pid).kill()
+                    print(f"🔄 포트 {port}를 사용하던 프로세스 {pid} 종료됨")
+                    return True
+                except psutil.Error:
+                    pass
+            return False
+        except psutil.AccessDenied:
+            # macOS 등에서 권한이 없으면 lsof로 재시도
+            pass
+    
     try:
         # macOS/Linux
         result = subprocess.run(['lsof', '-ti', f':{port}'], 
@@ -54,6 +85,7 @@ def start_server(port=8000):
             'main:app', 
             '--host', '0.0.0.0', 
             '--port', str(port), 
+            '--ws-per-message-deflate', 'false',
             '--reload'
         ], env=env, check=True)
         
@@ -69,7 +101,7 @@ def main():
     preferred_port = 8000
     
     # 1. 기본 포트(8000) 확인
-    if find_free_port(preferred_port, preferred_port) == preferred_port:
+    if find_free_port(preferred_port) == preferred_port:
         print(f"✅ 포트 {preferred_port} 사용 가능")
         start_server(preferred_port)
         return
@@ -86,14 +118,9 @@ def main():
     
     # 3. 다른 포트 찾기
     print("🔍 사용 가능한 다른 포트를 찾는 중...")
-    free_port = find_free_port(8001, 8010)
-    
-    if free_port:
-        print(f"✅ 포트 {free_port}을 사용합니다.")
-        start_server(free_port)
-    else:
-        print("❌ 사용 가능한 포트를 찾을 수 없습니다.")
-        print("포트 8000-8010이 모두 사용 중입니다.")
+    free_port = find_free_port()
+    print(f"✅ 포트 {free_port}을 사용합니다.")
+    start_server(free_port)
 
 if __name__ == "__main__":
     main()
@@ -4,12 +4,14 @@
 import 오류 진단용
 """
 
+import importlib.util
 import sys
 import os
 
-# 현재 디렉토리를 Python 경로에 추가
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+from _bootstrap import bootstrap
+
+# 프로젝트 루트를 Python 경로에 추가 (작업 디렉토리는 진단을 위해 그대로 유지)
+bootstrap(chdir=False)
 
 print("🔍 Python 환경 및 패키지 확인")
 print(f"Python 버전: {sys.version}")
@@ -26,13 +28,13 @@ required_packages = [
     "alembic"
 ]
 
+# 설치 여부만 확인 (패키지 초기화 코드는 실행하지 않음)
 print("\n📦 패키지 import 테스트:")
 for package in required_packages:
-    try:
-        __import__(package)
+    if importlib.util.find_spec(package) is not None:
         print(f"✅ {package} - OK")
-    except ImportError as e:
-        print(f"❌ {package} - FAIL: {e}")
+    else:
+        print(f"❌ {package} - FAIL: No module named '{package}'")
 
 # app 모듈 import 테스트
 print("\n🏗️ 프로젝트 모듈 import 테스트:")
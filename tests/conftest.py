@@ -0,0 +1,55 @@
+# tests/conftest.py
+"""
+실시간 투표 플랫폼 테스트 공통 설정
+임시 SQLite DB로 앱을 띄우고 API 클라이언트와 인증 헤더를 제공
+"""
+
+import os
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+# 앱 설정은 import 시점에 환경 변수에서 읽으므로 앱 모듈보다 먼저 지정
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="voting-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TEST_DB_DIR) / 'test.db'}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key")
+os.environ.pop("REDIS_URL", None)
+
+from fastapi.testclient import TestClient
+
+from app.database.base import SessionLocal
+from main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """앱 시작/종료 이벤트(DB 초기화 포함)를 실행하는 API 클라이언트"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db():
+    """테스트용 DB 세션"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def registered_user(client):
+    """새 사용자 등록 후 사용자 정보와 인증 헤더 반환"""
+    nickname = f"user{uuid.uuid4().hex[:8]}"
+    response = client.post("/api/users/register", json={"nickname": nickname})
+    assert response.status_code == 200, response.text
+    
+    data = response.json()
+    return {
+        "user": data["user"],
+        "headers": {"Authorization": f"Bearer {data['access_token']}"}
+    }
@@ -0,0 +1,157 @@
+# tests/test_broker.py
+"""
+Redis 메시지 브로커 테스트
+실제 Redis 없이 Pub/Sub 동작을 흉내 내는 가짜 객체로 재연결과 대체 전송 확인
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+# redis는 REDIS_URL 사용 시에만 필요한 선택 의존성
+pytest.importorskip("redis")
+
+from app.websocket import broker as broker_module
+from app.websocket.broker import BROADCAST_CHANNEL, USER_CHANNEL_PREFIX, RedisBroker
+from app.websocket.manager import WebSocketManager
+
+
+class FakePubSub:
+    """
+    listen() 호출마다 준비된 시나리오를 하나씩 재생하는 가짜 Pub/Sub
+    (시나리오의 예외 항목은 연결 끊김으로 발생시키고, 시나리오가 끝나면 대기)
+    """
+    
+    def __init__(self, sessions):
+        self.sessions = list(sessions)
+        self.subscribe_calls = 0
+    
+    async def subscribe(self, *channels):
+        self.subscribe_calls += 1
+    
+    async def psubscribe(self, *patterns):
+        pass
+    
+    async def listen(self):
+        session = self.sessions.pop(0) if self.sessions else []
+        for item in session:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await asyncio.Event().wait()
+    
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """발행 요청을 기록하는 가짜 Redis 클라이언트"""
+    
+    def __init__(self):
+        self.published = []
+    
+    async def publish(self, channel, data):
+        self.published.append((channel, data))
+    
+    async def aclose(self):
+        pass
+
+
+def broadcast_message(payload: str) -> dict:
+    return {
+        "type": "message",
+        "channel": BROADCAST_CHANNEL.encode(),
+        "data": orjson.dumps({"payload": payload, "exclude_user_id": None})
+    }
+
+
+def make_broker(pubsub: FakePubSub) -> RedisBroker:
+    broker = RedisBroker("redis://localhost:6379/0")
+    broker.redis = FakeRedis()
+    broker.pubsub = pubsub
+    return broker
+
+
+async def wait_until(condition, timeout: float = 1.0):
+    """조건이 참이 될 때까지 이벤트 루프 양보"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "시간 초과"
+        await asyncio.sleep(0.001)
+
+
+@pytest.fixture(autouse=True)
+def fast_reconnect(monkeypatch):
+    monkeypatch.setattr(broker_module, "RECONNECT_INITIAL_DELAY", 0.001)
+    monkeypatch.setattr(broker_module, "RECONNECT_MAX_DELAY", 0.001)
+
+
+async def test_listener_resubscribes_after_connection_loss():
+    pubsub = FakePubSub([
+        [broadcast_message("before"), ConnectionError("connection reset")],
+        [
+            {"type": "subscribe", "channel": BROADCAST_CHANNEL.encode(), "data": 1},
+            {"type": "pmessage", "channel": f"{USER_CHANNEL_PREFIX}user-1".encode(), "data": b"direct"},
+            broadcast_message("after"),
+        ],
+    ])
+    broker = make_broker(pubsub)
+    broadcasts, personal = [], []
+    
+    async def on_broadcast(payload, exclude_user_id):
+        broadcasts.append(payload)
+    
+    async def on_personal(user_id, payload):
+        personal.append((user_id, payload))
+    
+    await broker.start(on_broadcast, on_personal)
+    try:
+        await wait_until(lambda: len(broadcasts) == 2)
+        
+        assert broadcasts == ["before", "after"]
+        assert personal == [("user-1", "direct")]
+        # 시작 시 1회 + 재연결 후 1회
+        assert pubsub.subscribe_calls == 2
+        assert not broker.listener_task.done()
+    finally:
+        await broker.close()
+
+
+async def test_listener_skips_malformed_messages():
+    pubsub = FakePubSub([[
+        {"type": "message", "channel": BROADCAST_CHANNEL.encode(), "data": b"not json"},
+        broadcast_message("ok"),
+    ]])
+    broker = make_broker(pubsub)
+    broadcasts = []
+    
+    async def on_broadcast(payload, exclude_user_id):
+        broadcasts.append(payload)
+    
+    async def on_personal(user_id, payload):
+        pass
+    
+    await broker.start(on_broadcast, on_personal)
+    try:
+        await wait_until(lambda: broadcasts == ["ok"])
+    finally:
+        await broker.close()
+
+
+async def test_manager_falls_back_to_local_delivery_when_listener_dies():
+    manager = WebSocketManager()
+    broker = make_broker(FakePubSub([]))
+    
+    async def crashed_listener():
+        raise RuntimeError("listener crashed")
+    
+    broker.listener_task = asyncio.create_task(crashed_listener())
+    broker.listener_task.add_done_callback(manager._on_broker_stopped)
+    manager.broker = broker
+    
+    await wait_until(lambda: manager.broker is None)
+    
+    # 브로커가 없으면 Redis에 발행하지 않고 이 프로세스 연결로 전송
+    await manager.broadcast_text("payload")
+    assert broker.redis.published == []
@@ -0,0 +1,180 @@
+# tests/test_list_routes.py
+"""
+목록 조회 API 스모크 테스트
+lazy="raise_on_sql" 관계를 직렬화 중에 지연 로드하는 경로가 없는지 실제 요청으로 확인
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.message import ChatMessage
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    """투표, 투표 참여, 메모, 채팅 메시지가 있는 사용자 생성"""
+    response = client.post("/api/users/register", json={"nickname": "smokeuser"})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    user_id = data["user"]["id"]
+    headers = {"Authorization": f"Bearer {data['access_token']}"}
+    
+    response = client.post(
+        "/api/polls/",
+        headers=headers,
+        json={"title": "스모크 테스트 투표", "description": "설명", "options": ["가", "나"]}
+    )
+    assert response.status_code == 200, response.text
+    poll = response.json()
+    
+    response = client.post(
+        f"/api/polls/{poll['id']}/vote",
+        headers=headers,
+        json={"option_id": poll["options"][0]["id"]}
+    )
+    assert response.status_code == 200, response.text
+    
+    for content in ("투표 메모", "일반 메모"):
+        response = client.post(
+            "/api/memos/",
+            headers=headers,
+            json={
+                "content": content,
+                "user_id": user_id,
+                "poll_id": poll["id"] if content == "투표 메모" else None
+            }
+        )
+        assert response.status_code == 200, response.text
+    
+    response = client.post(
+        "/api/chat/messages",
+        headers=headers,
+        json={"message": "스모크 테스트 메시지", "user_id": user_id}
+    )
+    assert response.status_code == 200, response.text
+    
+    return {"user_id": user_id, "poll_id": poll["id"], "headers": headers}
+
+
+@pytest.mark.parametrize("path", [
+    "/api/polls/",
+    "/api/polls/?active_only=true",
+    "/api/polls/user/{user_id}",
+    "/api/polls/{poll_id}",
+    "/api/polls/{poll_id}/results",
+    "/api/polls/{poll_id}/stats",
+    "/api/chat/messages",
+    "/api/chat/messages?message_type=message",
+    "/api/chat/messages/recent",
+    "/api/chat/stats",
+    "/api/memos/",
+    "/api/memos/?poll_id={poll_id}",
+    "/api/memos/?sort_by=word_count&page=1",
+    "/api/memos/poll/{poll_id}",
+    "/api/memos/recent/list",
+    "/api/memos/stats/overview",
+    "/api/memos/export/ndjson",
+    "/api/users/list",
+    "/api/users/online",
+    "/api/users/me",
+    "/api/users/me/votes",
+])
+def test_get_route_succeeds(client, seeded, path):
+    response = client.get(path.format(**seeded), headers=seeded["headers"])
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("path, items_key", [
+    ("/api/polls/", "polls"),
+    ("/api/polls/user/{user_id}", "polls"),
+    ("/api/chat/messages", "messages"),
+    ("/api/memos/", "memos"),
+    ("/api/users/me/votes", "votes"),
+])
+def test_cursor_pages_cover_every_item(client, seeded, path, items_key):
+    url = path.format(**seeded)
+    first = client.get(url, params={"per_page": 100}, headers=seeded["headers"]).json()
+    
+    ids, cursor = [], None
+    while True:
+        params = {"per_page": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=seeded["headers"])
+        assert response.status_code == 200, response.text
+        page = response.json()
+        ids.extend(item["id"] for item in page[items_key])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    
+    assert ids == [item["id"] for item in first[items_key]]
+
+
+def test_memo_search_pages_by_cursor(client, seeded):
+    body = {"query": "메모", "per_page": 1}
+    first = client.post("/api/memos/search", json=body, headers=seeded["headers"])
+    assert first.status_code == 200, first.text
+    first = first.json()
+    assert first["total"] == 2 and first["has_more"]
+    
+    second = client.post(
+        "/api/memos/search",
+        json={**body, "cursor": first["next_cursor"]},
+        headers=seeded["headers"]
+    ).json()
+    assert second["total"] is None
+    assert len(second["results"]) == 1
+    assert second["results"][0]["id"] != first["results"][0]["id"]
+
+
+def test_chat_history_pages_by_cursor(client, seeded, db):
+    # 같은 시각의 메시지도 (created_at, id) 키셋으로 빠짐없이 한 번씩 조회
+    created_at = datetime(2024, 1, 1)
+    db.add_all(
+        ChatMessage(message=f"동시 메시지 {index}", user_id=seeded["user_id"], created_at=created_at)
+        for index in range(3)
+    )
+    db.commit()
+    
+    first = client.post("/api/chat/history", json={"limit": 100, "include_total": True}).json()
+    assert first["total"] == len(first["messages"])
+    
+    ids, cursor = [], None
+    while True:
+        response = client.post("/api/chat/history", json={"limit": 1, "cursor": cursor})
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert page["total"] is None
+        ids.extend(message["id"] for message in page["messages"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    
+    assert ids == [message["id"] for message in first["messages"]]
+    assert len(set(ids)) == len(ids)
+
+
+def test_bulk_results_match_single_poll_results(client, seeded):
+    poll_id = seeded["poll_id"]
+    response = client.get(
+        "/api/polls/results/bulk",
+        params={"poll_ids": [poll_id, poll_id, "missing-poll"]}
+    )
+    assert response.status_code == 200, response.text
+    bulk = response.json()["results"]
+    
+    single = client.get(f"/api/polls/{poll_id}/results").json()["results"]
+    assert list(bulk) == [poll_id]
+    assert sorted(bulk[poll_id], key=lambda option: option["id"]) == \
+        sorted(single, key=lambda option: option["id"])
+    assert [option["id"] for option in bulk[poll_id]] == sorted(option["id"] for option in single)
+
+
+def test_invalid_cursor_is_rejected(client, seeded):
+    response = client.get("/api/polls/", params={"cursor": "invalid"})
+    assert response.status_code == 400
+    
+    response = client.post("/api/chat/history", json={"cursor": "invalid"})
+    assert response.status_code == 400
@@ -0,0 +1,38 @@
+# tests/test_persist_worker.py
+"""
+입장/퇴장 메시지 일괄 저장 워커 테스트
+저장 도중 종료(취소)되어도 같은 메시지를 두 번 저장하지 않는지 확인
+"""
+
+import asyncio
+
+from app.models.message import ChatMessage
+from app.websocket import manager as manager_module
+from app.websocket.manager import WebSocketManager
+
+
+async def test_cancel_during_flush_saves_each_message_once(monkeypatch):
+    monkeypatch.setattr(manager_module, "WS_PERSIST_FLUSH_INTERVAL", 0)
+    manager = WebSocketManager()
+    flushed = []
+    flush_started = asyncio.Event()
+    release_commit = asyncio.Event()
+    
+    async def slow_flush(batch):
+        # 커밋은 DB에 반영됐지만 세션 정리를 기다리는 중에 취소되는 상황 재현
+        flushed.extend(batch)
+        flush_started.set()
+        await release_commit.wait()
+    
+    monkeypatch.setattr(manager, "_flush_chat_messages", slow_flush)
+    
+    manager._persist_later(ChatMessage(message="입장"))
+    await flush_started.wait()
+    
+    # 저장 중에 들어온 메시지는 종료 시 따로 저장
+    manager.pending_messages.put_nowait(ChatMessage(message="퇴장"))
+    manager.persist_task.cancel()
+    release_commit.set()
+    await asyncio.gather(manager.persist_task, return_exceptions=True)
+    
+    assert [message.message for message in flushed] == ["입장", "퇴장"]
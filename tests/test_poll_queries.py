@@ -0,0 +1,74 @@
+# tests/test_poll_queries.py
+"""
+투표 목록 조회 쿼리 수 테스트
+POLL_LIST_LOAD_OPTIONS로 목록 크기와 관계없이 쿼리 수가 일정한지 확인
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+from app.database.base import SessionLocal, engine
+from app.services.poll_service import PollService
+
+PAGE_SIZE = 20
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    """블록 안에서 실행된 SQL 문 목록 수집"""
+    statements: List[str] = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def create_polls(user_id: str, count: int):
+    """옵션이 있는 투표 여러 개 생성"""
+    db = SessionLocal()
+    try:
+        service = PollService(db)
+        for index in range(count):
+            service.create_poll(f"쿼리 수 테스트 {index}", "", ["가", "나", "다"], user_id)
+    finally:
+        db.close()
+
+
+def test_poll_list_page_uses_at_most_two_queries(registered_user):
+    create_polls(registered_user["user"]["id"], PAGE_SIZE)
+    
+    db = SessionLocal()
+    try:
+        with count_queries() as statements:
+            result = PollService(db).get_polls_list(per_page=PAGE_SIZE, include_total=True)
+            polls = [poll.to_dict() for poll in result["polls"]]
+    finally:
+        db.close()
+    
+    assert len(polls) == PAGE_SIZE
+    assert all(len(poll["options"]) == 3 for poll in polls)
+    # 목록(개수 윈도 함수 포함) 1회 + 옵션 selectinload 1회
+    assert len(statements) <= 2, statements
+
+
+def test_user_poll_page_uses_at_most_two_queries(registered_user):
+    user_id = registered_user["user"]["id"]
+    create_polls(user_id, PAGE_SIZE)
+    
+    db = SessionLocal()
+    try:
+        with count_queries() as statements:
+            result = PollService(db).get_user_polls(user_id, per_page=PAGE_SIZE)
+            polls = [poll.to_dict() for poll in result["polls"]]
+    finally:
+        db.close()
+    
+    assert len(polls) == PAGE_SIZE
+    assert len(statements) <= 2, statements
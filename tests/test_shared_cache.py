@@ -0,0 +1,54 @@
+# tests/test_shared_cache.py
+"""
+워커 간 공유 캐시 테스트
+캐시 미스 후 채우기가 그 사이 갱신된 최신 값을 덮어쓰지 않는지 확인
+"""
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SharedCache, TTLCache
+
+RESULTS_KEY = "poll_results:test"
+
+
+class FakeRedis:
+    """GET / SET(PX, NX)만 흉내 내는 가짜 동기 Redis 클라이언트"""
+    
+    def __init__(self):
+        self.store = {}
+    
+    def get(self, key):
+        return self.store.get(key)
+    
+    def set(self, key, value, px=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture(params=["local", "redis"])
+def shared_cache(request, monkeypatch):
+    """프로세스 내 캐시 / Redis 경로 각각의 공유 캐시"""
+    client = FakeRedis() if request.param == "redis" else None
+    monkeypatch.setattr(cache_module, "get_redis", lambda: client)
+    return SharedCache(TTLCache(), local_max_ttl=60)
+
+
+def test_stale_fill_does_not_overwrite_refresh(shared_cache):
+    stale = [{"id": "option", "votes": 0}]
+    fresh = [{"id": "option", "votes": 1}]
+    
+    def build_stale_results():
+        # 투표 커밋 전 스냅숏으로 결과를 만드는 동안 투표 경로가 최신 결과를 저장
+        shared_cache.set(RESULTS_KEY, fresh, 60)
+        return stale
+    
+    assert shared_cache.get_or_set(RESULTS_KEY, build_stale_results, 60) == stale
+    assert shared_cache.get(RESULTS_KEY) == fresh
+
+
+def test_miss_fills_cache(shared_cache):
+    assert shared_cache.get_or_set(RESULTS_KEY, lambda: [1], 60) == [1]
+    assert shared_cache.get_or_set(RESULTS_KEY, lambda: [2], 60) == [1]